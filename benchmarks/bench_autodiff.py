@@ -0,0 +1,107 @@
+# ============================================================
+#  기호 미분(sympy diff + lambdify) vs 전진 모드 자동 미분 비교
+#  - 변환(컴파일) 시간, 80×80 격자 기울기 평가 시간, 스칼라 한 스텝 시간
+#  - 두 방식의 기울기 차이(최대 상대 오차)로 정확성 확인
+#
+#  사용 예)  python benchmarks/bench_autodiff.py
+#           python benchmarks/bench_autodiff.py --repeat 50 --json bench_autodiff.json
+# ============================================================
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from sympy import count_ops, diff, sympify  # noqa: E402
+
+from gdcore.autodiff import X_SYM, Y_SYM  # noqa: E402
+from gdcore.functions import FUNCTION_OPS_THRESHOLD, compile_function  # noqa: E402
+
+# 프리셋 + 도함수가 커지는 사용자 입력 예시
+EXPRESSIONS = {
+    "볼록": "x**2 + y**2",
+    "Himmelblau": "(x**2 + y - 11)**2 + (x + y**2 - 7)**2",
+    "Rastrigin 유사": "20 + (x**2 - 10*cos(2*pi*x)) + (y**2 - 10*cos(2*pi*y))",
+    "지수·거듭제곱 곱": "exp(sin(x*y))*(x**2 + y**2)**3/(1 + exp(-x*cos(y)))",
+    "중첩 거듭제곱": "sin(x)*cos(y) + exp(-(x**2 + y**2)/10)*(x**3 - y)**4",
+    "깊은 합성": "exp(-((x - 1)**2 + (y + 1)**2)/4)*sin(3*x*y)**2*log(1 + x**2*y**2)*(1 + tanh(x - y))",
+    # 합성한 항을 여러 개 곱한 긴 입력 (함수식 연산 수가 auto 기준을 넘음)
+    "긴 곱": "exp(sin(x*y))*(x**2 + y**2)**3/(1 + exp(-x*cos(y)))"
+             "*(sin(x + 1)*cos(y) + exp(-((x + 1)**2 + y**2)/10)*((x + 1)**3 - y)**4)"
+             "*exp(-((x + 1)**2 + (y + 1)**2)/4)*sin(3*(x + 2)*y)**2*log(1 + (x + 2)**2*y**2)*(1 + tanh(x + 2 - y))",
+}
+
+
+def _best_time(fn, repeat):
+    """repeat 번 실행 중 가장 빠른 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_expression(expr, repeat=20, resolution=80):
+    """한 함수식에 대해 두 방식 비교"""
+    xs = np.linspace(-3, 3, resolution)
+    Xs, Ys = np.meshgrid(xs, xs)
+    f_sym = sympify(expr)
+    deriv_ops = count_ops(diff(f_sym, X_SYM)) + count_ops(diff(f_sym, Y_SYM))
+
+    row = {"expr": expr, "f_ops": int(count_ops(f_sym)), "grad_ops": int(deriv_ops)}
+    grads = {}
+    for mode in ("symbolic", "autodiff"):
+        t0 = time.perf_counter()
+        _, dx, dy = compile_function(expr, gradient_mode=mode)
+        row[f"{mode}_compile_ms"] = (time.perf_counter() - t0) * 1000.0
+
+        with np.errstate(all="ignore"):
+            row[f"{mode}_grid_ms"] = _best_time(lambda: (dx(Xs, Ys), dy(Xs, Ys)), repeat) * 1000.0
+            # 경사 하강 한 스텝: 같은 점에서 dx, dy 를 연달아 호출 (매번 다른 점)
+            pts = iter(np.random.default_rng(0).uniform(-3, 3, size=(repeat * 200, 2)).tolist())
+            row[f"{mode}_step_us"] = _best_time(
+                lambda: [(dx(*p), dy(*p)) for p in (next(pts) for _ in range(100))], repeat) * 1e6 / 100
+            grads[mode] = (np.broadcast_to(dx(Xs, Ys), Xs.shape), np.broadcast_to(dy(Xs, Ys), Xs.shape))
+
+    with np.errstate(all="ignore"):
+        rel = [np.abs(a - b) / np.maximum(1.0, np.abs(a)) for a, b in zip(grads["symbolic"], grads["autodiff"])]
+    row["max_rel_error"] = float(max(np.nanmax(r) for r in rel))
+    row["auto_choice"] = "autodiff" if row["f_ops"] > FUNCTION_OPS_THRESHOLD else "symbolic"
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기호 미분 vs 자동 미분 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--resolution", type=int, default=80, help="격자 해상도")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'함수':<14} {'f연산수':>7} {'∇연산수':>7} {'선택':>9} | {'컴파일 ms (기호/자동)':>22} | "
+          f"{'격자 ms (기호/자동)':>20} | {'스텝 µs (기호/자동)':>20} | 최대 상대오차")
+    for name, expr in EXPRESSIONS.items():
+        r = bench_expression(expr, repeat=args.repeat, resolution=args.resolution)
+        r["name"] = name
+        results.append(r)
+        print(f"{name:<14} {r['f_ops']:>7} {r['grad_ops']:>7} {r['auto_choice']:>9} | "
+              f"{r['symbolic_compile_ms']:>10.1f} / {r['autodiff_compile_ms']:<9.1f} | "
+              f"{r['symbolic_grid_ms']:>9.3f} / {r['autodiff_grid_ms']:<8.3f} | "
+              f"{r['symbolic_step_us']:>9.1f} / {r['autodiff_step_us']:<8.1f} | {r['max_rel_error']:.2e}",
+              flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
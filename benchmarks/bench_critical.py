@@ -0,0 +1,78 @@
+# ============================================================
+#  임계점 전체 탐색 비용 (gdcore/critical.py) vs SciPy Nelder-Mead 최소화
+#  - 프리셋별: 격자 시작점 뉴턴법(배열 연산) 시간, 찾은 임계점 종류별 개수
+#  - 비교: 04_C가 쓰는 Nelder-Mead 한 번 (원점 시작) / 프리셋 시작점 전체
+#
+#  사용 예)  python benchmarks/bench_critical.py
+#           python benchmarks/bench_critical.py --seeds 16 24 48 --json bench_critical.json
+# ============================================================
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from gdcore.critical import find_critical_points, summary_text  # noqa: E402
+from gdcore.functions import compile_function, compile_hessian  # noqa: E402
+from gdcore.optimize import multi_start_minimum  # noqa: E402
+from gdcore.presets import PRESET_SPECS  # noqa: E402
+
+
+def best_time(fn, repeat):
+    """repeat번 실행 중 가장 짧은 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_preset(spec, seeds, repeat):
+    """한 프리셋의 시작점 격자 크기별 측정"""
+    f, dx, dy = compile_function(spec["formula"])
+    hessian = compile_hessian(spec["formula"])
+    starts = [(0.0, 0.0), spec["start"], *spec.get("scipy_seeds", [])]
+    row = {
+        "preset": spec["name"],
+        "nelder_mead_ms": best_time(lambda: multi_start_minimum(f, [(0.0, 0.0)]), repeat) * 1000.0,
+        "nelder_mead_all_starts_ms": best_time(lambda: multi_start_minimum(f, starts), repeat) * 1000.0,
+        "newton": [],
+    }
+    for n in seeds:
+        points = find_critical_points(f, dx, dy, hessian, spec["x_range"], spec["y_range"], seeds=n)
+        ms = best_time(lambda: find_critical_points(f, dx, dy, hessian, spec["x_range"], spec["y_range"], seeds=n),
+                       repeat) * 1000.0
+        row["newton"].append({"seeds": n, "ms": ms, "found": summary_text(points)})
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="임계점 전체 탐색 벤치마크")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[16, 24, 48], help="축당 시작점 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'프리셋':<11} | {'NM 1회 ms':>9} | {'NM 전체 ms':>10} | {'시작점':>7} | {'뉴턴 ms':>8} | 찾은 임계점")
+    for spec in PRESET_SPECS:
+        r = bench_preset(spec, args.seeds, args.repeat)
+        results.append(r)
+        for k, nr in enumerate(r["newton"]):
+            head = (f"{r['preset']:<11} | {r['nelder_mead_ms']:>9.2f} | {r['nelder_mead_all_starts_ms']:>10.2f}"
+                    if k == 0 else f"{'':<11} | {'':>9} | {'':>10}")
+            print(f"{head} | {nr['seeds']:>3}×{nr['seeds']:<3} | {nr['ms']:>8.2f} | {nr['found']}", flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ============================================================
+#  데이터셋 손실 표면(80×80) 계산 방식 비교 (gdcore/loss_surface.py)
+#  - 격자점마다 파이썬 반복 (일부 격자점만 측정해 전체로 환산)
+#  - 모든 행 조각 평가 (exact=True, 메모리 상한 안에서 행렬곱)
+#  - 요약 평가 (선형: 충분 통계량, 로지스틱: 구간 요약) + 요약 만드는 시간
+#  - 요약 평가의 최대 상대 오차 (exact 대비, 12×12 격자)
+#
+#  사용 예)  python benchmarks/bench_loss_surface.py
+#           python benchmarks/bench_loss_surface.py --rows 10000 1000000 --json bench_loss_surface.json
+# ============================================================
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from gdcore.dataset import loss_and_grad, make_synthetic  # noqa: E402
+from gdcore.loss_surface import LossSurface  # noqa: E402
+
+RESOLUTION = 80
+NAIVE_POINTS = 20     # 파이썬 반복 방식은 이 수만큼만 측정 후 환산
+
+
+def bench_case(task, n_rows, root, exact_max_rows=100_000):
+    """한 (모델, 행 수) 조합 측정"""
+    dataset = make_synthetic(task, n_rows, root=root)
+    row = {"task": task, "rows": n_rows}
+
+    x, y = next(dataset.iter_standardized(task, rows=n_rows))
+    t0 = time.perf_counter()
+    for w, b in np.random.default_rng(0).uniform(-4, 4, size=(NAIVE_POINTS, 2)):
+        loss_and_grad(task, w, b, x, y)
+    row["naive_s"] = (time.perf_counter() - t0) * RESOLUTION ** 2 / NAIVE_POINTS
+
+    exact = LossSurface(dataset, task, exact=True)
+    row["exact_s"] = None
+    if n_rows <= exact_max_rows:
+        t0 = time.perf_counter()
+        exact.grid((-4, 4), (-4, 4), RESOLUTION)
+        row["exact_s"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    summary = LossSurface(dataset, task)
+    row["summary_build_s"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    summary.grid((-4, 4), (-4, 4), RESOLUTION)
+    row["summary_grid_ms"] = (time.perf_counter() - t0) * 1000.0
+
+    _, _, Ze = exact.grid((-4, 4), (-4, 4), 12)
+    _, _, Zs = summary.grid((-4, 4), (-4, 4), 12)
+    row["max_rel_error"] = float(np.max(np.abs(Zs - Ze) / np.abs(Ze)))
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="데이터셋 손실 표면 계산 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--exact-max-rows", type=int, default=100_000,
+                        help="이 행 수보다 크면 80×80 전체 행 조각 평가 측정 생략 (수 분 걸림)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'모델':<9} {'행 수':>10} | {'반복(환산) s':>12} | {'조각 s':>8} | {'요약 생성 s':>10} | "
+          f"{'요약 격자 ms':>11} | 최대 상대오차")
+    with tempfile.TemporaryDirectory() as root:
+        for task in ("linear", "logistic"):
+            for n_rows in args.rows:
+                r = bench_case(task, n_rows, os.path.join(root, "datasets"), args.exact_max_rows)
+                exact_s = "-" if r["exact_s"] is None else f"{r['exact_s']:.2f}"
+                results.append(r)
+                print(f"{task:<9} {n_rows:>10,} | {r['naive_s']:>12.2f} | {exact_s:>8} | "
+                      f"{r['summary_build_s']:>10.3f} | {r['summary_grid_ms']:>11.2f} | {r['max_rel_error']:.2e}",
+                      flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# ============================================================
+#  n차원 경사 하강 엔진(gdcore/ndim.py) 확장성 측정
+#  - 차원 n, 시작점 수 B 에 따른 스텝당 시간 (묶음 나눠 처리(기본) / 한 번에 처리 / 시작점별 반복)
+#  - PCA 평면·평면 격자 평가 시간, 경로 기록 메모리
+#  - log-log 기울기로 차원에 대한 실제 증가율 확인 (1에 가까우면 O(n))
+#
+#  사용 예)  python benchmarks/bench_ndim.py
+#           python benchmarks/bench_ndim.py --dims 10 100 1000 10000 --json bench_ndim.json
+# ============================================================
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from gdcore import ndim  # noqa: E402
+from gdcore.ndim import (  # noqa: E402
+    IllConditionedQuadratic, Rastrigin, Rosenbrock,
+    descend, pca_plane, plane_grid, random_starts,
+)
+
+PROBLEMS = {
+    "이차(κ=1000)": lambda n: IllConditionedQuadratic(n, 1000.0),
+    "Rosenbrock": Rosenbrock,
+    "Rastrigin": Rastrigin,
+}
+
+
+def _best_time(fn, repeat):
+    """repeat 번 실행 중 가장 빠른 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_case(name, n, batch, steps=100, repeat=3):
+    """한 (문제, 차원, 시작점 수) 조합 측정"""
+    problem = PROBLEMS[name](n)
+    starts = random_starts(n, batch, radius=1.0, center=problem.minimum)
+    lr = 0.5 / problem.lipschitz if problem.lipschitz else 1e-4
+
+    result = descend(problem, starts, lr, steps)
+    row = {"problem": name, "n": n, "batch": batch, "steps": steps}
+    row["batched_step_us"] = _best_time(lambda: descend(problem, starts, lr, steps), repeat) * 1e6 / steps
+    # 묶음으로 나누지 않고 B개를 한 번에 (BATCH_CHUNK_ELEMENTS 효과 비교)
+    chunk_elements, ndim.BATCH_CHUNK_ELEMENTS = ndim.BATCH_CHUNK_ELEMENTS, n * batch
+    try:
+        row["unchunked_step_us"] = _best_time(lambda: descend(problem, starts, lr, steps), repeat) * 1e6 / steps
+    finally:
+        ndim.BATCH_CHUNK_ELEMENTS = chunk_elements
+    # 같은 계산을 시작점마다 따로 실행 (벡터화 효과 비교)
+    row["looped_step_us"] = _best_time(
+        lambda: [descend(problem, s[None, :], lr, steps) for s in starts], repeat) * 1e6 / steps
+    row["path_mb"] = result["path"].nbytes / 1e6
+    row["pca_ms"] = _best_time(lambda: pca_plane(result["path"]), repeat) * 1000.0
+    center, u, v, _ = pca_plane(result["path"])
+    row["plane_ms"] = _best_time(lambda: plane_grid(problem, center, u, v, (-1, 1), (-1, 1)), repeat) * 1000.0
+    return row
+
+
+def scaling_exponent(rows, key):
+    """차원에 대한 log-log 기울기 (시간 ∝ n^k 의 k)"""
+    ns = np.array([r["n"] for r in rows], dtype=float)
+    ts = np.array([r[key] for r in rows], dtype=float)
+    if len(ns) < 2:
+        return float("nan")
+    return float(np.polyfit(np.log(ns), np.log(ts), 1)[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="n차원 경사 하강 엔진 확장성 벤치마크")
+    parser.add_argument("--dims", type=int, nargs="+", default=[10, 100, 1000, 5000, 20000])
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 8, 64], help="시작점 수")
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'문제':<12} {'n':>6} {'B':>4} | {'스텝 µs (묶음/한 번에/반복)':>32} | {'경로 MB':>8} | "
+          f"{'PCA ms':>7} | {'평면 ms':>7}")
+    for name in PROBLEMS:
+        for batch in args.batch:
+            rows = []
+            for n in args.dims:
+                r = bench_case(name, n, batch, steps=args.steps, repeat=args.repeat)
+                rows.append(r)
+                print(f"{name:<12} {n:>6} {batch:>4} | {r['batched_step_us']:>9.1f} / {r['unchunked_step_us']:>9.1f} / "
+                      f"{r['looped_step_us']:<9.1f} | "
+                      f"{r['path_mb']:>8.2f} | {r['pca_ms']:>7.1f} | {r['plane_ms']:>7.1f}", flush=True)
+            k = scaling_exponent(rows, "batched_step_us")
+            print(f"{'':<12} {'':>6} {batch:>4} | 차원 증가율 n^{k:.2f}")
+            for r in rows:
+                r["scaling_exponent"] = k
+            results.extend(rows)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# ============================================================
+#  동시 접속 부하 테스트 하네스
+#  - Streamlit AppTest(앱 내부 테스트 API)로 N개의 가상 학생 세션을 "한 프로세스의 스레드"로 동시에 실행
+#    → 실제 서버 하나처럼 GIL, st.cache_resource, 결과·컴파일 캐시를 모든 세션이 함께 씀
+#      (AppTest가 실행마다 바꾸는 프로세스 전역 런타임·설정은 공용 가짜 런타임 하나로 고정)
+#  - 페이지별 상호작용 스크립트: 프리셋 선택 → 10 스텝 → 전체 실행 → 분석 보기
+#  - N이 커질 때 재실행 지연 시간(백분위), 프로세스 CPU 사용량, 메모리를 기록
+#
+#  사용 예)  python benchmarks/loadtest.py --sessions 1 2 4 8 --pages 04_C
+#           python benchmarks/loadtest.py --json bench_output.json
+# ============================================================
+
+import argparse
+import ast
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# 페이지 약칭 → 스크립트 파일
+PAGES = {
+    "02_A": REPO_ROOT / "pages" / "02_A사버전.py",
+    "03_B": REPO_ROOT / "pages" / "03_B사버전.py",
+    "04_C": REPO_ROOT / "pages" / "04_C사버전.py",
+}
+
+# 페이지별 프리셋 이름 (세션마다 돌아가며 선택해 실제 수업처럼 섞이게 함)
+PRESET_NAMES = {
+    "02_A": ["볼록 함수 (최적화 쉬움, 예: x²+y²)", "안장점 함수 (예: 0.3x²-0.3y²)",
+             "Himmelblau 함수 (다중 최적점)", "복잡한 함수 (Rastrigin 유사)"],
+    "03_B": ["볼록 (x² + y²)", "안장 (0.3x² − 0.3y²)", "Himmelblau", "Rastrigin 유사"],
+    "04_C": ["볼록 함수 (최적화 쉬움, 예: x²+y²)", "안장점 함수 (예: 0.3x²-0.3y²)",
+             "Himmelblau 함수 (다중 최적점)", "복잡한 함수 (Rastrigin 유사)"],
+}
+
+STEP_CLICKS = 10
+
+
+# ----- 1. 페이지별 상호작용 스크립트 -----
+def _button(at, label):
+    """라벨로 버튼 위젯 찾기"""
+    return next(b for b in at.button if b.label == label)
+
+
+def _slider(at, label):
+    """라벨로 슬라이더 위젯 찾기"""
+    return next(s for s in at.slider if s.label == label)
+
+
+def script_02_a(at, preset, timed):
+    """02_A: 프리셋 선택 → 한 스텝 이동 ×10 → 전체 경로 계산 (분석 보기 버튼 없음)"""
+    timed("load", at.run)
+    timed("preset", at.radio(key="func_radio_key_widget").set_value(preset).run)
+    for _ in range(STEP_CLICKS):
+        timed("step", _button(at, "🚶 한 스텝 이동").click().run)
+    timed("run_all", _button(at, "🚀 전체 경로 계산").click().run)
+
+
+def script_03_b(at, preset, timed):
+    """03_B: 탐구 단계 버튼 클릭 (함수 선택 → 다음 단계 → 시각화) → 자유 실험에서 반복 횟수 1..10
+    (이 페이지에는 한 스텝 버튼이 없음 – SCRIPT_NOTES 참고)"""
+    timed("load", at.run)
+    timed("preset", at.selectbox[0].set_value(preset).run)
+    timed("next", _button(at, "다음 단계 ➡️").click().run)
+    timed("run_all", _button(at, "시각화 ▶️").click().run)
+    timed("mode", at.radio[0].set_value("② 자유 실험(전체 UI)").run)
+    for n in range(1, STEP_CLICKS + 1):
+        timed("step_slider", _slider(at, "반복 횟수").set_value(n).run)
+
+
+def script_04_c(at, preset, timed):
+    """04_C: 프리셋 선택 → 한 스텝 진행 ×10 → 전체 실행 → 분석 보기"""
+    timed("load", at.run)
+    timed("preset", at.radio(key="func_radio_key_widget").set_value(preset).run)
+    for _ in range(STEP_CLICKS):
+        timed("step", _button(at, "🚶 한 스텝 진행").click().run)
+    timed("run_all", at.button(key="playbtn_widget_key").click().run)
+    timed("analytics", at.button(key="analytics_btn_key").click().run)
+
+
+SCRIPTS = {"02_A": script_02_a, "03_B": script_03_b, "04_C": script_04_c}
+
+# 결과를 읽을 때 알아야 할 시나리오의 한계 (보고서에 함께 출력)
+SCRIPT_NOTES = {
+    "03_B": "한 스텝 버튼이 없어 'step_slider'는 자유 실험의 '반복 횟수' 슬라이더를 1..10으로 바꾼 재실행임 "
+            "(02_A·04_C의 'step' 버튼 클릭과 같은 동작이 아니므로 직접 비교하지 말 것)",
+}
+
+
+# ----- 2. 세션 스레드 (스레드 1개 = 학생 세션 1개, 모두 한 프로세스) -----
+_runtime_lock = threading.Lock()
+_runtime_installed = False
+
+
+def install_shared_runtime():
+    """AppTest를 여러 스레드에서 동시에 돌릴 수 있게 프로세스 전역 상태를 한 번만 설정
+    - AppTest._run은 실행마다 Runtime._instance를 가짜 런타임으로 바꿨다가 None으로 되돌리고,
+      config.get_option을 바꿨다 되돌림 → 스레드끼리 겹치면 다른 세션의 실행 중에 런타임이 사라짐
+    - 공용 가짜 런타임·스크립트 캐시를 한 번 설치하고, AppTest 모듈이 보는 Runtime·설정 패치는 영향 없는 대상으로 돌림"""
+    global _runtime_installed
+    with _runtime_lock:
+        if _runtime_installed:
+            return
+        sys.path.insert(0, str(REPO_ROOT))
+        os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+        from unittest.mock import MagicMock
+
+        from streamlit import config
+        from streamlit.runtime import Runtime
+        from streamlit.testing.v1 import app_test
+
+        shared = MagicMock(spec=Runtime)
+        shared.media_file_mgr = app_test.MediaFileManager(app_test.MemoryMediaFileStorage("/mock/media"))
+        shared.dataframe_source_mgr = app_test.DataframeSourceManager()
+        shared.cache_storage_manager = app_test.MemoryCacheStorageManager()
+        registry = app_test.BidiComponentManager()
+        registry.discover_and_register_components(start_file_watching=False)
+        shared.bidi_component_registry = registry
+        Runtime._instance = shared
+        # AppTest의 실행별 설치·해제는 하위 클래스에만 기록되게 함 (실제 Runtime._instance는 공용 런타임 유지)
+        app_test.Runtime = type("Runtime", (Runtime,), {})
+        # 설정 패치도 실행마다 하지 않고 한 번만 (되돌리는 순서가 스레드끼리 엉키지 않도록)
+        overrides = {"global.appTest": True}
+        original_get_option = config.get_option
+        config.get_option = lambda name: overrides[name] if name in overrides else original_get_option(name)
+        app_test.patch_config_options = lambda _overrides: nullcontext()
+        # 실제 서버처럼 스크립트 캐시도 하나만 (AppTest는 실행마다 새로 만들어 동시에 컴파일 → ast.parse 경합)
+        script_cache = app_test.ScriptCache()
+        app_test.ScriptCache = lambda: script_cache
+        # Python 3.11.7 이하는 여러 스레드가 동시에 ast.parse 하면 SystemError("AST constructor recursion depth
+        # mismatch")가 날 수 있음 (스크립트 컴파일·SymPy 파싱) → 측정 도구에서는 ast.parse를 한 번에 하나씩
+        if sys.version_info < (3, 11, 8):
+            parse, parse_lock = ast.parse, threading.Lock()
+
+            def locked_parse(*args, **kwargs):
+                with parse_lock:
+                    return parse(*args, **kwargs)
+
+            ast.parse = locked_parse
+        import pandas, plotly.graph_objects, scipy.optimize, sympy  # noqa: F401  (임포트 비용은 측정에서 제외)
+        _runtime_installed = True
+
+
+def _session_thread(page, preset, timeout, barrier, results):
+    """AppTest 한 세션을 실행하고 상호작용별 지연 시간·스레드 CPU 시간을 보고"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(PAGES[page]), default_timeout=timeout)
+    latencies = []
+    errors = []
+
+    def timed(action, fn):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append((action, time.perf_counter() - t0))
+        if at.exception:
+            errors.append(f"{action}: {at.exception[0].message[:200]}")
+
+    barrier.wait()
+    cpu0 = time.thread_time()
+    try:
+        SCRIPTS[page](at, preset, timed)
+    except Exception as e:
+        errors.append(f"script: {e!r}"[:200])
+    results.append({"latencies": latencies, "errors": errors, "thread_cpu_seconds": time.thread_time() - cpu0})
+
+
+def _rss_mb():
+    """현재 프로세스 상주 메모리 (Linux /proc, 없으면 최대 상주 메모리)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+# ----- 3. 부하 단계 실행 및 집계 -----
+def _percentiles(values):
+    """지연 시간 백분위(ms) 계산"""
+    if not values:
+        return {}
+    arr = np.asarray(values) * 1000.0
+    return {
+        "p50_ms": float(np.percentile(arr, 50)),
+        "p90_ms": float(np.percentile(arr, 90)),
+        "p95_ms": float(np.percentile(arr, 95)),
+        "p99_ms": float(np.percentile(arr, 99)),
+        "max_ms": float(arr.max()),
+    }
+
+
+def run_level(page, n_sessions, timeout=120):
+    """N개의 세션 스레드를 동시에 시작해 한 번의 부하 단계를 실행 (한 프로세스 = 서버 하나)"""
+    install_shared_runtime()
+    presets = PRESET_NAMES[page]
+    barrier = threading.Barrier(n_sessions + 1)
+    results = []
+    threads = [
+        threading.Thread(target=_session_thread, name=f"session-{i}",
+                         args=(page, presets[i % len(presets)], timeout, barrier, results))
+        for i in range(n_sessions)
+    ]
+    for t in threads:
+        t.start()
+    barrier.wait(timeout=timeout)   # 모든 세션이 AppTest를 만든 뒤 동시에 시작
+
+    usage0 = resource.getrusage(resource.RUSAGE_SELF)
+    wall0 = time.perf_counter()
+    for t in threads:
+        t.join(timeout * 20)
+    wall = time.perf_counter() - wall0
+    usage1 = resource.getrusage(resource.RUSAGE_SELF)
+
+    all_latencies = [sec for r in results for _, sec in r["latencies"]]
+    by_action = {}
+    for r in results:
+        for action, sec in r["latencies"]:
+            by_action.setdefault(action, []).append(sec)
+    # 프로세스 전체 CPU (세션 스레드 + Streamlit 스크립트 스레드 + 배경 작업 스레드)
+    cpu_total = (usage1.ru_utime - usage0.ru_utime) + (usage1.ru_stime - usage0.ru_stime)
+
+    return {
+        "page": page,
+        "sessions": n_sessions,
+        "mode": "threads-in-one-process",
+        "reruns": len(all_latencies),
+        "wall_seconds": wall,
+        "reruns_per_second": len(all_latencies) / wall if wall > 0 else float("nan"),
+        "cpu_seconds": cpu_total,
+        "cpu_cores_used": cpu_total / wall if wall > 0 else float("nan"),
+        "rss_mb": _rss_mb(),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "latency": _percentiles(all_latencies),
+        "latency_by_action": {a: _percentiles(v) for a, v in by_action.items()},
+        "errors": [e for r in results for e in r["errors"]],
+        "notes": SCRIPT_NOTES.get(page),
+    }
+
+
+def format_row(res):
+    """결과 한 줄 요약"""
+    lat = res["latency"]
+    return (f"{res['page']:>5} N={res['sessions']:<3} reruns={res['reruns']:<5} "
+            f"p50={lat.get('p50_ms', float('nan')):8.1f}ms p95={lat.get('p95_ms', float('nan')):8.1f}ms "
+            f"p99={lat.get('p99_ms', float('nan')):8.1f}ms  cpu={res['cpu_cores_used']:.2f} cores  "
+            f"rss(now/peak)={res['rss_mb']:.0f}/{res['peak_rss_mb']:.0f}MB  "
+            f"errors={len(res['errors'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동시 접속 세션 부하 테스트")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="동시 세션 수 단계 (예: 1 2 4 8)")
+    parser.add_argument("--pages", nargs="+", default=list(PAGES), choices=list(PAGES),
+                        help="테스트할 페이지")
+    parser.add_argument("--timeout", type=float, default=120, help="재실행 1회 제한 시간(초)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    for page in args.pages:
+        if page in SCRIPT_NOTES:
+            print(f"  * {page}: {SCRIPT_NOTES[page]}")
+        for n in args.sessions:
+            res = run_level(page, n, timeout=args.timeout)
+            results.append(res)
+            print(format_row(res), flush=True)
+            for err in res["errors"][:3]:
+                print(f"      ! {err}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""경사 하강법 학습도구 페이지들이 함께 쓰는 계산·계측 모듈 모음"""
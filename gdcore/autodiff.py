@@ -0,0 +1,139 @@
+# ============================================================
+#  전진 모드 자동 미분 (이중수, dual number) 평가기
+#  - sympy로 파싱한 식 트리를 한 번만 훑어 NumPy 클로저로 변환
+#  - 호출 시 f 와 (∂f/∂x, ∂f/∂y)를 한 번의 계산으로 함께 구함
+#  - 기호 미분(diff)을 하지 않으므로 도함수 식이 커지는 함수에서 유리
+# ============================================================
+
+import numpy as np
+import sympy as sp
+
+X_SYM, Y_SYM = sp.symbols('x y')
+
+# 단항 함수: sympy 함수 → (값 함수, 도함수 f'(u))
+_UNARY = {
+    sp.sin: (np.sin, np.cos),
+    sp.cos: (np.cos, lambda u: -np.sin(u)),
+    sp.tan: (np.tan, lambda u: 1.0 / np.cos(u) ** 2),
+    sp.exp: (np.exp, np.exp),
+    sp.log: (np.log, lambda u: 1.0 / u),
+    sp.sinh: (np.sinh, np.cosh),
+    sp.cosh: (np.cosh, np.sinh),
+    sp.tanh: (np.tanh, lambda u: 1.0 - np.tanh(u) ** 2),
+    sp.atan: (np.arctan, lambda u: 1.0 / (1.0 + u * u)),
+    sp.asin: (np.arcsin, lambda u: 1.0 / np.sqrt(1.0 - u * u)),
+    sp.acos: (np.arccos, lambda u: -1.0 / np.sqrt(1.0 - u * u)),
+    sp.Abs: (np.abs, np.sign),
+}
+
+
+def _build(expr):
+    """식 트리 노드 → (x, y) ↦ (값, ∂x, ∂y) 클로저 (지원하지 않는 노드는 NotImplementedError)"""
+    if expr == X_SYM:
+        return lambda x, y: (x, 1.0, 0.0)
+    if expr == Y_SYM:
+        return lambda x, y: (y, 0.0, 1.0)
+    if expr.is_number:
+        try:
+            c = float(expr)
+        except TypeError as e:
+            raise NotImplementedError(f"실수가 아닌 상수: {expr}") from e
+        return lambda x, y: (c, 0.0, 0.0)
+
+    if isinstance(expr, sp.Add):
+        terms = [_build(a) for a in expr.args]
+
+        def add(x, y):
+            v, gx, gy = terms[0](x, y)
+            for t in terms[1:]:
+                tv, tx, ty = t(x, y)
+                v, gx, gy = v + tv, gx + tx, gy + ty
+            return v, gx, gy
+        return add
+
+    if isinstance(expr, sp.Mul):
+        factors = [_build(a) for a in expr.args]
+
+        def mul(x, y):
+            v, gx, gy = factors[0](x, y)
+            for fac in factors[1:]:
+                fv, fx, fy = fac(x, y)
+                # 곱의 미분: (uv)' = u'v + uv'
+                v, gx, gy = v * fv, gx * fv + v * fx, gy * fv + v * fy
+            return v, gx, gy
+        return mul
+
+    if isinstance(expr, sp.Pow):
+        base, exponent = expr.args
+        b = _build(base)
+        if exponent.is_number:
+            c = float(exponent)
+            if c == 2.0:
+                def square(x, y):
+                    bv, bx, by = b(x, y)
+                    return bv * bv, 2.0 * bv * bx, 2.0 * bv * by
+                return square
+
+            def power(x, y):
+                bv, bx, by = b(x, y)
+                d = c * bv ** (c - 1.0)
+                return bv ** c, d * bx, d * by
+            return power
+
+        e = _build(exponent)
+
+        def general_power(x, y):
+            # (b^e)' = b^e · (e'·ln b + e·b'/b)
+            # ln b 항은 지수가 그 방향으로 변할 때(e' ≠ 0)만 – 음수 밑에서 0·NaN으로 기울기 전체가 NaN이 되지 않게
+            bv, bx, by = b(x, y)
+            ev, ex, ey = e(x, y)
+            v = bv ** ev
+            log_b = np.log(bv)
+            log_x = np.where(np.not_equal(ex, 0.0), ex * log_b, 0.0)
+            log_y = np.where(np.not_equal(ey, 0.0), ey * log_b, 0.0)
+            return v, v * (log_x + ev * bx / bv), v * (log_y + ev * by / bv)
+        return general_power
+
+    if expr.func in _UNARY and len(expr.args) == 1:
+        value_fn, deriv_fn = _UNARY[expr.func]
+        u = _build(expr.args[0])
+
+        def unary(x, y):
+            uv, ux, uy = u(x, y)
+            d = deriv_fn(uv)
+            return value_fn(uv), d * ux, d * uy
+        return unary
+
+    raise NotImplementedError(f"자동 미분을 지원하지 않는 연산: {expr.func.__name__}")
+
+
+class DualGradient:
+    """f 와 기울기를 한 번에 계산하는 평가기 (dx, dy 는 lambdify 함수와 같은 호출 형태)"""
+
+    def __init__(self, f_sym):
+        self._eval = _build(sp.sympify(f_sym))
+        self._last = None  # ((x, y), 결과) – 세션 스레드 간 공유되므로 한 번에 교체
+
+    def value_and_grad(self, x, y):
+        """(f, ∂f/∂x, ∂f/∂y) 계산"""
+        # 경사 하강 한 스텝은 같은 점에서 dx, dy 를 연달아 부르므로 스칼라 입력은 직전 결과 재사용
+        scalar = np.isscalar(x) and np.isscalar(y)
+        last = self._last
+        if scalar and last is not None and last[0] == (x, y):
+            return last[1]
+        with np.errstate(all="ignore"):
+            v, gx, gy = self._eval(x, y)
+        result = (v, np.broadcast_to(gx, np.shape(v)) if np.ndim(v) else gx,
+                  np.broadcast_to(gy, np.shape(v)) if np.ndim(v) else gy)
+        if scalar:
+            self._last = ((x, y), result)
+        return result
+
+    def __call__(self, x, y):
+        return self.value_and_grad(x, y)[0]
+
+    def dx(self, x, y):
+        return self.value_and_grad(x, y)[1]
+
+    def dy(self, x, y):
+        return self.value_and_grad(x, y)[2]
@@ -0,0 +1,77 @@
+# ============================================================
+#  공유 스레드 풀에서의 배경 계산 (중복 제출 방지)
+#  - 같은 키의 작업은 실행 중이든 끝났든 하나의 Future를 함께 사용
+#    → 재실행·버튼 반복 클릭·여러 세션이 같은 계산을 중복으로 쌓지 않음
+#  - 작업은 report(중간 결과)로 진행 상황을 남기고, 페이지는 기다리는 동안 이를 표시
+#  - 배경 스레드에는 Streamlit 실행 컨텍스트가 없으므로 st 호출은 페이지 쪽에서만 함
+# ============================================================
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = int(os.environ.get("GD_BACKGROUND_WORKERS", "2"))
+MAX_FINISHED = 256   # 결과를 재사용하기 위해 보관하는 완료 작업 수
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="gd-background")
+_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+class BackgroundJob:
+    """배경 작업 하나 (Future + 마지막으로 보고된 진행 상황)"""
+
+    def __init__(self, key):
+        self.key = key
+        self.progress = None
+        self.future = None
+
+    def report(self, progress):
+        self.progress = progress
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+
+def _forget_failed(job):
+    """예외로 끝난 작업은 다음 제출 때 다시 실행되도록 목록에서 제거"""
+    if job.future.cancelled() or job.future.exception() is not None:
+        with _jobs_lock:
+            if _jobs.get(job.key) is job:
+                del _jobs[job.key]
+
+
+def submit_once(key, fn):
+    """key별로 한 번만 fn(report)를 제출하고 BackgroundJob 반환 (이미 있으면 그 작업)"""
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None:
+            _jobs.move_to_end(key)
+            return job
+        job = BackgroundJob(key)
+        job.future = _executor.submit(fn, job.report)
+        _jobs[key] = job
+        # 오래된 완료 작업부터 정리 (실행 중인 작업은 유지)
+        for old_key in [k for k, j in _jobs.items() if j.future.done()][:max(0, len(_jobs) - MAX_FINISHED)]:
+            del _jobs[old_key]
+    job.future.add_done_callback(lambda _: _forget_failed(job))
+    return job
+
+
+def wait_for(job, on_progress=None, timeout=30.0, poll_interval=0.1):
+    """작업이 끝날 때까지 기다리며 진행 상황 표시 (시간 초과 시 None, 끝나면 결과)"""
+    deadline = time.perf_counter() + timeout
+    shown = object()
+    while not job.done():
+        if on_progress is not None and job.progress is not shown and job.progress is not None:
+            shown = job.progress
+            on_progress(shown)
+        if time.perf_counter() >= deadline:
+            return None
+        time.sleep(poll_interval)
+    return job.result()
@@ -0,0 +1,132 @@
+# ============================================================
+#  배경 일괄 쓰기 도우미 (수업 기록 SQLite·실행 기록 보관소 공용)
+#  - 페이지는 submit()으로 큐에 넣고 바로 반환 (디스크 쓰기를 기다리지 않음)
+#  - 배경 스레드 하나가 batch_size개 또는 첫 항목 후 flush_interval초까지 모아 _write(rows)로 한 번에 기록
+#  - 기록에 실패한 행은 버리지 않고 보관했다가 RETRY_INTERVAL초 뒤(또는 다음 묶음과 함께) 다시 기록
+#    보관 행이 MAX_PENDING을 넘으면 오래된 것부터 버리고 그 수를 dropped에 셈
+#  - 마지막 오류·대기 행·버린 행은 status()로 교사용 페이지에 표시
+#  - 쓰기 담당은 (종류, 위치)별로 프로세스에 하나 (shared_writer), 프로세스 종료 시 atexit에서 남은 기록 기록
+#  - 디스크 저장은 선택 사항: 위치 환경 변수를 지정하거나 GD_PERSIST=1일 때만 저장 (storage_location)
+# ============================================================
+
+import atexit
+import os
+import queue
+import threading
+import time
+
+PERSIST = os.environ.get("GD_PERSIST", "") == "1"   # 기본 위치(data/)에 저장할지
+RETRY_INTERVAL = 5.0   # 기록 실패 후 다시 시도하기까지 (초)
+MAX_PENDING = 10_000   # 실패해서 다시 기록을 기다리는 최대 행 수
+
+
+def storage_location(env_var, default):
+    """저장 위치: 환경 변수 env_var로 지정한 경로, 없으면 GD_PERSIST=1일 때만 default (빈 문자열 = 저장 끔)"""
+    return os.environ.get(env_var, default if PERSIST else "")
+
+
+class BatchWriter:
+    """큐에 쌓인 행을 배경 스레드에서 모아 기록하는 쓰기 담당 (하위 클래스가 _write와 errors를 정함)"""
+
+    label = "기록"         # 교사용 페이지에 표시할 이름
+    errors = (OSError,)   # 다시 시도할 기록 실패 (그 밖의 예외는 코드 오류이므로 행을 버림)
+
+    def __init__(self, batch_size, flush_interval, name, max_pending=MAX_PENDING):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.written = 0
+        self.dropped = 0
+        self.last_error = None
+        self._pending = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        """행 하나를 큐에 넣음"""
+        self._queue.put(row)
+
+    def flush(self, timeout=5.0):
+        """지금까지 넣은 행의 기록을 시도할 때까지 기다림 (시간 안에 끝나고 남은 실패 행이 없으면 True)"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout) and not self._pending
+
+    def status(self):
+        """기록·대기·버린 행 수와 마지막 오류"""
+        return {"written": self.written, "pending": len(self._pending), "dropped": self.dropped,
+                "last_error": self.last_error}
+
+    def _write(self, rows):
+        raise NotImplementedError
+
+    def _collect(self):
+        """첫 항목을 기다린 뒤 batch_size개 또는 flush_interval초까지 모음 (flush 요청이 오면 바로 끝냄)
+        실패한 행이 있으면 첫 항목은 RETRY_INTERVAL초까지만 기다림 (새 행이 없어도 다시 시도)"""
+        try:
+            batch = [self._queue.get(timeout=RETRY_INTERVAL if self._pending else None)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not isinstance(batch[-1], threading.Event):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            rows = self._pending + [item for item in batch if not isinstance(item, threading.Event)]
+            if rows:
+                try:
+                    self._write(rows)
+                    self.written += len(rows)
+                    self._pending = []
+                    self.last_error = None
+                except self.errors as e:
+                    # 기록 실패가 페이지를 막지 않도록 보관했다가 다시 시도
+                    self.last_error = f"{type(e).__name__}: {e}"
+                    overflow = max(0, len(rows) - self.max_pending)
+                    self.dropped += overflow
+                    self._pending = rows[overflow:]
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def shared_writer(cls, location):
+    """(쓰기 담당 종류, 위치)별 프로세스 공용 쓰기 담당 (첫 호출 시 스레드 시작, 위치가 비었으면 None)"""
+    if not location:
+        return None
+    key = (cls, os.path.abspath(location))
+    writer = _writers.get(key)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(key)
+            if writer is None:
+                writer = _writers[key] = cls(location)
+                atexit.register(writer.flush)
+    return writer
+
+
+def writer_warnings():
+    """기록에 실패하고 있거나 행을 버린 쓰기 담당별 경고 문구 (교사용 페이지 표시용)"""
+    with _writers_lock:
+        writers = list(_writers.items())
+    warnings = []
+    for (_, location), writer in writers:
+        status = writer.status()
+        if status["last_error"] or status["dropped"]:
+            warnings.append(f"{writer.label} 기록 실패 (`{location}`): {status['last_error'] or '복구됨'} – "
+                            f"다시 시도 대기 {status['pending']}행, 버린 행 {status['dropped']}개")
+    return warnings
@@ -0,0 +1,196 @@
+# ============================================================
+#  프리셋 미리 계산 번들 (.npy + manifest.json)
+#  - 빌드: 프리셋별 표면 격자(여러 해상도), SciPy 기준 최소점, 기본 경사 하강 경로 저장
+#      python -m gdcore.bundle            (기본 위치 data/preset_bundle)
+#  - 실행: 배경 스레드가 manifest를 읽고 배열을 np.load(mmap_mode='r')로 매핑한 뒤 페이지를 미리 읽어 둠
+#    → 프리셋 화면은 매핑된 읽기 전용 배열을 복사 없이 그대로 사용
+#  - 번들이 없거나 버전이 다르면 배경 스레드가 새로 빌드 (그 전까지는 실시간 계산)
+#  - npz는 메모리 매핑이 되지 않으므로 배열마다 .npy 파일 하나로 저장
+# ============================================================
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+import sympy
+
+from gdcore.diskcache import canonical_expression
+from gdcore.functions import compile_function, evaluate_surface
+from gdcore.optimize import gd_trajectory, multi_start_minimum
+from gdcore.presets import BUNDLE_RESOLUTIONS, PRESET_SPECS
+
+BUNDLE_DIR = os.environ.get("GD_PRESET_BUNDLE", os.path.join("data", "preset_bundle"))
+FORMAT_VERSION = 2
+
+
+def _versions():
+    return {"format": FORMAT_VERSION, "sympy": sympy.__version__, "numpy": np.__version__}
+
+
+def _range_key(rng):
+    return (float(rng[0]), float(rng[1]))
+
+
+def _starts_key(starts):
+    """SciPy 시작점 목록 → 키 (같은 함수식이라도 시작점 목록이 다르면 다른 최소점일 수 있음)"""
+    return tuple(_range_key(s) for s in starts)
+
+
+# ----- 1. 빌드 -----
+def _save_array(out_dir, name, array):
+    """배열을 임시 파일에 쓴 뒤 원자적으로 교체"""
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_path, os.path.join(out_dir, name))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return name
+
+
+def build_bundle(out_dir=BUNDLE_DIR, specs=PRESET_SPECS, resolutions=BUNDLE_RESOLUTIONS):
+    """프리셋 번들을 out_dir에 빌드하고 manifest 반환 (manifest는 마지막에 교체)"""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = dict(_versions(), surfaces=[], minima=[], trajectories=[])
+
+    for spec in specs:
+        name = spec["name"]
+        f_np, dx_np, dy_np = compile_function(spec["formula"], gradient_mode="symbolic")
+        common = {"formula": canonical_expression(spec["formula"])}
+
+        for res in resolutions:
+            X, Y, Z = evaluate_surface(f_np, spec["x_range"], spec["y_range"], res)
+            manifest["surfaces"].append(dict(
+                common, x_range=list(spec["x_range"]), y_range=list(spec["y_range"]), resolution=res,
+                X=_save_array(out_dir, f"{name}_surface_{res}_X.npy", X),
+                Y=_save_array(out_dir, f"{name}_surface_{res}_Y.npy", Y),
+                Z=_save_array(out_dir, f"{name}_surface_{res}_Z.npy", Z),
+            ))
+
+        starts = [(0.0, 0.0), spec["start"], *spec.get("scipy_seeds", [])]
+        minimum = multi_start_minimum(f_np, starts)
+        if minimum is not None:
+            manifest["minima"].append(dict(common, starts=[list(map(float, s)) for s in starts], point=list(minimum)))
+
+        path, values, grads = gd_trajectory(f_np, dx_np, dy_np, spec["start"],
+                                            spec["learning_rate"], spec["steps"])
+        manifest["trajectories"].append(dict(
+            common, start=list(spec["start"]), learning_rate=spec["learning_rate"], steps=spec["steps"],
+            path=_save_array(out_dir, f"{name}_traj_path.npy", path),
+            values=_save_array(out_dir, f"{name}_traj_values.npy", values),
+            grads=_save_array(out_dir, f"{name}_traj_grads.npy", grads),
+        ))
+
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=".json.tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(out_dir, "manifest.json"))
+    return manifest
+
+
+# ----- 2. 메모리 매핑 로드 -----
+class PresetBundle:
+    """manifest의 배열을 메모리 매핑해 (함수식, 범위, 설정)으로 찾아 주는 읽기 전용 번들"""
+
+    def __init__(self, bundle_dir, manifest):
+        def load(file_name):
+            return np.load(os.path.join(bundle_dir, file_name), mmap_mode="r")
+
+        self._surfaces = {
+            (s["formula"], _range_key(s["x_range"]), _range_key(s["y_range"]), s["resolution"]):
+                (load(s["X"]), load(s["Y"]), load(s["Z"]))
+            for s in manifest["surfaces"]
+        }
+        self._minima = {
+            (m["formula"], _starts_key(m["starts"])): tuple(m["point"])
+            for m in manifest["minima"]
+        }
+        self._trajectories = {
+            (t["formula"], _range_key(t["start"]), float(t["learning_rate"]), int(t["steps"])):
+                (load(t["path"]), load(t["values"]), load(t["grads"]))
+            for t in manifest["trajectories"]
+        }
+
+    @classmethod
+    def open(cls, bundle_dir=BUNDLE_DIR):
+        """번들 열기 (없거나 버전이 다르면 None)"""
+        try:
+            with open(os.path.join(bundle_dir, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if any(manifest.get(k) != v for k, v in _versions().items()):
+            return None
+        try:
+            return cls(bundle_dir, manifest)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def touch(self):
+        """매핑된 모든 배열을 한 번 읽어 페이지 캐시에 올림"""
+        for arrays in (*self._surfaces.values(), *self._trajectories.values()):
+            for arr in arrays:
+                float(np.sum(arr))
+
+    def surface(self, formula, x_range, y_range, resolution=80):
+        return self._surfaces.get((canonical_expression(formula), _range_key(x_range),
+                                   _range_key(y_range), resolution))
+
+    def minimum(self, formula, starts):
+        """같은 SciPy 시작점 목록으로 미리 찾은 최소점 (없으면 None)"""
+        return self._minima.get((canonical_expression(formula), _starts_key(starts)))
+
+    def trajectory(self, formula, start, learning_rate, steps):
+        return self._trajectories.get((canonical_expression(formula), _range_key(start),
+                                       float(learning_rate), int(steps)))
+
+
+_bundle = None
+_warm_lock = threading.Lock()
+_warm_thread = None
+
+
+def _warm(bundle_dir):
+    global _bundle
+    bundle = PresetBundle.open(bundle_dir)
+    if bundle is None:
+        try:
+            build_bundle(bundle_dir)
+        except OSError:
+            return  # 쓰기 불가 환경에서는 실시간 계산만 사용
+        bundle = PresetBundle.open(bundle_dir)
+    if bundle is not None:
+        bundle.touch()
+        _bundle = bundle
+
+
+def get_bundle(bundle_dir=BUNDLE_DIR):
+    """준비된 번들 반환 (첫 호출 시 배경 워밍 시작, 준비 전에는 None)"""
+    global _warm_thread
+    if _bundle is None and _warm_thread is None and bundle_dir:
+        with _warm_lock:
+            if _warm_thread is None:
+                _warm_thread = threading.Thread(target=_warm, args=(bundle_dir,),
+                                                name="preset-bundle-warm", daemon=True)
+                _warm_thread.start()
+    return _bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프리셋 미리 계산 번들 빌드")
+    parser.add_argument("--out", default=BUNDLE_DIR or os.path.join("data", "preset_bundle"),
+                        help="번들 디렉터리")
+    args = parser.parse_args(argv)
+    manifest = build_bundle(args.out)
+    print(f"{args.out}: 표면 {len(manifest['surfaces'])}개, 최소점 {len(manifest['minima'])}개, "
+          f"경로 {len(manifest['trajectories'])}개")
+
+
+if __name__ == "__main__":
+    main()
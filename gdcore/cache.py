@@ -0,0 +1,106 @@
+# ============================================================
+#  세션 간 공유 캐시 (Streamlit cache_resource)
+#  - 같은 함수식·범위는 모든 학생 세션이 한 번 계산한 결과를 함께 사용
+#  - 캐시된 배열은 읽기 전용으로 고정해 세션 간 공유 시 변경을 막음
+#  - 캐시에 없는 계산은 계산 서비스가 있으면 그쪽에서, 없으면 이 프로세스에서 (gdcore.compute)
+#    함수식 컴파일은 서비스가 연결돼 있을 때만 미리 요청하고, 서비스가 컴파일하지 못한 함수식은 다시 요청하지 않음
+# ============================================================
+
+import streamlit as st
+
+from gdcore import compute
+from gdcore.bundle import get_bundle
+from gdcore.critical import find_critical_points
+from gdcore.curvature import curvature_fields
+from gdcore.diskcache import CACHE_DIR, load_compiled, store_compiled
+from gdcore.functions import compile_function, compile_hessian, evaluate_surface
+from gdcore.lrsweep import rate_grid, sweep_learning_rates
+
+
+def _freeze(*arrays):
+    """배열을 읽기 전용으로 설정"""
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+# 계산 서비스가 컴파일하지 못한 함수식 (잘못된 식 등 – 다시 요청하지 않고 바로 이 프로세스에서 컴파일)
+_warm_failed = set()
+
+
+def _warm_from_service(func_input):
+    """계산 서비스에 컴파일을 맡기고 디스크 캐시에서 불러옴 (서비스를 쓸 수 없거나 실패하면 None)"""
+    if not CACHE_DIR or func_input in _warm_failed or not compute.service_available():
+        return None
+    compiled = load_compiled(func_input) if compute.warm_compile(func_input) else None
+    # 연결 실패는 서비스 쪽 상태(잠시 사용 안 함)로 처리 – 서비스가 응답했는데도 못 불러온 식만 기억
+    if compiled is None and compute.service_available():
+        _warm_failed.add(func_input)
+    return compiled
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_compiled_function(func_input):
+    """함수식별 (f, ∂f/∂x, ∂f/∂y) 캐시 (메모리에 없으면 디스크 캐시 → 계산 서비스 → 컴파일 순)"""
+    compiled = load_compiled(func_input) if CACHE_DIR else None
+    if compiled is None:
+        compiled = _warm_from_service(func_input)
+    if compiled is None:
+        compiled = compile_function(func_input)
+        store_compiled(func_input, compiled)
+    return compiled
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _cached_surface_grid(func_input, x_range, y_range, resolution):
+    """(함수식, 범위, 해상도)별 실시간 계산 표면 격자 캐시"""
+    return _freeze(*compute.surface_grid(
+        func_input, x_range, y_range, resolution,
+        lambda: evaluate_surface(get_compiled_function(func_input)[0], x_range, y_range, resolution)
+    ))
+
+
+def get_surface_grid(func_input, x_range, y_range, resolution=80):
+    """표면 격자 (X, Y, Z) – 프리셋 번들(메모리 매핑)에 있으면 그대로, 없으면 캐시된 계산 결과"""
+    bundle = get_bundle()
+    if bundle is not None:
+        surface = bundle.surface(func_input, x_range, y_range, resolution)
+        if surface is not None:
+            return surface
+    return _cached_surface_grid(func_input, tuple(x_range), tuple(y_range), resolution)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_compiled_hessian(func_input):
+    """함수식별 헤세 행렬 성분 (f_xx, f_xy, f_yy) 함수 캐시"""
+    return compile_hessian(func_input)
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def get_critical_points(func_input, x_range, y_range):
+    """(함수식, 범위)별 임계점 목록 캐시 (배열은 읽기 전용)"""
+    points = find_critical_points(*get_compiled_function(func_input), get_compiled_hessian(func_input),
+                                  x_range, y_range)
+    _freeze(*points.values())
+    return points
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_curvature_grid(func_input, x_range, y_range, resolution=80):
+    """(함수식, 범위, 해상도)별 곡률 지도 캐시 – 같은 표면 격자의 X, Y 위에서 계산 (배열은 읽기 전용)"""
+    X, Y, _ = get_surface_grid(func_input, x_range, y_range, resolution)
+    _, dx_np_func, dy_np_func = get_compiled_function(func_input)
+    fields = curvature_fields(dx_np_func, dy_np_func, get_compiled_hessian(func_input), X, Y)
+    _freeze(*fields.values())
+    return fields
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_lr_sweep(func_input, start, rate_range, steps):
+    """(함수식, 시작점, 학습률 범위, 스텝 수)별 학습률 스윕 캐시 (배열은 읽기 전용)"""
+    sweep = compute.lr_sweep(
+        func_input, start, rate_range, steps,
+        lambda: sweep_learning_rates(*get_compiled_function(func_input), start, rate_grid(*rate_range), steps)
+    )
+    _freeze(*sweep.values())
+    return sweep
@@ -0,0 +1,177 @@
+# ============================================================
+#  수업 현황 집계 (프로세스 전체, 고정 메모리)
+#  - 학생 세션은 실행 요약(함수식, 시작점, 학습률, 결과)을 record_run()으로 넣음 → 배열 칸 몇 개만 갱신 (O(1))
+#  - 미리 나눈 구간의 히스토그램: 함수식별 log₁₀ 학습률 × 결과, 시작점 2D 격자, 결과 개수
+#  - 최근 실행은 고정 길이 링 버퍼, 분 단위 활동량도 고정 길이 링 버퍼
+#  - 함수식 수는 MAX_EXPRESSIONS로 제한 (넘치면 "기타"에 합침) → 반 인원이 늘어도 메모리 일정
+#  - 대시보드는 게시된 스냅샷(읽기 전용 사본)만 읽음 → 학생 쪽 잠금을 기다리지 않음
+#    스냅샷이 오래됐으면 잠금을 "기다리지 않고" 시도해 새로 만들고, 잠금이 바쁘면 이전 스냅샷 사용
+#  - 서버 프로세스 하나 기준 (여러 프로세스로 띄우면 프로세스별 집계)
+# ============================================================
+
+import bisect
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from gdcore.diskcache import canonical_expression
+from gdcore.lrsweep import CONVERGE_TOL, DIVERGE_LIMIT
+from gdcore.presets import PRESET_SPECS
+
+MAX_EXPRESSIONS = 16
+OTHER_EXPRESSION = "기타"
+RECENT_RUNS = 200          # 최근 실행 링 버퍼 길이
+ACTIVITY_MINUTES = 60      # 분 단위 활동량 링 버퍼 길이
+ACTIVE_WINDOW = 600.0      # 이 시간(초) 안에 실행한 세션을 "활동 중"으로 봄
+MAX_SESSIONS = 1024        # 활동 세션 추적 개수 제한
+SNAPSHOT_INTERVAL = 1.0    # 스냅샷 재생성 최소 간격 (초)
+
+# 학습률 구간: log₁₀ α ∈ [-5, 1) 을 0.25 간격으로
+LR_EDGES = np.arange(-5.0, 1.0 + 1e-9, 0.25)
+# 시작점 구간: [-10, 10]² 을 1 간격으로 (범위 밖은 가장자리 칸)
+START_EDGES = np.arange(-10.0, 10.0 + 1e-9, 1.0)
+_LR_EDGE_LIST, _START_EDGE_LIST = LR_EDGES.tolist(), START_EDGES.tolist()   # 기록할 때 bisect로 구간 찾기
+
+OUTCOMES = {"converged": "수렴", "diverged": "발산", "running": "진행 중·미수렴"}
+_OUTCOME_INDEX = {name: i for i, name in enumerate(OUTCOMES)}
+
+_PRESET_LABELS = {canonical_expression(spec["formula"]): spec["label"] for spec in PRESET_SPECS}
+
+
+def expression_label(expr):
+    """함수식 표시 이름 (프리셋이면 프리셋 이름)"""
+    return _PRESET_LABELS.get(canonical_expression(expr), expr)
+
+
+def classify_run(path, values, grad_norm, steps):
+    """경로 요약 → 결과 (converged / diverged / running)"""
+    final = np.asarray(path)[-1]
+    if (len(values) < steps + 1 or not np.isfinite(values[-1])
+            or not np.all(np.isfinite(final)) or np.max(np.abs(final)) > DIVERGE_LIMIT):
+        return "diverged"  # NaN으로 멈췄거나 값·좌표가 무한대로 감
+    if np.isfinite(grad_norm) and grad_norm < CONVERGE_TOL:
+        return "converged"
+    return "running"
+
+
+def _bin(edges, value):
+    """값이 속한 구간 번호 (범위 밖·NaN은 양 끝 구간)"""
+    if not math.isfinite(value):
+        return 0 if value != value or value < 0 else len(edges) - 2
+    return min(max(bisect.bisect_right(edges, value) - 1, 0), len(edges) - 2)
+
+
+class _ExpressionStats:
+    """함수식 하나의 미리 나눈 히스토그램"""
+
+    def __init__(self):
+        self.lr_hist = np.zeros((len(OUTCOMES), len(LR_EDGES) - 1), dtype=np.int64)
+        self.start_hist = np.zeros((len(START_EDGES) - 1, len(START_EDGES) - 1), dtype=np.int64)
+        self.outcomes = np.zeros(len(OUTCOMES), dtype=np.int64)
+
+
+class ClassAggregator:
+    """실행 요약을 고정 크기 히스토그램·링 버퍼에 모으는 집계기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = OrderedDict()
+        self._recent = deque(maxlen=RECENT_RUNS)
+        self._activity = np.zeros(ACTIVITY_MINUTES, dtype=np.int64)
+        self._activity_minute = int(time.time() // 60)
+        self._sessions = OrderedDict()
+        self._total = 0
+        self._snapshot = None
+
+    def record(self, session, expr, start, learning_rate, steps, outcome, final_loss, now=None):
+        """실행 요약 하나 추가 (구간 번호 계산 후 칸 몇 개 갱신)"""
+        now = time.time() if now is None else now
+        key = canonical_expression(expr)
+        lr_bin = _bin(_LR_EDGE_LIST, math.log10(max(float(learning_rate), 1e-12)))
+        sx_bin, sy_bin = _bin(_START_EDGE_LIST, float(start[0])), _bin(_START_EDGE_LIST, float(start[1]))
+        outcome_index = _OUTCOME_INDEX[outcome]
+        minute = int(now // 60)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= MAX_EXPRESSIONS:
+                    key = OTHER_EXPRESSION
+                stats = self._stats.setdefault(key, _ExpressionStats())
+            stats.lr_hist[outcome_index, lr_bin] += 1
+            stats.start_hist[sy_bin, sx_bin] += 1
+            stats.outcomes[outcome_index] += 1
+
+            # 분 단위 활동량: 지난 분의 칸은 비우고 현재 분 칸에 더함 (버퍼보다 오래된 기록은 활동량에서 뺌)
+            for m in range(self._activity_minute + 1, min(minute, self._activity_minute + ACTIVITY_MINUTES) + 1):
+                self._activity[m % ACTIVITY_MINUTES] = 0
+            self._activity_minute = max(self._activity_minute, minute)
+            if minute > self._activity_minute - ACTIVITY_MINUTES:
+                self._activity[minute % ACTIVITY_MINUTES] += 1
+
+            self._sessions[session] = now
+            self._sessions.move_to_end(session)
+            if len(self._sessions) > MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+
+            self._recent.append((now, key, float(start[0]), float(start[1]), float(learning_rate),
+                                 int(steps), outcome, float(final_loss)))
+            self._total += 1
+
+    def _build_snapshot(self, now):
+        """잠금을 잡은 상태에서 읽기 전용 사본 생성 (배열 복사 – 크기는 고정)"""
+        minute = int(now // 60)
+        first_kept = self._activity_minute - ACTIVITY_MINUTES
+        activity = np.array([
+            self._activity[m % ACTIVITY_MINUTES] if first_kept < m <= self._activity_minute else 0
+            for m in range(minute - ACTIVITY_MINUTES + 1, minute + 1)
+        ], dtype=np.int64)
+        return {
+            "time": now,
+            "total": self._total,
+            "active_sessions": sum(1 for t in self._sessions.values() if now - t <= ACTIVE_WINDOW),
+            "activity": activity,   # 오래된 분 → 현재 분 순
+            "expressions": {
+                key: {"lr_hist": s.lr_hist.copy(), "start_hist": s.start_hist.copy(), "outcomes": s.outcomes.copy()}
+                for key, s in self._stats.items()
+            },
+            "recent": list(self._recent),
+        }
+
+    def snapshot(self, max_age=SNAPSHOT_INTERVAL):
+        """최근 스냅샷 (오래됐으면 잠금이 비어 있을 때만 새로 만듦 – 학생 쪽 기록을 기다리게 하지 않음)"""
+        now = time.time()
+        current = self._snapshot
+        if current is not None and now - current["time"] < max_age:
+            return current
+        if not self._lock.acquire(blocking=current is None):
+            return current
+        try:
+            self._snapshot = self._build_snapshot(now)
+            return self._snapshot
+        finally:
+            self._lock.release()
+
+
+_aggregator = ClassAggregator()
+
+
+def get_aggregator():
+    """프로세스 공용 집계기"""
+    return _aggregator
+
+
+def record_run(session, expr, functions, start, learning_rate, steps, path, values):
+    """페이지용: 끝점 기울기로 결과를 판정해 집계기에 추가 (functions = (f, ∂f/∂x, ∂f/∂y))"""
+    _, dx_np_func, dy_np_func = functions
+    with np.errstate(all="ignore"):
+        try:
+            grad_norm = float(np.hypot(dx_np_func(*path[-1]), dy_np_func(*path[-1])))
+        except (ArithmeticError, ValueError):
+            grad_norm = float("nan")
+    outcome = classify_run(path, values, grad_norm, steps)
+    _aggregator.record(session, expr, start, learning_rate, steps, outcome,
+                       values[-1] if len(values) else float("nan"))
+    return outcome
@@ -0,0 +1,189 @@
+# ============================================================
+#  로컬 계산 서비스 연동 (무거운 계산을 Streamlit 프로세스 밖으로)
+#  - GD_COMPUTE_URL(예: http://127.0.0.1:8765)을 지정하면 표면·경로·최소점·학습률 스윕·컴파일을
+#    계산 서비스(gdcore.compute_server)의 작업자 프로세스에서 실행 → 스크립트 스레드는 응답만 기다림
+#  - 지정하지 않았거나 서비스가 응답하지 않으면 지금처럼 이 프로세스에서 계산 (local 인자)
+#    연결에 실패하면 RETRY_AFTER초 동안은 바로 이 프로세스에서 계산 (매 재실행마다 기다리지 않음)
+#  - 요청: POST /{작업} + JSON 인자, 응답: 배열을 담은 npz (실패 시 JSON 오류와 4xx/5xx)
+#  - 서비스 쪽 작업(OPERATIONS)은 함수식 문자열만 받아 작업자 프로세스가 직접 컴파일 (디스크 캐시 공유)
+#  - 이 모듈은 streamlit을 가져오지 않음 (서비스 작업자 프로세스에서도 사용)
+# ============================================================
+
+import io
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from functools import lru_cache
+
+import numpy as np
+
+from gdcore.diskcache import load_or_compile
+from gdcore.functions import evaluate_surface
+from gdcore.lrsweep import rate_grid, sweep_learning_rates
+from gdcore.optimize import gd_trajectory, multi_start_minimum
+
+# 계산 서비스 주소 (빈 문자열이면 항상 이 프로세스에서 계산)
+SERVICE_URL = os.environ.get("GD_COMPUTE_URL", "").rstrip("/")
+TIMEOUT = float(os.environ.get("GD_COMPUTE_TIMEOUT", "30"))   # 요청 하나의 최대 대기 (초)
+RETRY_AFTER = 30.0   # 연결 실패 후 서비스를 다시 시도하기까지 (초)
+
+
+# ----- 1. 서비스 쪽 작업 (작업자 프로세스에서 실행, 결과는 배열 dict) -----
+@lru_cache(maxsize=64)
+def _functions(expr):
+    """작업자 프로세스의 함수식별 (f, ∂f/∂x, ∂f/∂y) (디스크 캐시에 없으면 컴파일 후 저장)"""
+    return load_or_compile(expr)
+
+
+def _op_compile(expr):
+    """컴파일만 해 둠 (디스크 캐시에 저장 → 같은 호스트의 페이지는 디스크에서 바로 불러옴)"""
+    _functions(expr)
+    return {"ok": np.array(True)}
+
+
+def _op_surface(expr, x_range, y_range, resolution=80):
+    X, Y, Z = evaluate_surface(_functions(expr)[0], tuple(x_range), tuple(y_range), int(resolution))
+    return {"X": X, "Y": Y, "Z": Z}
+
+
+def _op_trajectory(expr, start, learning_rate, steps):
+    path, values, grads = gd_trajectory(*_functions(expr), tuple(start), float(learning_rate), int(steps))
+    return {"path": path, "values": values, "grads": grads}
+
+
+def _op_minimize(expr, starts):
+    point = multi_start_minimum(_functions(expr)[0], [list(map(float, s)) for s in starts])
+    return {"point": np.array(point if point is not None else [], dtype=float)}
+
+
+def _op_lr_sweep(expr, start, rate_range, steps):
+    return sweep_learning_rates(*_functions(expr), tuple(start), rate_grid(*rate_range), int(steps))
+
+
+OPERATIONS = {
+    "compile": _op_compile,
+    "surface": _op_surface,
+    "trajectory": _op_trajectory,
+    "minimize": _op_minimize,
+    "lr_sweep": _op_lr_sweep,
+}
+
+
+def encode_result(result):
+    """결과 배열 dict → npz 바이트"""
+    buffer = io.BytesIO()
+    np.savez(buffer, **{name: np.asarray(value) for name, value in result.items()})
+    return buffer.getvalue()
+
+
+def decode_result(payload):
+    """npz 바이트 → 배열 dict (배열은 읽기 전용)"""
+    with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+        result = {name: data[name] for name in data.files}
+    for arr in result.values():
+        arr.setflags(write=False)
+    return result
+
+
+def execute(op, params):
+    """작업 하나 실행 → npz 바이트 (작업자 프로세스 진입점)"""
+    return encode_result(OPERATIONS[op](**params))
+
+
+# ----- 2. 페이지 쪽 클라이언트 -----
+class _ServiceState:
+    """서비스 연결 상태 (연결 실패 시각·마지막 오류·원격/로컬 처리 수)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.down_until = 0.0
+        self.last_error = None
+        self.remote_calls = 0
+        self.local_calls = 0
+
+
+_state = _ServiceState()
+
+
+def service_available():
+    """계산 서비스를 쓸 차례인지 (주소가 있고 최근에 연결 실패하지 않음)"""
+    return bool(SERVICE_URL) and time.monotonic() >= _state.down_until
+
+
+def service_status():
+    """서비스 주소·사용 가능 여부·마지막 오류·원격/로컬 처리 수"""
+    with _state.lock:
+        return {"url": SERVICE_URL or None, "available": service_available(), "last_error": _state.last_error,
+                "remote_calls": _state.remote_calls, "local_calls": _state.local_calls}
+
+
+def request(op, **params):
+    """계산 서비스에 작업 요청 → 배열 dict (서비스를 쓸 수 없거나 실패하면 None)"""
+    if not service_available():
+        return None
+    req = urllib.request.Request(f"{SERVICE_URL}/{op}", data=json.dumps(params).encode("utf-8"),
+                                 headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=TIMEOUT) as response:
+            result = decode_result(response.read())
+    except urllib.error.HTTPError as e:
+        # 작업 자체의 오류 (잘못된 함수식 등) – 로컬 계산이 같은 예외를 페이지에 그대로 보여 주도록 None
+        with _state.lock:
+            _state.last_error = f"{op}: HTTP {e.code}"
+        return None
+    except (OSError, ValueError) as e:
+        # 연결 실패·시간 초과·깨진 응답 – 잠시 서비스를 쓰지 않음
+        with _state.lock:
+            _state.down_until = time.monotonic() + RETRY_AFTER
+            _state.last_error = f"{op}: {e}"
+        return None
+    with _state.lock:
+        _state.remote_calls += 1
+    return result
+
+
+def _local(compute):
+    with _state.lock:
+        _state.local_calls += 1
+    return compute()
+
+
+def remote_or_local(op, params, unpack, local):
+    """서비스 결과를 unpack으로 변환해 반환, 서비스를 쓸 수 없으면 local() (같은 형태의 결과)"""
+    result = request(op, **params)
+    return unpack(result) if result is not None else _local(local)
+
+
+def warm_compile(expr):
+    """서비스에서 미리 컴파일 (디스크 캐시를 채워 이 프로세스의 컴파일을 디스크 불러오기로 바꿈)"""
+    return request("compile", expr=expr) is not None
+
+
+def surface_grid(expr, x_range, y_range, resolution, local):
+    """표면 격자 (X, Y, Z)"""
+    return remote_or_local("surface", {"expr": expr, "x_range": list(x_range), "y_range": list(y_range),
+                                       "resolution": int(resolution)},
+                           lambda r: (r["X"], r["Y"], r["Z"]), local)
+
+
+def trajectory(expr, start, learning_rate, steps, local):
+    """경사 하강 경로 (path, values, grads)"""
+    return remote_or_local("trajectory", {"expr": expr, "start": [float(start[0]), float(start[1])],
+                                          "learning_rate": float(learning_rate), "steps": int(steps)},
+                           lambda r: (r["path"], r["values"], r["grads"]), local)
+
+
+def minimum(expr, starts, local):
+    """다중 시작점 최소점 (x, y, z) 또는 None"""
+    return remote_or_local("minimize", {"expr": expr, "starts": [list(map(float, s)) for s in starts]},
+                           lambda r: tuple(map(float, r["point"])) or None, local)
+
+
+def lr_sweep(expr, start, rate_range, steps, local):
+    """학습률 스윕 결과 dict"""
+    return remote_or_local("lr_sweep", {"expr": expr, "start": [float(start[0]), float(start[1])],
+                                        "rate_range": list(map(float, rate_range)), "steps": int(steps)},
+                           dict, local)
@@ -0,0 +1,126 @@
+# ============================================================
+#  로컬 계산 서비스 (표준 라이브러리 HTTP 서버 + 작업자 프로세스 풀)
+#  - 실행: python -m gdcore.compute_server --port 8765 --workers 4
+#    페이지 쪽은 GD_COMPUTE_URL=http://127.0.0.1:8765 로 연결 (gdcore.compute)
+#  - 요청 스레드(ThreadingHTTPServer)는 작업을 프로세스 풀에 넘기고 결과 바이트만 돌려줌
+#    → 계산은 GIL을 나눠 쓰지 않는 별도 프로세스에서, 작업자 수로 계산 용량을 UI와 따로 조절
+#  - 작업자는 spawn으로 시작 (요청 스레드가 도는 중에 fork하지 않음), 함수식 컴파일은 작업자별로 캐시
+#  - GET /health: 작업자 수·작업 목록·처리 수
+#  - 기본은 127.0.0.1에만 열림 (인증 없음 – 같은 호스트의 Streamlit 프로세스용)
+# ============================================================
+
+import argparse
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gdcore import compute
+
+HOST = os.environ.get("GD_COMPUTE_HOST", "127.0.0.1")
+PORT = int(os.environ.get("GD_COMPUTE_PORT", "8765"))
+WORKERS = int(os.environ.get("GD_COMPUTE_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+MAX_BODY = 1 << 20   # 요청 JSON 최대 크기 (바이트)
+
+
+class ComputeServer(ThreadingHTTPServer):
+    """작업자 프로세스 풀을 가진 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=WORKERS):
+        super().__init__(address, ComputeHandler)
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self.handled = 0
+        self.failed = 0
+        self._count_lock = threading.Lock()
+
+    def warm_up(self):
+        """작업자 프로세스를 미리 띄우고 모듈을 불러 둠 (첫 요청이 프로세스 시작을 기다리지 않도록)"""
+        for future in [self.pool.submit(compute.execute, "compile", {"expr": "x"}) for _ in range(self.workers)]:
+            future.result()
+
+    def count(self, ok):
+        with self._count_lock:
+            if ok:
+                self.handled += 1
+            else:
+                self.failed += 1
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+class ComputeHandler(BaseHTTPRequestHandler):
+    """POST /{작업} → npz, GET /health → JSON"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_json(404, {"error": "not found"})
+            return
+        self._send_json(200, {"ok": True, "workers": self.server.workers, "operations": list(compute.OPERATIONS),
+                              "handled": self.server.handled, "failed": self.server.failed})
+
+    def do_POST(self):
+        op = self.path.strip("/")
+        length = int(self.headers.get("Content-Length") or 0)
+        if op not in compute.OPERATIONS or length > MAX_BODY:
+            self.close_connection = True   # 읽지 않은 본문이 다음 요청으로 섞이지 않도록 연결을 닫음
+            if op not in compute.OPERATIONS:
+                self._send_json(404, {"error": f"알 수 없는 작업: {op}"})
+            else:
+                self._send_json(413, {"error": "요청이 너무 큽니다."})
+            return
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+            body = self.server.pool.submit(compute.execute, op, params).result()
+        except (ValueError, TypeError, KeyError) as e:
+            self.server.count(False)
+            self._send_json(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        except Exception as e:   # 작업 중 예외 (SymPy 파싱 오류 등)도 서비스는 계속 동작
+            self.server.count(False)
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self.server.count(True)
+        self._send(200, body, "application/octet-stream")
+
+    def log_message(self, format, *args):
+        pass   # 요청마다 로그를 남기지 않음
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="경사 하강 계산 서비스")
+    parser.add_argument("--host", default=HOST, help="수신 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=PORT, help="수신 포트")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="작업자 프로세스 수")
+    args = parser.parse_args(argv)
+    server = ComputeServer((args.host, args.port), args.workers)
+    server.warm_up()
+    print(f"계산 서비스: http://{args.host}:{server.server_address[1]} (작업자 {args.workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# ============================================================
+#  저사양 기기용 2D 보기: 채워진 등고선 + 기울기 화살표장 + 경사 하강 경로
+#  - 3D Surface(WebGL) 대신 2D Contour/Scatter만 사용해 브라우저 렌더링 부담을 줄임
+#  - 기울기 화살표는 축소(decimated) 격자에서 벡터화로 한 번에 계산하고
+#    모든 화살표를 NaN으로 구분한 하나의 선 트레이스로 그림
+#  - 경로 트레이스는 따로 만들어 스텝마다 고정 부분 그림에 바꿔 끼움
+# ============================================================
+
+import numpy as np
+import plotly.graph_objects as go
+
+from gdcore.functions import evaluate_on_grid
+
+# 카메라 옵션 목록(angle_options / CAMERA_ANGLES)에 추가되는 2D 보기 이름
+# (카메라 시점 값 대신 None을 사용해 2D 보기임을 표시)
+CONTOUR_VIEW_NAME = "2D 등고선 (경량)"
+
+# 경로에 따라 바뀌는 트레이스 표시 (고정 부분은 두고 이 트레이스만 교체)
+PATH_META = "gd_path"
+
+
+# 임계점 종류별 표시 (이름, 3D 기호, 2D 기호, 색)
+CRITICAL_STYLES = {
+    "minimum": ("최소점", "circle", "circle", "lime"),
+    "saddle": ("안장점", "x", "x", "gold"),
+    "maximum": ("최대점", "square", "square", "magenta"),
+    "degenerate": ("판정 불가 임계점", "circle-open", "circle-open", "white"),
+}
+
+
+def critical_point_traces(points, three_d=False):
+    """임계점 종류별 산점도 트레이스 (3D는 Scatter3d, 2D는 Scatter)"""
+    traces = []
+    for kind, (label, symbol_3d, symbol_2d, color) in CRITICAL_STYLES.items():
+        mask = points["kind"] == kind
+        if not mask.any():
+            continue
+        x, y, z = points["x"][mask], points["y"][mask], points["z"][mask]
+        marker = dict(size=7 if three_d else 11, color=color, line=dict(color="black", width=1),
+                      symbol=symbol_3d if three_d else symbol_2d)
+        hover = f"{label}<br>(%{{x:.3f}}, %{{y:.3f}})<br>f=%{{customdata:.4f}}<extra></extra>"
+        if three_d:
+            traces.append(go.Scatter3d(x=x, y=y, z=z, mode="markers", marker=marker, name=label,
+                                       customdata=z, hovertemplate=hover))
+        else:
+            traces.append(go.Scatter(x=x, y=y, mode="markers", marker=marker, name=label,
+                                     customdata=z, hovertemplate=hover))
+    return traces
+
+
+def gradient_field(X, Y, dx_np_func, dy_np_func, arrows_per_axis=16):
+    """표면 격자를 축소한 격자에서 기울기 (Xq, Yq, U, V) 계산"""
+    step_x = max(1, len(X) // arrows_per_axis)
+    step_y = max(1, len(Y) // arrows_per_axis)
+    Xq, Yq = np.meshgrid(np.asarray(X)[step_x // 2::step_x], np.asarray(Y)[step_y // 2::step_y])
+    with np.errstate(all="ignore"):
+        U = evaluate_on_grid(dx_np_func, Xq, Yq)
+        V = evaluate_on_grid(dy_np_func, Xq, Yq)
+    return Xq, Yq, U, V
+
+
+def quiver_segments(Xq, Yq, U, V, max_length, head_ratio=0.35, head_angle=np.pi / 7):
+    """화살표(몸통 + 머리 두 갈래)를 NaN으로 구분된 하나의 좌표열로 변환"""
+    mag = np.hypot(U, V)
+    valid = np.isfinite(mag) & (mag > 0)
+    if not valid.any():
+        return np.array([]), np.array([])
+
+    x0, y0 = Xq[valid], Yq[valid]
+    u, v, m = U[valid], V[valid], mag[valid]
+    # 크기 차이가 큰 함수도 보이도록 제곱근 스케일로 길이 조정
+    length = max_length * np.sqrt(m / m.max())
+    ux, uy = u / m, v / m
+    x1, y1 = x0 + ux * length, y0 + uy * length
+
+    head = length * head_ratio
+    angle = np.arctan2(uy, ux)
+    hx1 = x1 - head * np.cos(angle - head_angle)
+    hy1 = y1 - head * np.sin(angle - head_angle)
+    hx2 = x1 - head * np.cos(angle + head_angle)
+    hy2 = y1 - head * np.sin(angle + head_angle)
+
+    nan = np.full_like(x0, np.nan)
+    # 화살표 하나 = 시작 → 끝 → 머리1, NaN, 끝 → 머리2, NaN
+    xs = np.stack([x0, x1, hx1, nan, x1, hx2, nan], axis=1).ravel()
+    ys = np.stack([y0, y1, hy1, nan, y1, hy2, nan], axis=1).ravel()
+    return xs, ys
+
+
+def contour_base_figure(surface, dx_np_func, dy_np_func, min_point=None,
+                        title_text="경사 하강법 경로 및 등고선 (2D)", height=600,
+                        critical_points=None, overlay=None):
+    """경로를 뺀 2D 등고선·기울기장 그림 (overlay가 있으면 곡률 지도 위에 등고선만) – 경로는 replace_contour_path로 추가"""
+    X, Y, Z = surface
+    fig = go.Figure()
+
+    if overlay is not None:
+        fig.add_trace(go.Heatmap(
+            x=X, y=Y, z=overlay["values"], colorscale=overlay["colorscale"],
+            zmin=overlay["cmin"], zmax=overlay["cmax"], zsmooth="best", name=overlay["title"],
+            colorbar=dict(title=dict(text=overlay["title"], side="right"), thickness=14),
+            hovertemplate=f"x=%{{x:.2f}}<br>y=%{{y:.2f}}<br>{overlay['title']}=%{{z:.3g}}<extra></extra>"
+        ))
+
+    fig.add_trace(go.Contour(
+        x=X, y=Y, z=Z, ncontours=25,
+        colorscale="Viridis" if overlay is None else [[0, "black"], [1, "black"]],
+        contours=dict(coloring="fill" if overlay is None else "lines", showlines=True),
+        line=dict(width=0.5), showscale=False, name="등고선 f(x,y)",
+        hovertemplate="x=%{x:.2f}<br>y=%{y:.2f}<br>f=%{z:.3f}<extra></extra>"
+    ))
+
+    # 하강 방향(−∇f) 화살표장
+    Xq, Yq, U, V = gradient_field(X, Y, dx_np_func, dy_np_func)
+    cell = min(abs(X[-1] - X[0]) / max(Xq.shape[1], 1), abs(Y[-1] - Y[0]) / max(Xq.shape[0], 1))
+    qx, qy = quiver_segments(Xq, Yq, -U, -V, max_length=0.9 * cell)
+    if qx.size:
+        fig.add_trace(go.Scatter(
+            x=qx, y=qy, mode="lines", line=dict(color="white", width=1),
+            name="하강 방향 (−∇f)", hoverinfo="skip"
+        ))
+
+    if critical_points is not None:
+        fig.add_traces(critical_point_traces(critical_points))
+
+    if min_point:
+        min_x, min_y = min_point[0], min_point[1]
+        fig.add_trace(go.Scatter(
+            x=[min_x], y=[min_y], mode="markers",
+            marker=dict(size=13, color="cyan", symbol="diamond", line=dict(color="black", width=1)),
+            name="SciPy 최적점"
+        ))
+
+    fig.update_layout(
+        height=height, margin=dict(l=0, r=0, t=30, b=0),
+        title_text=title_text, title_x=0.5,
+        xaxis=dict(title="x", range=[X[0], X[-1]], constrain="domain"),
+        yaxis=dict(title="y", range=[Y[0], Y[-1]], scaleanchor="x", scaleratio=1),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def contour_path_traces(gd_path):
+    """2D 경사 하강 경로 + 현재 위치 트레이스 (meta=PATH_META)"""
+    if not gd_path:
+        return []
+    px, py = zip(*gd_path)
+    last_x, last_y = gd_path[-1]
+    return [
+        go.Scatter(
+            x=px, y=py, mode="lines+markers",
+            marker=dict(size=6, color="red"), line=dict(color="red", width=2),
+            name="경사 하강 경로",
+            text=[f"S{idx}" for idx in range(len(gd_path))],
+            hovertemplate="%{text}<br>(%{x:.3f}, %{y:.3f})<extra></extra>", meta=PATH_META
+        ),
+        go.Scatter(
+            x=[last_x], y=[last_y], mode="markers",
+            marker=dict(size=12, color="orange", line=dict(color="black", width=1)),
+            name="GD 현재 위치", meta=PATH_META
+        ),
+    ]
+
+
+def replace_contour_path(fig, gd_path):
+    """2D 그림의 경로 트레이스만 새 경로로 교체 (fig를 제자리에서 수정해 반환)"""
+    fig.data = [t for t in fig.data if t.meta != PATH_META]
+    fig.add_traces(contour_path_traces(gd_path))
+    return fig
+
+
+def plot_contour_view(surface, dx_np_func, dy_np_func, gd_path,
+                      min_point=None, title_text="경사 하강법 경로 및 등고선 (2D)", height=600,
+                      critical_points=None, overlay=None):
+    """캐시된 표면 격자로 2D 등고선·기울기장·경로 그림 생성 (overlay가 있으면 곡률 지도 위에 등고선만)"""
+    fig = contour_base_figure(surface, dx_np_func, dy_np_func, min_point, title_text, height,
+                              critical_points=critical_points, overlay=overlay)
+    return replace_contour_path(fig, gd_path)
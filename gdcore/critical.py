@@ -0,0 +1,133 @@
+# ============================================================
+#  임계점(∇f = 0) 찾기와 분류
+#  - 범위 안 성긴 격자의 모든 시작점에서 뉴턴 반복을 배열 연산으로 동시에 실행
+#    (2×2 헤세 행렬 방정식은 닫힌 식으로 풀어 점마다 반복문 없음)
+#  - 한 번에 너무 멀리 튀지 않도록 스텝 길이 제한, 범위를 크게 벗어난 점은 제외
+#  - 수렴한 근은 공간 해시(칸 정수 좌표 + 이웃 칸 확인)로 중복 제거
+#  - 헤세 행렬 고윳값 부호로 최소점·최대점·안장점(·평평해서 판정 불가) 분류
+# ============================================================
+
+import numpy as np
+
+from gdcore.functions import evaluate_on_grid
+
+SEEDS_PER_AXIS = 24        # 시작점 격자 (24×24 = 576개)
+NEWTON_ITERATIONS = 40
+GRAD_TOL = 1e-7            # |∇f| ≤ GRAD_TOL × (1 + 시작점 기울기 크기 중앙값) 이면 수렴
+MERGE_RATIO = 1e-4         # 범위 크기 × 이 값보다 가까운 근은 같은 임계점
+EIGEN_TOL = 1e-8           # |고윳값| ≤ EIGEN_TOL × (1 + 최대 |고윳값|) 이면 0으로 봄
+MAX_PER_KIND = 40          # 종류별 표시 개수 제한 (상수 함수처럼 모든 점이 임계점인 경우 등)
+
+KINDS = {
+    "minimum": "최소점",
+    "saddle": "안장점",
+    "maximum": "최대점",
+    "degenerate": "판정 불가 (평평)",
+}
+
+
+def hessian_on_grid(hessian, X, Y):
+    """헤세 행렬 성분 (f_xx, f_xy, f_yy)을 X, Y 모양으로 평가 (상수 성분도 같은 모양)"""
+    return tuple(evaluate_on_grid(lambda *_, part=part: part, X, Y) for part in hessian(X, Y))
+
+
+def hessian_eigenvalues(hxx, hxy, hyy):
+    """대칭 2×2 헤세 행렬의 고윳값 (작은 값, 큰 값) – 배열 연산"""
+    mean = (hxx + hyy) / 2.0
+    radius = np.hypot((hxx - hyy) / 2.0, hxy)
+    return mean - radius, mean + radius
+
+
+def classify(lam_min, lam_max):
+    """고윳값 부호로 임계점 종류 분류 (KINDS의 키 배열)"""
+    tol = EIGEN_TOL * (1.0 + np.maximum(np.abs(lam_min), np.abs(lam_max)))
+    kinds = np.full(np.shape(lam_min), "degenerate", dtype=object)
+    kinds[lam_min > tol] = "minimum"
+    kinds[lam_max < -tol] = "maximum"
+    kinds[(lam_min < -tol) & (lam_max > tol)] = "saddle"
+    return kinds
+
+
+def newton_roots(dx_np_func, dy_np_func, hessian, x_range, y_range,
+                 seeds=SEEDS_PER_AXIS, iterations=NEWTON_ITERATIONS):
+    """격자 시작점 전체에서 ∇f = 0 뉴턴 반복 → 범위 안에서 수렴한 점 (x, y, |∇f|)"""
+    (x0, x1), (y0, y1) = x_range, y_range
+    X, Y = (a.ravel() for a in np.meshgrid(np.linspace(x0, x1, seeds), np.linspace(y0, y1, seeds)))
+    span = max(x1 - x0, y1 - y0)
+    max_step = span / 4.0
+
+    with np.errstate(all="ignore"):
+        gx, gy = evaluate_on_grid(dx_np_func, X, Y), evaluate_on_grid(dy_np_func, X, Y)
+        grad_scale = np.nanmedian(np.hypot(gx, gy)) if np.isfinite(np.hypot(gx, gy)).any() else 0.0
+        for _ in range(iterations):
+            hxx, hxy, hyy = hessian_on_grid(hessian, X, Y)
+            det = hxx * hyy - hxy * hxy
+            sx = -(hyy * gx - hxy * gy) / det
+            sy = -(hxx * gy - hxy * gx) / det
+            length = np.hypot(sx, sy)
+            scale = np.where(np.isfinite(length) & (length > 0), np.minimum(1.0, max_step / length), 0.0)
+            X, Y = X + np.nan_to_num(sx * scale), Y + np.nan_to_num(sy * scale)
+            gx, gy = evaluate_on_grid(dx_np_func, X, Y), evaluate_on_grid(dy_np_func, X, Y)
+            if not np.any(length * scale > 1e-12 * span):
+                break  # 모든 점이 더 움직이지 않음
+
+        grad_norm = np.hypot(gx, gy)
+    margin = 1e-6 * span
+    keep = (
+        np.isfinite(grad_norm) & (grad_norm <= GRAD_TOL * (1.0 + grad_scale))
+        & (X >= x0 - margin) & (X <= x1 + margin) & (Y >= y0 - margin) & (Y <= y1 + margin)
+    )
+    return X[keep], Y[keep], grad_norm[keep]
+
+
+def deduplicate(x, y, grad_norm, cell):
+    """공간 해시로 중복 근 제거 → (대표 점 인덱스, 각 대표로 수렴한 시작점 수) – 기울기가 작은 점이 대표"""
+    order = np.argsort(grad_norm)
+    keys = np.floor(np.column_stack([x, y]) / cell).astype(np.int64)
+    buckets = {}
+    representatives, counts = [], []
+    for i in order:
+        kx, ky = keys[i]
+        match = None
+        for nx in (kx - 1, kx, kx + 1):
+            for ny in (ky - 1, ky, ky + 1):
+                for r in buckets.get((nx, ny), ()):
+                    if abs(x[i] - x[representatives[r]]) <= cell and abs(y[i] - y[representatives[r]]) <= cell:
+                        match = r
+                        break
+        if match is None:
+            buckets.setdefault((kx, ky), []).append(len(representatives))
+            representatives.append(i)
+            counts.append(1)
+        else:
+            counts[match] += 1
+    return np.array(representatives, dtype=int), np.array(counts, dtype=int)
+
+
+def find_critical_points(f_np_func, dx_np_func, dy_np_func, hessian, x_range, y_range,
+                         seeds=SEEDS_PER_AXIS, iterations=NEWTON_ITERATIONS):
+    """범위 안의 임계점 목록 {x, y, z, kind, eigenvalues, seeds} (종류 → 함숫값 순 정렬)"""
+    x_range, y_range = tuple(map(float, x_range)), tuple(map(float, y_range))
+    x, y, grad_norm = newton_roots(dx_np_func, dy_np_func, hessian, x_range, y_range, seeds, iterations)
+    span = max(x_range[1] - x_range[0], y_range[1] - y_range[0])
+    idx, counts = deduplicate(x, y, grad_norm, MERGE_RATIO * span)
+    x, y = x[idx], y[idx]
+
+    with np.errstate(all="ignore"):
+        z = evaluate_on_grid(f_np_func, x, y).astype(float)
+        lam_min, lam_max = hessian_eigenvalues(*hessian_on_grid(hessian, x, y))
+    kinds = classify(lam_min, lam_max)
+
+    rank = np.array([list(KINDS).index(k) for k in kinds], dtype=int)
+    order = np.lexsort((z, rank))
+    order = np.concatenate([order[rank[order] == r][:MAX_PER_KIND] for r in range(len(KINDS))]).astype(int)
+    return {
+        "x": x[order], "y": y[order], "z": z[order], "kind": kinds[order],
+        "eigenvalues": np.column_stack([lam_min, lam_max])[order], "seeds": counts[order],
+    }
+
+
+def summary_text(points):
+    """종류별 개수 요약 문자열 (예: '최소점 4 · 안장점 4 · 최대점 1')"""
+    counts = [(label, int(np.sum(points["kind"] == kind))) for kind, label in KINDS.items()]
+    return " · ".join(f"{label} {n}" for label, n in counts if n) or "범위 안에 임계점 없음"
@@ -0,0 +1,60 @@
+# ============================================================
+#  표면 격자 전체의 곡률 지도 (헤세 행렬 고윳값·조건수·기울기 크기)
+#  - 헤세 행렬 성분은 함수식마다 한 번 컴파일 (functions.compile_hessian – 작은 식은 기호 미분, 큰 식은 자동 미분 기울기의 중앙 차분)
+#  - 캐시된 표면 격자의 X, Y를 그대로 사용해 모든 값을 배열 연산으로 한 번에 계산
+#  - 조건수 κ = |λ|큰 / |λ|작은 : 클수록 골짜기가 길쭉해 경사 하강이 지그재그로 움직임
+#  - 고윳값은 0을 중심으로 한 발산형 색(음수 = 위로 볼록한 방향), 나머지는 log₁₀ 값
+# ============================================================
+
+import numpy as np
+
+from gdcore.critical import hessian_eigenvalues, hessian_on_grid
+from gdcore.functions import evaluate_on_grid
+
+CONDITION_CAP = 1e6    # 고윳값 하나가 0에 가까우면 조건수가 무한대 → 이 값에서 자름
+CLIP_PERCENTILE = 98   # 색 범위는 이 백분위수까지 (특이점 몇 개가 색을 모두 차지하지 않도록)
+
+# 지도 종류: (이름, 색 척도, 0 중심 발산형 여부)
+FIELDS = {
+    "lam_min": ("작은 고윳값 λ₁", "RdBu_r", True),
+    "lam_max": ("큰 고윳값 λ₂", "RdBu_r", True),
+    "condition": ("조건수 log₁₀ κ", "Plasma", False),
+    "grad_norm": ("기울기 크기 log₁₀ |∇f|", "Cividis", False),
+}
+
+
+def curvature_fields(dx_np_func, dy_np_func, hessian, X, Y):
+    """1차원 축 X, Y 위 격자의 {lam_min, lam_max, condition, grad_norm} 배열"""
+    Xs, Ys = np.meshgrid(X, Y)
+    with np.errstate(all="ignore"):
+        lam_min, lam_max = hessian_eigenvalues(*hessian_on_grid(hessian, Xs, Ys))
+        small = np.minimum(np.abs(lam_min), np.abs(lam_max))
+        large = np.maximum(np.abs(lam_min), np.abs(lam_max))
+        condition = np.where(large > 0, np.minimum(large / small, CONDITION_CAP), 1.0)
+        grad_norm = np.hypot(evaluate_on_grid(dx_np_func, Xs, Ys), evaluate_on_grid(dy_np_func, Xs, Ys))
+        return {
+            "lam_min": lam_min,
+            "lam_max": lam_max,
+            "condition": np.log10(condition),
+            "grad_norm": np.log10(np.maximum(grad_norm, 1e-12)),
+        }
+
+
+def color_range(name, values):
+    """지도의 색 범위 (cmin, cmax) – 발산형은 0을 가운데로"""
+    finite = values[np.isfinite(values)]
+    if not finite.size:
+        return 0.0, 1.0
+    if FIELDS[name][2]:
+        bound = float(np.percentile(np.abs(finite), CLIP_PERCENTILE)) or 1.0
+        return -bound, bound
+    low, high = (float(v) for v in np.percentile(finite, [100 - CLIP_PERCENTILE, CLIP_PERCENTILE]))
+    return low, high if high - low > 1e-9 else low + 1.0
+
+
+def overlay_spec(name, fields):
+    """plot_gd에 넘길 겹쳐 그리기 정보 {title, values, colorscale, cmin, cmax}"""
+    values = fields[name]
+    title, colorscale, _ = FIELDS[name]
+    cmin, cmax = color_range(name, values)
+    return dict(title=title, values=values, colorscale=colorscale, cmin=cmin, cmax=cmax)
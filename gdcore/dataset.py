@@ -0,0 +1,182 @@
+# ============================================================
+#  데이터셋으로 정의되는 손실의 미니배치 경사 하강 (매개변수 2개: w, b)
+#  - CSV(수백만 행 가능)를 조각 단위로 읽어 float32 (N, 2) 파일로 변환 → np.memmap으로 사용
+#  - 미니배치는 에폭마다 행 번호 전체를 섞어 batch_size개씩 나눔 (마지막 남는 행도 한 배치)
+#    배치 안의 행 번호는 정렬해서 읽음 → memmap을 앞에서 뒤로 훑음 (메모리에는 배치 하나 + 행 번호 순열)
+#  - x는 표준화, 선형 회귀의 y도 표준화 → w, b가 데이터 단위와 무관하게 비슷한 범위
+#  - 손실·기울기는 배치 전체를 한 번에 계산하는 벡터 연산 (표면 계산은 loss_surface.py)
+# ============================================================
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+DATASET_DIR = os.environ.get("GD_DATASET_DIR", os.path.join(".cache", "datasets"))
+FORMAT_VERSION = 1
+IMPORT_CHUNK_ROWS = 200_000
+
+MODELS = {
+    "linear": "선형 회귀 (평균제곱오차)",
+    "logistic": "로지스틱 회귀 (교차 엔트로피)",
+}
+
+
+# ----- 1. 저장 형식 -----
+def _write_meta(directory, meta):
+    """meta.json 원자적 저장 (데이터 파일을 다 쓴 뒤 마지막에 기록)"""
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".json.tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(directory, "meta.json"))
+
+
+def _write_chunks(directory, chunks, source):
+    """(x, y) 조각들을 data.f32 에 이어 쓰고 통계와 함께 meta 기록"""
+    os.makedirs(directory, exist_ok=True)
+    n_rows, sums, sq_sums, binary = 0, np.zeros(2), np.zeros(2), True
+    with open(os.path.join(directory, "data.f32"), "wb") as f:
+        for x, y in chunks:
+            block = np.column_stack([x, y]).astype(np.float32)
+            block = block[np.isfinite(block).all(axis=1)]
+            block.tofile(f)
+            n_rows += len(block)
+            sums += block.sum(axis=0, dtype=float)
+            sq_sums += np.square(block, dtype=float).sum(axis=0)
+            binary = binary and bool(np.isin(block[:, 1], (0.0, 1.0)).all())
+    if n_rows == 0:
+        raise ValueError("숫자로 된 행이 없습니다.")
+    mean = sums / n_rows
+    std = np.sqrt(np.maximum(sq_sums / n_rows - mean ** 2, 0.0))
+    meta = {
+        "format": FORMAT_VERSION, "n_rows": n_rows, "source": source,
+        "mean": mean.tolist(), "std": np.where(std > 0, std, 1.0).tolist(),
+        "task": "logistic" if binary else "linear",
+    }
+    _write_meta(directory, meta)
+    return Dataset.open(directory)
+
+
+def import_csv(source, x_column, y_column, root=DATASET_DIR):
+    """CSV 파일(경로 또는 업로드 파일 객체)의 두 열을 memmap 데이터셋으로 변환 (이미 있으면 재사용)"""
+    digest = hashlib.sha256(f"{x_column}\n{y_column}\nformat={FORMAT_VERSION}\n".encode("utf-8"))
+    fh = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        fh.seek(0)
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+        directory = os.path.join(root, digest.hexdigest()[:20])
+        existing = Dataset.open(directory)
+        if existing is not None:
+            return existing
+        fh.seek(0)
+        reader = pd.read_csv(fh, usecols=[x_column, y_column], chunksize=IMPORT_CHUNK_ROWS)
+        chunks = (
+            (pd.to_numeric(c[x_column], errors="coerce").to_numpy(), pd.to_numeric(c[y_column], errors="coerce").to_numpy())
+            for c in reader
+        )
+        return _write_chunks(directory, chunks, f"csv:{x_column}→{y_column}")
+    finally:
+        if fh is not source:
+            fh.close()
+
+
+def make_synthetic(task, n_rows, noise=1.0, seed=0, root=DATASET_DIR):
+    """예시 데이터셋 (선형: y = 3x + 2 + 잡음, 로지스틱: P(y=1) = σ(2x - 1)) – 조각 단위 생성"""
+    directory = os.path.join(root, f"synthetic-{task}-{int(n_rows)}-{float(noise)!r}-{int(seed)}")
+    existing = Dataset.open(directory)
+    if existing is not None:
+        return existing
+
+    def chunks():
+        for i, start in enumerate(range(0, n_rows, IMPORT_CHUNK_ROWS)):
+            rng = np.random.default_rng([seed, i])
+            m = min(IMPORT_CHUNK_ROWS, n_rows - start)
+            x = rng.normal(1.0, 2.0, m)
+            if task == "logistic":
+                y = (rng.random(m) < 1.0 / (1.0 + np.exp(-(2.0 * x - 1.0) / max(noise, 1e-3)))).astype(float)
+            else:
+                y = 3.0 * x + 2.0 + rng.normal(0.0, noise, m)
+            yield x, y
+
+    return _write_chunks(directory, chunks(), f"synthetic:{task}")
+
+
+class Dataset:
+    """memmap (N, 2) float32 데이터셋 [x, y] + 표준화 통계"""
+
+    def __init__(self, directory, meta):
+        self.directory = directory
+        self.meta = meta
+        self.n_rows = meta["n_rows"]
+        self.data = np.memmap(os.path.join(directory, "data.f32"), dtype=np.float32, mode="r",
+                              shape=(self.n_rows, 2))
+
+    @classmethod
+    def open(cls, directory):
+        """저장된 데이터셋 열기 (없거나 형식이 다르면 None)"""
+        try:
+            with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("format") != FORMAT_VERSION:
+            return None
+        return cls(directory, meta)
+
+    def standardize(self, block, model):
+        """행 블록 → 표준화된 (x, y) float64 (로지스틱이면 y는 0/1 그대로)"""
+        block = np.asarray(block, dtype=float)
+        mean, std = self.meta["mean"], self.meta["std"]
+        x = (block[:, 0] - mean[0]) / std[0]
+        y = block[:, 1] if model == "logistic" else (block[:, 1] - mean[1]) / std[1]
+        return x, y
+
+    def iter_standardized(self, model, rows=IMPORT_CHUNK_ROWS):
+        """전체 행을 조각 단위로 읽어 표준화된 (x, y) 생성"""
+        for start in range(0, self.n_rows, rows):
+            yield self.standardize(self.data[start:start + rows], model)
+
+
+# ----- 2. 손실과 기울기 -----
+def loss_and_grad(model, w, b, x, y):
+    """배치 평균 손실과 (∂L/∂w, ∂L/∂b)"""
+    z = w * x + b
+    if model == "logistic":
+        r = 1.0 / (1.0 + np.exp(-z)) - y
+        loss = np.mean(np.logaddexp(0.0, z) - y * z)
+        return loss, np.mean(r * x), np.mean(r)
+    r = z - y
+    return np.mean(r * r), 2.0 * np.mean(r * x), 2.0 * np.mean(r)
+
+
+# ----- 3. 미니배치 경사 하강 -----
+def iter_minibatches(dataset, model, batch_size, seed=0):
+    """에폭마다 행 전체를 섞어 batch_size개씩 끝없이 생성 → 표준화된 (x, y) (에폭의 마지막 배치는 더 작을 수 있음)"""
+    rng = np.random.default_rng(seed)
+    order = np.arange(dataset.n_rows, dtype=np.int64 if dataset.n_rows > np.iinfo(np.int32).max else np.int32)
+    while True:
+        rng.shuffle(order)
+        for start in range(0, dataset.n_rows, batch_size):
+            rows = np.sort(order[start:start + batch_size])   # 파일 순서대로 읽기
+            yield dataset.standardize(dataset.data[rows], model)
+
+
+def sgd_trajectory(dataset, model, start, learning_rate, steps, batch_size, seed=0):
+    """미니배치 경사 하강 경로 (path[steps+1, 2], 배치 손실[steps])"""
+    batches = iter_minibatches(dataset, model, batch_size, seed)
+    path = np.empty((steps + 1, 2))
+    batch_losses = np.empty(steps)
+    w, b = path[0] = start
+    with np.errstate(all="ignore"):
+        for t in range(steps):
+            x, y = next(batches)
+            batch_losses[t], gw, gb = loss_and_grad(model, w, b, x, y)
+            w, b = w - learning_rate * gw, b - learning_rate * gb
+            path[t + 1] = w, b
+            if not (np.isfinite(w) and np.isfinite(b)):
+                return path[:t + 2], batch_losses[:t + 1]
+    return path, batch_losses
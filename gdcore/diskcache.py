@@ -0,0 +1,115 @@
+# ============================================================
+#  디스크 기반 컴파일 함수 캐시 (서버 재시작·복제 서버 간 공유)
+#  - lambdify가 생성한 f, ∂f/∂x, ∂f/∂y 소스 코드를 JSON 파일로 저장
+#  - 다시 불러올 때는 sympify·diff·lambdify 없이 소스를 exec 해 함수 복원
+#  - 키: 정규화한 함수식 + sympy/numpy 버전 + 저장 형식 + 기울기 방식
+#  - 임시 파일에 쓴 뒤 os.replace로 교체 → 같은 호스트의 여러 프로세스가 안전하게 공유
+# ============================================================
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+import numpy as np
+import sympy
+from sympy import lambdify
+
+from gdcore import functions
+from gdcore.autodiff import DualGradient
+
+# 캐시 디렉터리 (빈 문자열이면 디스크 캐시 끔)
+CACHE_DIR = os.environ.get("GD_CACHE_DIR", os.path.join(".cache", "compiled"))
+FORMAT_VERSION = 1
+
+# lambdify가 생성 코드에 제공하는 이름공간 (numpy 함수 + 페이지 공통 대체 함수)
+_NAMESPACE = dict(lambdify((functions.X_SYM, functions.Y_SYM), functions.X_SYM,
+                           modules=functions.NUMPY_MODULES).__globals__)
+
+
+def canonical_expression(func_input):
+    """공백을 제거한 함수식 (sympify 없이 계산 가능한 정규형)"""
+    return "".join(str(func_input).split())
+
+
+def cache_key(func_input, gradient_mode=None):
+    """함수식·라이브러리 버전·저장 형식·기울기 방식으로 만든 캐시 키"""
+    mode = gradient_mode or functions.GRADIENT_MODE
+    parts = [canonical_expression(func_input), f"sympy={sympy.__version__}", f"numpy={np.__version__}",
+             f"format={FORMAT_VERSION}", f"gradient={mode}:f{functions.FUNCTION_OPS_THRESHOLD}"]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+
+def _function_entry(fn):
+    """컴파일된 함수 → 저장 항목 (자동 미분은 방식만, lambdify 함수는 소스 코드)"""
+    if isinstance(getattr(fn, "__self__", None), DualGradient):
+        return {"kind": "autodiff", "part": fn.__name__}
+    code = fn.__code__
+    if code.co_freevars or any(name not in _NAMESPACE for name in code.co_names):
+        return None  # 이름공간 밖의 상수·함수를 참조하면 복원할 수 없으므로 저장하지 않음
+    return {"kind": "source", "name": fn.__name__, "source": inspect.getsource(fn)}
+
+
+def _restore_function(entry, func_input, dual_cache):
+    """저장 항목 → 함수"""
+    if entry["kind"] == "autodiff":
+        if "dual" not in dual_cache:
+            dual_cache["dual"] = DualGradient(func_input)
+        return getattr(dual_cache["dual"], entry["part"])
+    namespace = dict(_NAMESPACE)
+    exec(compile(entry["source"], "<gd-compiled-cache>", "exec"), namespace)
+    return namespace[entry["name"]]
+
+
+def load_compiled(func_input, gradient_mode=None, cache_dir=CACHE_DIR):
+    """디스크 캐시에서 (f, ∂f/∂x, ∂f/∂y) 복원 (없거나 손상되면 None)"""
+    if not cache_dir:
+        return None
+    path = _cache_path(cache_key(func_input, gradient_mode), cache_dir)
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("expr") != canonical_expression(func_input):
+            return None
+        dual_cache = {}
+        return tuple(_restore_function(entry, func_input, dual_cache) for entry in payload["functions"])
+    except Exception:
+        return None  # 없거나 손상된 파일은 새로 컴파일 (다음 저장 시 덮어씀)
+
+
+def store_compiled(func_input, compiled, gradient_mode=None, cache_dir=CACHE_DIR):
+    """(f, ∂f/∂x, ∂f/∂y) 소스를 원자적으로 디스크에 저장 (실패해도 예외 없음)"""
+    if not cache_dir:
+        return False
+    entries = [_function_entry(fn) for fn in compiled]
+    if any(entry is None for entry in entries):
+        return False
+    payload = {"expr": canonical_expression(func_input), "functions": entries}
+    path = _cache_path(cache_key(func_input, gradient_mode), cache_dir)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except OSError:
+        return False
+
+
+def load_or_compile(func_input, gradient_mode=None, cache_dir=CACHE_DIR):
+    """디스크 캐시를 먼저 확인하고, 없으면 컴파일 후 저장"""
+    compiled = load_compiled(func_input, gradient_mode, cache_dir)
+    if compiled is None:
+        compiled = functions.compile_function(func_input, gradient_mode)
+        store_compiled(func_input, compiled, gradient_mode, cache_dir)
+    return compiled
@@ -0,0 +1,45 @@
+# ============================================================
+#  fragment 단위 재실행 도우미 (st.fragment)
+#  - 버튼·그래프·분석 영역을 fragment로 묶으면 그 안의 위젯 클릭은 해당 fragment만 다시 실행
+#    → 사이드바, 함수 컴파일, SciPy 탐색 등 나머지 스크립트는 다시 돌지 않음
+#  - fragment만 다시 실행될 때는 페이지 타이머가 돌지 않으므로 fragment 전용 타이머로 따로 기록
+#  - 그림의 고정 부분(표면·등고선 등)은 세션에 보관하고 스텝마다 경로 트레이스만 교체
+# ============================================================
+
+from contextlib import contextmanager
+
+import streamlit as st
+
+from gdcore.timing import RerunTimer
+
+
+def fragment_rerun():
+    """지금 실행이 fragment만 다시 실행하는 중인지 (전체 재실행이면 False)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return bool(ctx and ctx.fragment_ids_this_run)
+    except Exception:
+        return False
+
+
+@contextmanager
+def fragment_timer(page, timer):
+    """fragment 본문용 타이머 – 전체 재실행 중이면 페이지 타이머, fragment만 다시 실행 중이면 새 타이머(따로 기록)"""
+    if not fragment_rerun():
+        yield timer
+        return
+    own = RerunTimer(page)
+    try:
+        yield own
+    finally:
+        own.finish()
+
+
+def session_figure(slot, key, build):
+    """세션에 보관한 고정 부분 그림 (key가 바뀔 때만 build()로 다시 만듦) – 세션 전용이라 제자리 수정 가능"""
+    cached = st.session_state.get(slot)
+    if cached is None or cached[0] != key:
+        cached = (key, build())
+        st.session_state[slot] = cached
+    return cached[1]
@@ -0,0 +1,89 @@
+# ============================================================
+#  함수식 → NumPy 함수 변환 및 표면 격자 계산
+# ============================================================
+
+import os
+
+import numpy as np
+from sympy import count_ops, diff, sympify, lambdify
+
+from gdcore.autodiff import X_SYM, Y_SYM, DualGradient
+
+# 모든 페이지에서 사용하는 lambdify 모듈 설정
+NUMPY_MODULES = ['numpy', {'cos': np.cos, 'sin': np.sin, 'exp': np.exp, 'sqrt': np.sqrt, 'pi': np.pi}]
+
+# 기울기 계산 방식: "auto"(함수식 크기로 선택) / "symbolic" / "autodiff"
+GRADIENT_MODE = os.environ.get("GD_GRADIENT_MODE", "auto")
+# auto: 함수식 자체의 연산 수(미분하기 전, count_ops)가 이 값을 넘을 때만 자동 미분 사용
+# bench_autodiff 측정 – 연산 수 24 이하는 기호 미분이 한 스텝(∂x, ∂y 평가)도 빠르고, 33부터 자동 미분이 빠름
+FUNCTION_OPS_THRESHOLD = 30
+# 큰 함수식의 헤세 행렬: 자동 미분 기울기의 중앙 차분 간격 (|x|, |y| 가 1보다 크면 그 배수)
+HESSIAN_FD_STEP = 6e-6
+
+
+def compile_function(func_input, gradient_mode=None):
+    """함수 문자열로부터 (f, ∂f/∂x, ∂f/∂y) NumPy 함수 생성 (파싱 실패 시 예외 발생)"""
+    mode = gradient_mode or GRADIENT_MODE
+    f_sym = sympify(func_input)
+    f_np = lambdify((X_SYM, Y_SYM), f_sym, modules=NUMPY_MODULES)
+
+    if mode == "symbolic" or (mode == "auto" and count_ops(f_sym) <= FUNCTION_OPS_THRESHOLD):
+        dx_np = lambdify((X_SYM, Y_SYM), diff(f_sym, X_SYM), modules=NUMPY_MODULES)
+        dy_np = lambdify((X_SYM, Y_SYM), diff(f_sym, Y_SYM), modules=NUMPY_MODULES)
+        return f_np, dx_np, dy_np
+
+    # 함수식이 큰 경우: 도함수 식을 만들지 않고 식 트리에서 바로 전진 모드 자동 미분 (지원하지 않는 연산은 기호 미분)
+    try:
+        dual = DualGradient(f_sym)
+    except NotImplementedError:
+        dx_np = lambdify((X_SYM, Y_SYM), diff(f_sym, X_SYM), modules=NUMPY_MODULES)
+        dy_np = lambdify((X_SYM, Y_SYM), diff(f_sym, Y_SYM), modules=NUMPY_MODULES)
+        return f_np, dx_np, dy_np
+    return f_np, dual.dx, dual.dy
+
+
+def compile_hessian(func_input, gradient_mode=None):
+    """함수 문자열로부터 헤세 행렬 성분 (x, y) ↦ (f_xx, f_xy, f_yy) NumPy 함수 생성 (공통 부분식은 한 번만 계산)
+    기울기와 같은 크기 규칙: 큰 함수식은 두 번 미분하지 않고 자동 미분 기울기의 중앙 차분으로 근사"""
+    mode = gradient_mode or GRADIENT_MODE
+    f_sym = sympify(func_input)
+    if mode != "symbolic" and not (mode == "auto" and count_ops(f_sym) <= FUNCTION_OPS_THRESHOLD):
+        try:
+            return _difference_hessian(DualGradient(f_sym))
+        except NotImplementedError:
+            pass
+    dx_sym, dy_sym = diff(f_sym, X_SYM), diff(f_sym, Y_SYM)
+    parts = [diff(dx_sym, X_SYM), diff(dx_sym, Y_SYM), diff(dy_sym, Y_SYM)]
+    return lambdify((X_SYM, Y_SYM), parts, modules=NUMPY_MODULES, cse=True)
+
+
+def _difference_hessian(dual):
+    """기울기의 야코비안을 중앙 차분으로 구하는 헤세 행렬 함수 (기울기 4번 평가, f_xy는 두 방향 평균)"""
+    def hessian(x, y):
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        hx = HESSIAN_FD_STEP * np.maximum(1.0, np.abs(x))
+        hy = HESSIAN_FD_STEP * np.maximum(1.0, np.abs(y))
+        _, gx_xp, gy_xp = dual.value_and_grad(x + hx, y)
+        _, gx_xm, gy_xm = dual.value_and_grad(x - hx, y)
+        _, gx_yp, gy_yp = dual.value_and_grad(x, y + hy)
+        _, gx_ym, gy_ym = dual.value_and_grad(x, y - hy)
+        f_xy = 0.5 * ((gy_xp - gy_xm) / (2.0 * hx) + (gx_yp - gx_ym) / (2.0 * hy))
+        return [(gx_xp - gx_xm) / (2.0 * hx), f_xy, (gy_yp - gy_ym) / (2.0 * hy)]
+    return hessian
+
+
+def evaluate_on_grid(func, Xs, Ys):
+    """격자 위에서 함수 평가 (상수 함수도 격자 모양으로 맞춤)"""
+    return np.broadcast_to(np.asarray(func(Xs, Ys), dtype=float), Xs.shape)
+
+
+def evaluate_surface(f_np_func, x_range, y_range, resolution=80):
+    """함수 표면 격자 (X, Y, Z) 계산 (평가 실패 시 Z는 0)"""
+    X = np.linspace(x_range[0], x_range[1], resolution)
+    Y = np.linspace(y_range[0], y_range[1], resolution)
+    Xs, Ys = np.meshgrid(X, Y)
+    try:
+        Z = np.array(evaluate_on_grid(f_np_func, Xs, Ys))
+    except Exception:
+        Z = np.zeros_like(Xs)
+    return X, Y, Z
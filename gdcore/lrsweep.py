@@ -0,0 +1,70 @@
+# ============================================================
+#  학습률 스윕: 학습률을 배열의 한 축으로 두고 같은 시작점에서 동시에 경사 하강
+#  - 학습률 수백 개 × 스텝 수를 반복문 한 번(스텝 축)으로 계산, 학습률 축은 배열 연산
+#  - 학습률마다 최종 함숫값, 처음으로 |∇f| < 수렴 기준이 된 스텝, 발산 여부 기록
+#  - 안정성 한계 2/λmax: 시작점·도착점의 헤세 행렬 최대 고윳값으로 계산
+#    (이차 함수라면 이보다 큰 학습률은 가장 가파른 방향으로 진동하며 발산)
+# ============================================================
+
+import numpy as np
+
+from gdcore.critical import hessian_eigenvalues, hessian_on_grid
+from gdcore.functions import evaluate_on_grid
+
+RATE_COUNT = 300
+CONVERGE_TOL = 1e-2     # 04_C 페이지의 "최적점 근접" 판정과 같은 기울기 크기 기준
+DIVERGE_LIMIT = 1e8     # 좌표가 이보다 커지면 발산으로 보고 더 계산하지 않음
+
+
+def rate_grid(low, high, count=RATE_COUNT):
+    """[low, high] 로그 간격 학습률 배열"""
+    return np.geomspace(low, high, count)
+
+
+def sweep_learning_rates(f_np_func, dx_np_func, dy_np_func, start, rates, steps, tol=CONVERGE_TOL):
+    """학습률별 {final_loss, converge_step, diverged, final_x, final_y} (수렴 못 하면 converge_step = NaN)"""
+    rates = np.asarray(rates, dtype=float)
+    X = np.full(rates.shape, float(start[0]))
+    Y = np.full(rates.shape, float(start[1]))
+    converge_step = np.full(rates.shape, np.nan)
+    diverged = np.zeros(rates.shape, dtype=bool)
+
+    with np.errstate(all="ignore"):
+        for step in range(steps + 1):
+            gx, gy = evaluate_on_grid(dx_np_func, X, Y), evaluate_on_grid(dy_np_func, X, Y)
+            grad_norm = np.hypot(gx, gy)
+            newly = np.isnan(converge_step) & (grad_norm < tol)
+            converge_step[newly] = step
+            diverged |= ~np.isfinite(grad_norm) | (np.maximum(np.abs(X), np.abs(Y)) > DIVERGE_LIMIT)
+            if step == steps or diverged.all():
+                break
+            # 발산한 학습률은 그 자리에 멈춤 (inf·NaN이 더 퍼지지 않도록)
+            move = np.where(diverged, 0.0, rates)
+            X = X - move * np.nan_to_num(gx)
+            Y = Y - move * np.nan_to_num(gy)
+        final_loss = evaluate_on_grid(f_np_func, X, Y).astype(float)
+
+    diverged |= ~np.isfinite(final_loss)
+    final_loss[diverged] = np.nan
+    converge_step[diverged] = np.nan
+    return {"rates": rates, "final_loss": final_loss, "converge_step": converge_step,
+            "diverged": diverged, "final_x": X, "final_y": Y}
+
+
+def stability_limit(hessian, point):
+    """점 (x, y)의 헤세 행렬로 구한 안정성 한계 2/λmax (λmax ≤ 0이면 None – 그 점 근처는 아래로 볼록하지 않음)"""
+    x, y = (np.array([float(v)]) for v in point)
+    with np.errstate(all="ignore"):
+        lam_max = float(hessian_eigenvalues(*hessian_on_grid(hessian, x, y))[1][0])
+    if not np.isfinite(lam_max) or lam_max <= 0:
+        return None
+    return 2.0 / lam_max
+
+
+def best_index(sweep):
+    """가장 빨리 수렴한 학습률의 인덱스 (같으면 최종 함숫값이 작은 쪽), 수렴한 학습률이 없으면 None"""
+    steps = sweep["converge_step"]
+    if np.all(np.isnan(steps)):
+        return None
+    candidates = np.flatnonzero(steps == np.nanmin(steps))
+    return int(candidates[np.nanargmin(sweep["final_loss"][candidates])])
@@ -0,0 +1,233 @@
+# ============================================================
+#  n차원 경사 하강 엔진 f(x1..xn)
+#  - 위치는 (시작점 수 B, 차원 n) 배열 하나 → 모든 시작점의 한 스텝이 행렬 연산 한 번
+#    B·n이 크면 캐시에 맞는 크기(BATCH_CHUNK_ELEMENTS)의 시작점 묶음으로 나눠 차례로 계산
+#    (n=20000, B=64에서 한 번에 계산하면 시작점별 반복보다 느림 – bench_ndim)
+#  - 문제는 value(X) / value_and_grad(X) 를 가진 객체 (해석적 기울기, 차원 수천에서도 O(B·n))
+#  - 사용자 식(x1, x2, ...)은 sympy 기울기를 쓰므로 낮은 차원에서만 사용
+#  - 경로는 최대 max_records 시점, 전체 PATH_MEMORY_BYTES 이하로만 기록 (B·n이 크면 더 성기게)
+#    좌표 단면 / PCA 평면으로 투영해 2D로 표시
+# ============================================================
+
+import re
+
+import numpy as np
+from sympy import diff, lambdify, symbols, sympify
+
+from gdcore.functions import NUMPY_MODULES
+
+MAX_EXPRESSION_DIM = 20     # 사용자 식 문제의 최대 차원 (기호 미분 비용)
+PLANE_CHUNK_ROWS = 1024     # 평면 격자 평가 시 한 번에 계산하는 점 수 (메모리 상한)
+BATCH_CHUNK_ELEMENTS = 1 << 15   # 한 번에 계산하는 시작점 묶음의 원소 수 상한 (B·n, 배열 하나 256KB)
+PATH_MEMORY_BYTES = 32 << 20     # 기록 경로(float32) 전체 크기 상한
+MIN_PATH_RECORDS = 10            # 메모리 상한과 관계없이 남기는 최소 기록 시점 수
+
+
+# ----- 1. 문제 정의 -----
+class IllConditionedQuadratic:
+    """f(x) = ½ Σ λ_i (Qᵀx)_i² – 고윳값 1..κ 로그 간격, Q는 Householder 반사 곱 (최소점 0)"""
+
+    def __init__(self, n, condition=100.0, reflections=4, seed=0):
+        self.n = int(n)
+        self.condition = float(condition)
+        self.eigenvalues = np.geomspace(1.0, self.condition, self.n)
+        # 조밀한 n×n 회전 행렬 대신 반사 몇 개의 곱 → 적용 비용 O(n)
+        rng = np.random.default_rng(seed)
+        vecs = rng.standard_normal((min(reflections, self.n), self.n)) if self.n > 1 else np.zeros((0, 1))
+        self._reflections = vecs / np.linalg.norm(vecs, axis=1, keepdims=True) if len(vecs) else vecs
+        self.minimum = np.zeros(self.n)
+        self.lipschitz = float(self.eigenvalues[-1])
+
+    def _rotate(self, X, reverse=False):
+        """X @ Q (reverse=True 이면 X @ Qᵀ)"""
+        Y = X
+        for u in (self._reflections[::-1] if reverse else self._reflections):
+            Y = Y - 2.0 * np.outer(Y @ u, u)
+        return Y
+
+    def eigen_coordinates(self, X):
+        """고유벡터 좌표 Qᵀx (방향별로 얼마나 남았는지 확인용)"""
+        return self._rotate(np.atleast_2d(X))
+
+    def value(self, X):
+        Y = self._rotate(X)
+        return 0.5 * np.einsum("bi,bi->b", Y, Y * self.eigenvalues)
+
+    def value_and_grad(self, X):
+        Y = self._rotate(X)
+        LY = Y * self.eigenvalues
+        return 0.5 * np.einsum("bi,bi->b", Y, LY), self._rotate(LY, reverse=True)
+
+
+class Rosenbrock:
+    """확장 Rosenbrock Σ 100(x_{i+1} - x_i²)² + (1 - x_i)² (최소점 (1, ..., 1))"""
+
+    def __init__(self, n):
+        self.n = int(n)
+        self.minimum = np.ones(self.n)
+        self.lipschitz = None
+
+    def value(self, X):
+        d = X[:, 1:] - X[:, :-1] ** 2
+        return np.sum(100.0 * d ** 2 + (1.0 - X[:, :-1]) ** 2, axis=1)
+
+    def value_and_grad(self, X):
+        head = X[:, :-1]
+        d = X[:, 1:] - head ** 2
+        G = np.zeros_like(X)
+        G[:, :-1] = -400.0 * head * d - 2.0 * (1.0 - head)
+        G[:, 1:] += 200.0 * d
+        return np.sum(100.0 * d ** 2 + (1.0 - head) ** 2, axis=1), G
+
+
+class Rastrigin:
+    """Rastrigin 10n + Σ (x_i² - 10 cos 2πx_i) (지역 최소점이 차원에 따라 지수적으로 늘어남)"""
+
+    def __init__(self, n):
+        self.n = int(n)
+        self.minimum = np.zeros(self.n)
+        self.lipschitz = 2.0 + 40.0 * np.pi ** 2
+
+    def value(self, X):
+        return 10.0 * self.n + np.sum(X ** 2 - 10.0 * np.cos(2.0 * np.pi * X), axis=1)
+
+    def value_and_grad(self, X):
+        value = 10.0 * self.n + np.sum(X ** 2 - 10.0 * np.cos(2.0 * np.pi * X), axis=1)
+        return value, 2.0 * X + 20.0 * np.pi * np.sin(2.0 * np.pi * X)
+
+
+class ExpressionProblem:
+    """사용자 식 f(x1, ..., xn) – sympy 기울기 (차원은 식에 쓰인 가장 큰 xk 번호)"""
+
+    def __init__(self, func_input):
+        indices = [int(m) for m in re.findall(r"\bx(\d+)\b", func_input)]
+        if not indices or min(indices) < 1:
+            raise ValueError("x1, x2, ... 형태의 변수를 사용해 주세요.")
+        self.n = max(indices)
+        if self.n > MAX_EXPRESSION_DIM:
+            raise ValueError(f"사용자 식은 {MAX_EXPRESSION_DIM}차원까지 지원합니다.")
+        syms = symbols(f"x1:{self.n + 1}")
+        f_sym = sympify(func_input, locals={str(s): s for s in syms})
+        unknown = getattr(f_sym, "free_symbols", set()) - set(syms)
+        if unknown:
+            names = ", ".join(sorted(str(s) for s in unknown))
+            raise ValueError(f"x1, x2, ... 외의 변수({names})는 사용할 수 없습니다.")
+        self._f = lambdify(syms, f_sym, modules=NUMPY_MODULES)
+        self._grads = lambdify(syms, [diff(f_sym, s) for s in syms], modules=NUMPY_MODULES, cse=True)
+        self.minimum = None
+        self.lipschitz = None
+
+    def value(self, X):
+        return np.broadcast_to(np.asarray(self._f(*X.T), dtype=float), X.shape[:1])
+
+    def value_and_grad(self, X):
+        grads = [np.broadcast_to(np.asarray(g, dtype=float), X.shape[:1]) for g in self._grads(*X.T)]
+        return self.value(X), np.stack(grads, axis=1)
+
+
+# ----- 2. 경사 하강 -----
+def random_starts(n, count, radius=2.0, seed=0, center=None):
+    """반지름 radius 구면 위의 무작위 시작점 count개 (center 기준)"""
+    rng = np.random.default_rng(seed)
+    dirs = rng.standard_normal((count, n))
+    dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+    return (0.0 if center is None else np.asarray(center, dtype=float)) + radius * dirs
+
+
+def _descend_chunk(problem, X, learning_rate, steps, momentum, record_steps, path, values, grad_norms):
+    """시작점 묶음 하나의 경사 하강 (path·values·grad_norms는 이 묶음의 열에 해당하는 뷰) → (마지막 위치, 발산 여부)"""
+    V = np.zeros_like(X)
+    active = np.ones(len(X), dtype=bool)
+    r = 0
+    with np.errstate(all="ignore"):
+        for t in range(steps + 1):
+            f, G = problem.value_and_grad(X)
+            values[t], grad_norms[t] = f, np.linalg.norm(G, axis=1)
+            if t == record_steps[r]:
+                path[r] = X
+                r += 1
+            if t == steps:
+                break
+            active &= np.isfinite(f) & np.isfinite(G).all(axis=1) & (np.abs(f) < 1e150)
+            G[~active] = 0.0
+            V = momentum * V - learning_rate * G
+            V[~active] = 0.0
+            X = X + V
+    return X, ~active
+
+
+def descend(problem, starts, learning_rate, steps, momentum=0.0, max_records=200):
+    """모든 시작점에서 동시에 경사 하강 (발산한 시작점은 그 자리에 고정)
+
+    반환: {"record_steps", "path"(기록 시점×B×n, float32), "values"(steps+1×B),
+          "grad_norms"(steps+1×B), "final"(B×n), "diverged"(B)}
+    """
+    X = np.array(starts, dtype=float, ndmin=2)
+    n_starts, n = X.shape
+    # 기록 시점 수: max_records 이하, 경로 전체가 PATH_MEMORY_BYTES 이하 (최소 MIN_PATH_RECORDS)
+    records = min(max_records, max(MIN_PATH_RECORDS, PATH_MEMORY_BYTES // (4 * n_starts * n)))
+    stride = max(1, -(-steps // records))
+    record_steps = list(range(0, steps + 1, stride))
+    if record_steps[-1] != steps:
+        record_steps.append(steps)
+    path = np.empty((len(record_steps), n_starts, n), dtype=np.float32)
+    values = np.empty((steps + 1, n_starts))
+    grad_norms = np.empty((steps + 1, n_starts))
+    final = np.empty_like(X)
+    diverged = np.empty(n_starts, dtype=bool)
+
+    chunk = max(1, BATCH_CHUNK_ELEMENTS // n)
+    for s in range(0, n_starts, chunk):
+        rows = slice(s, s + chunk)
+        final[rows], diverged[rows] = _descend_chunk(problem, X[rows], learning_rate, steps, momentum, record_steps,
+                                                     path[:, rows], values[:, rows], grad_norms[:, rows])
+
+    return {
+        "record_steps": np.array(record_steps), "path": path, "values": values,
+        "grad_norms": grad_norms, "final": final, "diverged": diverged,
+    }
+
+
+# ----- 3. 2D 투영 -----
+def coordinate_plane(n, i, j, reference):
+    """좌표 x_i, x_j 단면 (나머지 좌표는 reference 값으로 고정) → (center, u, v)"""
+    center = np.array(reference, dtype=float)
+    center[[i, j]] = 0.0
+    u, v = np.zeros(n), np.zeros(n)
+    u[i], v[j] = 1.0, 1.0
+    return center, u, v
+
+
+def pca_plane(path, max_rows=512):
+    """경로(기록 시점×시작점) 분산이 가장 큰 두 방향 → (center, u, v, 설명 분산 비율 2개)"""
+    P = path.reshape(-1, path.shape[-1]).astype(float)
+    P = P[np.isfinite(P).all(axis=1)]
+    if len(P) > max_rows:
+        P = P[np.linspace(0, len(P) - 1, max_rows).astype(int)]
+    center = P.mean(axis=0)
+    _, s, Vt = np.linalg.svd(P - center, full_matrices=False)
+    var = s ** 2
+    ratio = var / var.sum() if var.sum() > 0 else np.zeros_like(var)
+    u = Vt[0] if len(Vt) > 0 else np.eye(P.shape[1])[0]
+    v = Vt[1] if len(Vt) > 1 else np.eye(P.shape[1])[min(1, P.shape[1] - 1)]
+    return center, u, v, np.pad(ratio[:2], (0, max(0, 2 - len(ratio))))
+
+
+def project(path, center, u, v):
+    """경로를 평면 좌표 (..., 2)로 투영"""
+    D = np.asarray(path, dtype=float) - center
+    return np.stack([D @ u, D @ v], axis=-1)
+
+
+def plane_grid(problem, center, u, v, a_range, b_range, resolution=60):
+    """평면 center + a·u + b·v 위의 함숫값 격자 (a, b, Z) – 점을 나눠 평가해 메모리 제한"""
+    a = np.linspace(*a_range, resolution)
+    b = np.linspace(*b_range, resolution)
+    A, B = np.meshgrid(a, b)
+    coeffs = np.stack([A.ravel(), B.ravel()], axis=1)
+    Z = np.empty(len(coeffs))
+    with np.errstate(all="ignore"):
+        for s in range(0, len(coeffs), PLANE_CHUNK_ROWS):
+            c = coeffs[s:s + PLANE_CHUNK_ROWS]
+            Z[s:s + len(c)] = problem.value(center + c[:, :1] * u + c[:, 1:] * v)
+    return a, b, Z.reshape(A.shape)
@@ -0,0 +1,87 @@
+# ============================================================
+#  SciPy 다중 시작점 최소화 및 경사 하강 경로 계산
+#  - 페이지의 실시간 계산과 미리 계산 번들이 같은 절차를 사용하도록 공통화
+# ============================================================
+
+import numpy as np
+from scipy.optimize import minimize
+
+
+def multi_start_minimum_iter(f_np_func, starts):
+    """시작점 하나씩 Nelder-Mead 최소화하며 (완료 수, 전체 수, 현재까지 최선 (x, y, z) 또는 None) 생성"""
+    def min_func_scipy(vars_list):
+        return f_np_func(vars_list[0], vars_list[1])
+
+    starts = list(starts)
+    best_res = None
+    for done, p_start in enumerate(starts, start=1):
+        res_temp = minimize(
+            min_func_scipy,
+            list(p_start),
+            method='Nelder-Mead',
+            tol=1e-6,
+            options={'maxiter': 200, 'adaptive': True}
+        )
+        if best_res is None or (res_temp.success and res_temp.fun < best_res.fun) or (res_temp.success and not best_res.success):
+            best_res = res_temp
+
+        if best_res is None or not best_res.success:
+            yield done, len(starts), None
+        else:
+            min_x, min_y = best_res.x
+            yield done, len(starts), (float(min_x), float(min_y), float(f_np_func(min_x, min_y)))
+
+
+def multi_start_minimum(f_np_func, starts):
+    """여러 시작점에서 Nelder-Mead 최소화 후 가장 좋은 (x, y, z) 반환 (실패 시 None)"""
+    best = None
+    for _, _, best in multi_start_minimum_iter(f_np_func, starts):
+        pass
+    return best
+
+
+# 경사 하강이 요청한 스텝보다 일찍 멈춘 이유와 안내 문구
+STOP_NAN, STOP_OVERFLOW = "nan", "overflow"
+STOP_MESSAGES = {
+    STOP_NAN: "기울기 계산 결과가 NaN입니다.",
+    STOP_OVERFLOW: "값이 너무 커져 실수 범위를 넘었습니다 (발산). 학습률을 줄여 보세요.",
+}
+
+
+def _gd_step(f_np_func, dx_np_func, dy_np_func, point, learning_rate):
+    """경사 하강 한 스텝 → (다음 점, 다음 함숫값, 기울기), 진행할 수 없으면 멈춘 이유 (STOP_NAN / STOP_OVERFLOW)"""
+    curr_x, curr_y = float(point[0]), float(point[1])   # 경로 배열의 점도 같은 판정이 되도록 파이썬 float로
+    try:
+        grad_x, grad_y = float(dx_np_func(curr_x, curr_y)), float(dy_np_func(curr_x, curr_y))
+        if np.isnan(grad_x) or np.isnan(grad_y):
+            # 함숫값까지 무한대인 점(NumPy 실수는 넘치면 예외 대신 inf → inf - inf = NaN)의 NaN은 발산으로 봄
+            with np.errstate(all="ignore"):
+                value = float(f_np_func(curr_x, curr_y))
+            return STOP_OVERFLOW if np.isinf(value) or not np.isfinite([curr_x, curr_y]).all() else STOP_NAN
+        next_point = (curr_x - learning_rate * grad_x, curr_y - learning_rate * grad_y)
+        return next_point, float(f_np_func(*next_point)), (grad_x, grad_y)
+    except OverflowError:
+        return STOP_OVERFLOW   # 파이썬 float 거듭제곱은 inf 대신 예외를 냄
+
+
+def stop_reason(f_np_func, dx_np_func, dy_np_func, point, learning_rate):
+    """경로의 마지막 점 point에서 경사 하강이 멈춘 이유 (gd_trajectory와 같은 판정, 진행할 수 있으면 None)"""
+    step = _gd_step(f_np_func, dx_np_func, dy_np_func, point, learning_rate)
+    return step if isinstance(step, str) else None
+
+
+def gd_trajectory(f_np_func, dx_np_func, dy_np_func, start, learning_rate, steps):
+    """경사 하강 경로 (path[n+1, 2], values[n+1], grads[n, 2]) – 기울기가 NaN이거나 값이 float 범위를
+    넘으면(발산) 그 전에서 멈춤 (이유는 stop_reason으로 확인)"""
+    path = [(float(start[0]), float(start[1]))]
+    values = [float(f_np_func(*path[0]))]
+    grads = []
+    for _ in range(steps):
+        step = _gd_step(f_np_func, dx_np_func, dy_np_func, path[-1], learning_rate)
+        if isinstance(step, str):
+            break
+        next_point, next_value, grad = step
+        path.append(next_point)
+        values.append(next_value)
+        grads.append(grad)
+    return np.array(path, dtype=float), np.array(values, dtype=float), np.array(grads, dtype=float).reshape(-1, 2)
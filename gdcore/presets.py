@@ -0,0 +1,40 @@
+# ============================================================
+#  미리 계산 번들에 포함하는 고정 프리셋 (함수식·범위·기본 경사 하강 설정)
+#  - 04_C의 PRESETS / 02_A의 default_funcs_info 와 같은 값 (사용자 정의 입력 제외)
+# ============================================================
+
+PRESET_SPECS = [
+    {
+        "name": "convex",
+        "label": "볼록 함수 (최적화 쉬움, 예: x²+y²)",
+        "formula": "x**2 + y**2",
+        "x_range": (-6.0, 6.0), "y_range": (-6.0, 6.0),
+        "start": (5.0, -4.0), "learning_rate": 0.1, "steps": 25,
+    },
+    {
+        "name": "saddle",
+        "label": "안장점 함수 (예: 0.3x²-0.3y²)",
+        "formula": "0.3*x**2 - 0.3*y**2",
+        "x_range": (-4.0, 4.0), "y_range": (-4.0, 4.0),
+        "start": (4.0, 0.0), "learning_rate": 0.1, "steps": 40,
+    },
+    {
+        "name": "himmelblau",
+        "label": "Himmelblau 함수 (다중 최적점)",
+        "formula": "(x**2 + y - 11)**2 + (x + y**2 - 7)**2",
+        "x_range": (-6.0, 6.0), "y_range": (-6.0, 6.0),
+        "start": (1.0, 1.0), "learning_rate": 0.01, "steps": 60,
+        # 알려진 네 최소점 근처의 추가 SciPy 시작점 (04_C find_scipy_minimum 과 동일)
+        "scipy_seeds": [(3, 2), (-2.805, 3.131), (-3.779, -3.283), (3.584, -1.848)],
+    },
+    {
+        "name": "rastrigin",
+        "label": "복잡한 함수 (Rastrigin 유사)",
+        "formula": "20 + (x**2 - 10*cos(2*3.14159*x)) + (y**2 - 10*cos(2*3.14159*y))",
+        "x_range": (-5.0, 5.0), "y_range": (-5.0, 5.0),
+        "start": (3.5, -2.5), "learning_rate": 0.02, "steps": 70,
+    },
+]
+
+# 번들에 저장하는 표면 격자 해상도 (페이지 기본값은 80)
+BUNDLE_RESOLUTIONS = (40, 80, 160)
@@ -0,0 +1,53 @@
+# ============================================================
+#  긴 계산의 점진적 표시와 중지
+#  - 계산을 조각(chunk) 단위 제너레이터로 나누고, 부분 결과를 자리(placeholder)에 바로 그림
+#  - 그리기는 최소 간격으로 제한해 조각마다 그림을 직렬화하는 비용을 줄임
+#  - 중지 버튼을 누르면 Streamlit이 실행 중인 스크립트를 다음 st 호출에서 중단하고 재실행하므로,
+#    부분 결과는 조각마다 세션 상태에 저장해 두고 중지 여부는 on_click 콜백으로 남김
+# ============================================================
+
+import time
+
+import streamlit as st
+
+
+def chunked(iterable, size):
+    """iterable을 size개씩 묶은 리스트 생성"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_progressively(chunks, render, min_interval=0.15):
+    """조각 제너레이터를 끝까지 돌리며 부분 결과를 render로 표시 (마지막 조각은 항상 표시), 마지막 결과 반환"""
+    last, pending = None, False
+    last_render = float("-inf")
+    for partial in chunks:
+        last, pending = partial, True
+        now = time.perf_counter()
+        if now - last_render >= min_interval:
+            render(partial)
+            last_render, pending = now, False
+    if pending:
+        render(last)
+    return last
+
+
+def _request_cancel(flag_key):
+    st.session_state[flag_key] = True
+
+
+def cancel_button(container, flag_key, label="⏹ 중지", key=None):
+    """계산 중에 보여 줄 중지 버튼 (누르면 다음 재실행에서 consume_cancel(flag_key)가 True)"""
+    return container.button(label, key=key or f"{flag_key}_btn", on_click=_request_cancel,
+                            args=(flag_key,), use_container_width=True)
+
+
+def consume_cancel(flag_key):
+    """중지 요청이 있었는지 확인하고 표시를 지움"""
+    return bool(st.session_state.pop(flag_key, False))
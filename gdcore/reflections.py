@@ -0,0 +1,129 @@
+# ============================================================
+#  수업 기록("오늘 배운 점") 저장소 – 로컬 SQLite 파일 (WAL 모드)
+#  - 페이지는 record_reflection()으로 큐에 넣고 바로 반환 (디스크 쓰기를 기다리지 않음)
+#  - 배경 쓰기 스레드 하나가 큐에 쌓인 기록을 모아 한 트랜잭션으로 일괄 기록
+#    (BATCH_SIZE개가 모이거나 첫 기록 후 FLUSH_INTERVAL초가 지나면, 실패하면 다시 시도 – gdcore.batchwriter)
+#  - WAL 모드라 교사용 보기의 읽기가 쓰기를 막지 않음 (읽기는 호출마다 새 연결)
+#  - 실행 설정(함수식·시작점·학습률·반복·최종 함숫값)은 선택해서 함께 저장
+# ============================================================
+
+import contextlib
+import os
+import sqlite3
+from datetime import datetime
+
+from gdcore.batchwriter import BatchWriter, shared_writer, storage_location
+
+# DB 파일 경로 (기본은 저장 끔 – GD_REFLECTION_DB로 지정하거나 GD_PERSIST=1이면 data/ 아래)
+DB_PATH = storage_location("GD_REFLECTION_DB", os.path.join("data", "reflections.sqlite3"))
+BATCH_SIZE = 64
+FLUSH_INTERVAL = 1.0   # 초
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reflections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    page TEXT NOT NULL,
+    session TEXT,
+    text TEXT NOT NULL,
+    expr TEXT,
+    start_x REAL,
+    start_y REAL,
+    learning_rate REAL,
+    steps INTEGER,
+    final_loss REAL
+);
+CREATE INDEX IF NOT EXISTS reflections_ts ON reflections (ts);
+"""
+COLUMNS = ("ts", "page", "session", "text", "expr", "start_x", "start_y", "learning_rate", "steps", "final_loss")
+
+
+def connect(path=DB_PATH):
+    """WAL 모드 연결 (파일·표가 없으면 만듦)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")   # WAL에서는 커밋마다 fsync하지 않아도 손상되지 않음
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class ReflectionWriter(BatchWriter):
+    """큐에 쌓인 기록을 배경 스레드에서 한 트랜잭션으로 일괄 기록하는 쓰기 담당"""
+
+    label = "수업 기록"
+    errors = (sqlite3.Error, OSError)
+
+    def __init__(self, path=DB_PATH, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self._conn = None
+        super().__init__(batch_size, flush_interval, name="reflection-writer")
+
+    def _write(self, rows):
+        """기록 줄(COLUMNS 순서의 튜플) 목록을 한 트랜잭션으로 기록 (실패하면 다음에 새로 연결)"""
+        try:
+            if self._conn is None:
+                self._conn = connect(self.path)
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO reflections ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    rows
+                )
+        except self.errors:
+            self._conn = None
+            raise
+
+
+def get_writer(path=DB_PATH):
+    """DB 파일별 프로세스 공용 쓰기 담당 (첫 호출 시 스레드 시작, 저장을 껐으면 None)"""
+    return shared_writer(ReflectionWriter, path)
+
+
+def record_reflection(text, page, session=None, params=None, path=DB_PATH):
+    """기록 하나를 큐에 넣음 (params: expr, start_x, start_y, learning_rate, steps, final_loss 중 일부)"""
+    writer = get_writer(path)
+    if writer is None:
+        return False
+    params = params or {}
+    row = (datetime.now().isoformat(timespec="seconds"), page, session, text,
+           *(params.get(name) for name in COLUMNS[4:]))
+    writer.submit(row)
+    return True
+
+
+# ----- 교사용 조회 -----
+def _select(path, sql, args=()):
+    """읽기 전용 조회 (호출마다 연결을 열고 닫음, DB 파일이 없으면 빈 목록)"""
+    if not path or not os.path.exists(path):
+        return []
+    with contextlib.closing(connect(path)) as conn:
+        conn.row_factory = sqlite3.Row
+        return [dict(row) for row in conn.execute(sql, args).fetchall()]
+
+
+def query_reflections(path=DB_PATH, expr=None, search=None, since=None, limit=500):
+    """조건에 맞는 기록 (최근 순 dict 목록)"""
+    clauses, args = [], []
+    if expr:
+        clauses.append(f"expr IN ({', '.join('?' * len(expr))})")
+        args.extend(expr)
+    if search:
+        clauses.append("text LIKE ?")
+        args.append(f"%{search}%")
+    if since:
+        clauses.append("ts >= ?")
+        args.append(since)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return _select(path, f"SELECT * FROM reflections {where} ORDER BY ts DESC, id DESC LIMIT ?",
+                   (*args, int(limit)))
+
+
+def summary_by_expression(path=DB_PATH):
+    """함수식별 기록 수·평균 학습률·평균 최종 함숫값·마지막 기록 시각"""
+    return _select(
+        path,
+        "SELECT expr, COUNT(*) AS count, AVG(learning_rate) AS mean_lr, AVG(final_loss) AS mean_final_loss, "
+        "MAX(ts) AS last_ts FROM reflections GROUP BY expr ORDER BY count DESC"
+    )
@@ -0,0 +1,130 @@
+# ============================================================
+#  실행 결과 오프라인 재생 파일 만들기 (서버 없이 보는 HTML + 압축 .npz)
+#  - HTML: plotly.js를 포함한 단일 파일, 스텝별 Plotly 프레임(재생 버튼·슬라이더) + 스텝 로그 표
+#    → 서버는 한 번만 만들고, 재생은 보는 사람의 브라우저에서만 일어남
+#  - 프레임은 경로 트레이스만 바꾸고 표면은 처음 한 번만 포함 (파일 크기 절약)
+#  - .npz: 표면 격자, 경로, 함숫값, 기울기, 참고 최소점, 설정(JSON)
+# ============================================================
+
+import html
+import io
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+
+MAX_FRAMES = 200    # 경로가 길면 프레임을 이 수 이하로 솎음
+DEFAULT_CAMERA = dict(x=1.7, y=1.7, z=1.2)
+
+
+def frame_indices(n_points, max_frames=MAX_FRAMES):
+    """재생 프레임으로 쓸 경로 인덱스 (처음·마지막 포함)"""
+    return np.unique(np.linspace(0, n_points - 1, min(n_points, max_frames)).round().astype(int))
+
+
+def _path_traces(path, values, k):
+    """k번째 점까지의 경로 + 현재 위치 트레이스"""
+    return [
+        go.Scatter3d(x=path[:k + 1, 0], y=path[:k + 1, 1], z=values[:k + 1], mode="lines+markers",
+                     marker=dict(size=4, color="red"), line=dict(color="red", width=3), name="경사 하강 경로"),
+        go.Scatter3d(x=[path[k, 0]], y=[path[k, 1]], z=[values[k]], mode="markers+text",
+                     marker=dict(size=8, color="orange", line=dict(color="black", width=1)),
+                     text=[f"S{k}"], textposition="top left", name="GD 현재 위치"),
+    ]
+
+
+def build_replay_figure(surface, path, values, min_point=None, camera_eye=None,
+                        title_text="경사 하강법 경로 재생"):
+    """표면 + 스텝별 경로 프레임(재생/일시정지 버튼, 스텝 슬라이더) 그림"""
+    X, Y, Z = surface
+    path, values = np.asarray(path, dtype=float), np.asarray(values, dtype=float)
+    indices = frame_indices(len(path))
+
+    fig = go.Figure(data=[
+        go.Surface(x=X, y=Y, z=Z, opacity=0.7, colorscale="Viridis", showscale=False, name="함수 표면 f(x,y)",
+                   contours_z=dict(show=True, usecolormap=True, project_z=True)),
+        *_path_traces(path, values, indices[0]),
+    ])
+    if min_point:
+        fig.add_trace(go.Scatter3d(
+            x=[min_point[0]], y=[min_point[1]], z=[min_point[2]], mode="markers+text",
+            marker=dict(size=10, color="cyan", symbol="diamond"), text=["SciPy 최적점"],
+            textposition="bottom center", name="SciPy 최적점"
+        ))
+    fig.frames = [go.Frame(data=_path_traces(path, values, k), traces=[1, 2], name=str(k)) for k in indices]
+
+    frame_args = dict(frame=dict(duration=120, redraw=True), mode="immediate", transition=dict(duration=0))
+    fig.update_layout(
+        scene=dict(xaxis_title="x", yaxis_title="y", zaxis_title="f(x, y)",
+                   camera=dict(eye=camera_eye or DEFAULT_CAMERA), aspectmode="cube"),
+        height=650, margin=dict(l=0, r=0, t=40, b=0), title_text=title_text, title_x=0.5,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0.0, y=0.0, xanchor="left", yanchor="top", pad=dict(t=40),
+            buttons=[
+                dict(label="▶ 재생", method="animate", args=[None, dict(frame_args, fromcurrent=True)]),
+                dict(label="⏸ 멈춤", method="animate",
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ],
+        )],
+        sliders=[dict(
+            x=0.15, y=0.0, len=0.85, yanchor="top", pad=dict(t=30), currentvalue=dict(prefix="스텝 "),
+            steps=[dict(label=str(k), method="animate", args=[[str(k)], frame_args]) for k in indices],
+        )],
+    )
+    return fig
+
+
+def _step_rows(path, values, grads):
+    """스텝 로그 표 행 (스텝, 위치, 함숫값, 기울기, 기울기 크기, 개선값)"""
+    for i in range(len(grads)):
+        yield (i + 1, f"({path[i, 0]:.4f}, {path[i, 1]:.4f})", f"{values[i]:.6g}",
+               f"({grads[i, 0]:.4g}, {grads[i, 1]:.4g})", f"{np.hypot(*grads[i]):.4g}",
+               f"{values[i] - values[i + 1]:.4g}")
+
+
+def replay_html(fig, path, values, grads, meta):
+    """그림 + 설정 + 스텝 로그를 담은 단일 HTML 문서 (plotly.js 포함, 외부 요청 없음)"""
+    path, values, grads = np.asarray(path), np.asarray(values), np.asarray(grads).reshape(-1, 2)
+    figure_html = fig.to_html(full_html=False, include_plotlyjs=True, auto_play=False)
+    meta_items = "".join(f"<li><b>{html.escape(str(k))}</b>: <code>{html.escape(str(v))}</code></li>"
+                         for k, v in meta.items())
+    rows = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>"
+                   for row in _step_rows(path, values, grads))
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>경사 하강법 실행 재생</title>
+<style>
+body {{ font-family: sans-serif; margin: 1.5rem; }}
+table {{ border-collapse: collapse; font-size: 0.85rem; }}
+td, th {{ border: 1px solid #ccc; padding: 2px 8px; text-align: right; }}
+</style>
+</head>
+<body>
+<h2>🎢 경사 하강법 실행 재생</h2>
+<ul>{meta_items}</ul>
+{figure_html}
+<h3>스텝 로그</h3>
+<table>
+<tr><th>스텝</th><th>위치 (x, y)</th><th>f(x, y)</th><th>기울기</th><th>기울기 크기</th><th>개선값</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def replay_npz(surface, path, values, grads, min_point, meta):
+    """표면·경로·함숫값·기울기·참고 최소점·설정을 압축 .npz 바이트로 저장"""
+    X, Y, Z = surface
+    buf = io.BytesIO()
+    np.savez_compressed(
+        buf, X=np.asarray(X), Y=np.asarray(Y), Z=np.asarray(Z),
+        path=np.asarray(path, dtype=float), values=np.asarray(values, dtype=float),
+        gradients=np.asarray(grads, dtype=float).reshape(-1, 2),
+        min_point=np.asarray(min_point if min_point else [], dtype=float),
+        meta=np.array(json.dumps(meta, ensure_ascii=False)),
+    )
+    return buf.getvalue()
@@ -0,0 +1,110 @@
+# ============================================================
+#  설정별 경사 하강 결과 공유 캐시 (프로세스 전체, 최근 사용 순 개수 제한)
+#  - 키: (정규화한 함수식, 시작점, 학습률, 최적화 방법) – 스텝 수는 키에 넣지 않음
+#    → 지금까지 계산한 가장 긴 경로를 보관하고, 더 짧은 요청은 잘라서, 더 긴 요청은 끝점에서 이어서 계산
+#      (다음 점이 현재 점만으로 정해지므로 이어 붙인 경로 = 처음부터 계산한 경로, 새 스텝만큼만 계산)
+#  - 기울기가 NaN이 되거나 값이 발산해 멈춘 경로는 더 늘릴 수 없으므로 있는 만큼 반환 (이유는 optimize.stop_reason)
+#  - 공유 링크로 들어온 학생들은 첫 방문자가 계산한 경로를 그대로 사용
+#  - 페이지가 직접 계산한 경로(점진적 표시 등)도 store_trajectory로 넣어 재사용
+#  - 저장된 배열은 읽기 전용 → 세션 간 공유 시 변경 방지
+#  - 새로 계산할 구간은 계산 서비스가 있으면 그쪽에서 (경사 하강만, 없으면 이 프로세스에서)
+# ============================================================
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from gdcore import compute
+from gdcore.diskcache import canonical_expression
+from gdcore.optimize import gd_trajectory
+
+MAX_ENTRIES = int(os.environ.get("GD_RESULT_CACHE_ENTRIES", "512"))
+
+# 최적화 방법별 경로 계산 함수 (다음 점이 현재 점만으로 정해져야 끝점에서 이어 계산 가능)
+OPTIMIZERS = {"gd": gd_trajectory}
+
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def trajectory_key(formula, start, learning_rate, optimizer="gd"):
+    """경로 캐시 키 (공백 차이·정수/실수 표기 차이는 같은 설정)"""
+    return (canonical_expression(formula), float(start[0]), float(start[1]), float(learning_rate), optimizer)
+
+
+def _slice(entry, steps):
+    """보관된 경로에서 처음 steps 스텝까지 (읽기 전용 뷰, 멈춘 경로는 있는 만큼)"""
+    path, values, grads, _ = entry
+    n = min(int(steps), len(grads))
+    return path[:n + 1], values[:n + 1], grads[:n]
+
+
+def _covers(entry, steps):
+    """보관된 경로로 steps 스텝 요청에 답할 수 있는지 (충분히 길거나 NaN·발산으로 멈춘 경로)"""
+    return len(entry[2]) >= int(steps) or entry[3]
+
+
+def join_trajectories(prefix, tail):
+    """앞부분 경로 + 그 끝점에서 이어 계산한 경로 (tail의 첫 점은 prefix의 끝점과 같아 뺌)"""
+    (path, values, grads), (tail_path, tail_values, tail_grads) = prefix[:3], tail
+    return (np.concatenate([path, tail_path[1:]]), np.concatenate([values, tail_values[1:]]),
+            np.concatenate([grads, tail_grads]).reshape(-1, 2))
+
+
+def cached_prefix(formula, start, learning_rate, optimizer="gd"):
+    """보관된 가장 긴 경로 (path, values, grads, 일찍 멈췄는지) 또는 None"""
+    key = trajectory_key(formula, start, learning_rate, optimizer)
+    with _results_lock:
+        entry = _results.get(key)
+        if entry is not None:
+            _results.move_to_end(key)
+        return entry
+
+
+def cached_trajectory(formula, start, learning_rate, steps, optimizer="gd"):
+    """steps 스텝까지 보관돼 있으면 잘라 낸 (path, values, grads), 아니면 None"""
+    entry = cached_prefix(formula, start, learning_rate, optimizer)
+    if entry is None or not _covers(entry, steps):
+        return None
+    return _slice(entry, steps)
+
+
+def store_trajectory(formula, start, learning_rate, steps, path, values, grads, optimizer="gd"):
+    """steps 스텝을 요청해 계산한 경로 저장 (이미 더 긴 경로가 있으면 그대로 둠), 저장된 읽기 전용 배열 반환"""
+    for arr in (path, values, grads):
+        arr.setflags(write=False)
+    entry = (path, values, grads, len(grads) < int(steps))
+    key = trajectory_key(formula, start, learning_rate, optimizer)
+    with _results_lock:
+        current = _results.get(key)
+        if current is not None and (len(current[2]) > len(grads) or current[3]):
+            entry = current
+        _results[key] = entry
+        _results.move_to_end(key)
+        while len(_results) > MAX_ENTRIES:
+            _results.popitem(last=False)
+    return _slice(entry, steps)
+
+
+def _compute_trajectory(formula, functions, start, learning_rate, steps, optimizer):
+    """start에서 steps 스텝 경로 계산 (경사 하강은 계산 서비스 우선)"""
+    local = lambda: OPTIMIZERS[optimizer](*functions, start, learning_rate, steps)
+    if optimizer == "gd":
+        return compute.trajectory(formula, start, learning_rate, steps, local)
+    return local()
+
+
+def get_trajectory(formula, functions, start, learning_rate, steps, optimizer="gd"):
+    """설정별 경로 – 보관된 경로가 짧으면 끝점에서 모자란 스텝만 functions=(f, ∂f/∂x, ∂f/∂y)로 계산해 이어 붙임"""
+    entry = cached_prefix(formula, start, learning_rate, optimizer)
+    if entry is not None and _covers(entry, steps):
+        return _slice(entry, steps)
+    if entry is None:
+        result = _compute_trajectory(formula, functions, start, learning_rate, steps, optimizer)
+    else:
+        done = len(entry[2])
+        result = join_trajectories(entry, _compute_trajectory(formula, functions, entry[0][-1], learning_rate,
+                                                              int(steps) - done, optimizer))
+    return store_trajectory(formula, start, learning_rate, steps, *result, optimizer=optimizer)
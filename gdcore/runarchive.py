@@ -0,0 +1,174 @@
+# ============================================================
+#  실행 기록 보관소 – 추가 전용(append-only) 열 기반 파일 (Arrow IPC, 날짜별 분할)
+#  - 실행 하나 = 한 행: 설정(함수식·시작점·학습률·반복), 결과, 경로·함숫값·기울기(리스트 열)
+#  - 페이지는 archive_run()으로 큐에 넣고 바로 반환 (디스크 쓰기를 기다리지 않음)
+#  - 배경 쓰기 스레드가 BATCH_SIZE개 또는 FLUSH_INTERVAL초마다 모아 새 파일 하나로 기록
+#    (실패한 묶음은 다시 시도 – gdcore.batchwriter)
+#    파일: {ARCHIVE_DIR}/date=YYYY-MM-DD/part-{시각}-{pid}-{순번}.arrow
+#    → 기존 파일은 고치지 않으므로 여러 프로세스가 같은 디렉터리에 써도 안전 (임시 파일 → 이름 바꾸기)
+#  - 조회(load_runs)는 파일을 memory-map으로 열고 필요한 열만 읽음 → 압축 해제·복사 없이 OS 페이지 캐시 사용
+# ============================================================
+
+import contextlib
+import itertools
+import os
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from gdcore.batchwriter import BatchWriter, shared_writer, storage_location
+from gdcore.diskcache import canonical_expression
+
+# 보관 위치 (기본은 보관 끔 – GD_RUN_ARCHIVE_DIR로 지정하거나 GD_PERSIST=1이면 data/ 아래)
+ARCHIVE_DIR = storage_location("GD_RUN_ARCHIVE_DIR", os.path.join("data", "run_archive"))
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 5.0   # 초
+
+_float_list = pa.list_(pa.float64())
+SCHEMA = pa.schema([
+    ("ts", pa.timestamp("ms")),
+    ("page", pa.string()),
+    ("session", pa.string()),
+    ("expr", pa.string()),
+    ("start_x", pa.float64()),
+    ("start_y", pa.float64()),
+    ("learning_rate", pa.float64()),
+    ("steps", pa.int32()),          # 요청한 스텝 수
+    ("n_steps", pa.int32()),        # 실제로 진행한 스텝 수 (NaN으로 멈추면 더 적음)
+    ("outcome", pa.string()),
+    ("final_x", pa.float64()),
+    ("final_y", pa.float64()),
+    ("final_loss", pa.float64()),
+    ("path_x", _float_list),
+    ("path_y", _float_list),
+    ("values", _float_list),
+    ("grad_x", _float_list),        # 기울기를 모르는 페이지는 null
+    ("grad_y", _float_list),
+])
+# 경로 리스트 열 – 요약만 볼 때는 읽지 않음
+TRACE_COLUMNS = ("path_x", "path_y", "values", "grad_x", "grad_y")
+SUMMARY_COLUMNS = tuple(name for name in SCHEMA.names if name not in TRACE_COLUMNS)
+
+
+def run_row(page, session, expr, start, learning_rate, steps, path, values, grads=None, outcome=None):
+    """실행 하나 → 보관 행 dict (SCHEMA 열 이름)"""
+    path = np.asarray(path, dtype=float).reshape(-1, 2)
+    values = np.asarray(values, dtype=float)
+    grads = None if grads is None else np.asarray(grads, dtype=float).reshape(-1, 2)
+    return {
+        "ts": datetime.now(), "page": page, "session": session, "expr": canonical_expression(expr),
+        "start_x": float(start[0]), "start_y": float(start[1]), "learning_rate": float(learning_rate),
+        "steps": int(steps), "n_steps": len(path) - 1, "outcome": outcome,
+        "final_x": float(path[-1, 0]), "final_y": float(path[-1, 1]),
+        "final_loss": float(values[-1]) if len(values) else None,
+        "path_x": path[:, 0], "path_y": path[:, 1], "values": values,
+        "grad_x": None if grads is None else grads[:, 0], "grad_y": None if grads is None else grads[:, 1],
+    }
+
+
+def rows_to_table(rows):
+    """보관 행 dict 목록 → Arrow 테이블 (리스트 열은 평탄한 배열 + 오프셋으로 한 번에 만듦)"""
+    columns = {name: pa.array([row[name] for row in rows], type=SCHEMA.field(name).type)
+               for name in SUMMARY_COLUMNS}
+    for name in TRACE_COLUMNS:
+        arrays = [row[name] for row in rows]
+        lengths = np.array([0 if a is None else len(a) for a in arrays], dtype=np.int32)
+        offsets = pa.array(np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32))
+        flat = np.concatenate([a for a in arrays if a is not None] or [np.empty(0)])
+        mask = pa.array([a is None for a in arrays])
+        columns[name] = pa.ListArray.from_arrays(offsets, pa.array(flat, type=pa.float64()), mask=mask)
+    return pa.table(columns, schema=SCHEMA)
+
+
+class RunArchiveWriter(BatchWriter):
+    """큐에 쌓인 실행 기록을 배경 스레드에서 모아 날짜별 IPC 파일로 기록하는 쓰기 담당"""
+
+    label = "실행 보관"
+    errors = (OSError, pa.ArrowException)
+
+    def __init__(self, root=ARCHIVE_DIR, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.root = root
+        self.files = 0
+        self._sequence = itertools.count()
+        super().__init__(batch_size, flush_interval, name="run-archive-writer")
+
+    def _write(self, rows):
+        """날짜별로 나눠 새 파일에 기록 (임시 파일에 쓴 뒤 이름 바꾸기 – 읽는 쪽은 완성된 파일만 봄)
+        모든 날짜의 임시 파일을 다 쓴 뒤에 이름을 바꿈 → 실패한 묶음을 다시 기록해도 일부만 두 번 남지 않음"""
+        by_day = {}
+        for row in rows:
+            by_day.setdefault(row["ts"].date().isoformat(), []).append(row)
+        written = []
+        try:
+            for day, day_rows in by_day.items():
+                directory = os.path.join(self.root, f"date={day}")
+                os.makedirs(directory, exist_ok=True)
+                name = f"part-{time.strftime('%H%M%S')}-{os.getpid()}-{next(self._sequence):06d}.arrow"
+                tmp_path = os.path.join(directory, f".{name}.tmp")
+                written.append((tmp_path, os.path.join(directory, name)))
+                with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, SCHEMA) as writer:
+                    writer.write_table(rows_to_table(day_rows))
+        except self.errors:
+            for tmp_path, _ in written:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+            raise
+        for tmp_path, path in written:
+            os.replace(tmp_path, path)
+            self.files += 1
+
+
+def get_writer(root=ARCHIVE_DIR):
+    """보관 위치별 프로세스 공용 쓰기 담당 (첫 호출 시 스레드 시작, 보관을 껐으면 None)"""
+    return shared_writer(RunArchiveWriter, root)
+
+
+def archive_run(page, session, expr, start, learning_rate, steps, path, values, grads=None, outcome=None,
+                root=ARCHIVE_DIR):
+    """실행 하나를 보관 큐에 넣음 (grads: 스텝별 기울기, 모르면 None)"""
+    writer = get_writer(root)
+    if writer is None:
+        return False
+    writer.submit(run_row(page, session, expr, start, learning_rate, steps, path, values, grads, outcome))
+    return True
+
+
+# ----- 조회 -----
+def archive_files(root=ARCHIVE_DIR, since=None, until=None):
+    """기간(날짜, 양 끝 포함)에 해당하는 보관 파일 목록 (날짜·이름 순)"""
+    if not root or not os.path.isdir(root):
+        return []
+    since = since.isoformat() if isinstance(since, date) else since
+    until = until.isoformat() if isinstance(until, date) else until
+    files = []
+    for entry in sorted(os.listdir(root)):
+        day = entry.partition("date=")[2]
+        if not day or (since and day < since[:10]) or (until and day > until[:10]):
+            continue
+        directory = os.path.join(root, entry)
+        files.extend(os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                     if name.endswith(".arrow"))
+    return files
+
+
+def load_runs(columns=SUMMARY_COLUMNS, since=None, until=None, expr=None, root=ARCHIVE_DIR):
+    """보관된 실행을 memory-map으로 읽은 Arrow 테이블 (선택한 열만, expr은 함수식 목록으로 거름)"""
+    columns = list(columns or SCHEMA.names)
+    needed = columns + (["expr"] if expr and "expr" not in columns else [])
+    value_set = pa.array([canonical_expression(e) for e in expr]) if expr else None
+    tables = []
+    for path in archive_files(root, since, until):
+        try:
+            # 선택한 열의 버퍼만 파일을 가리키는 뷰로 만듦 (나머지 열은 페이지를 읽지 않음)
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all().select(needed)
+        except (OSError, pa.ArrowException):
+            continue   # 형식이 맞지 않는 파일은 건너뜀
+        if value_set is not None:
+            table = table.filter(pc.is_in(table["expr"], value_set=value_set))
+        tables.append(table.select(columns))
+    if not tables:
+        return SCHEMA.empty_table().select(columns)
+    return pa.concat_tables(tables)
@@ -0,0 +1,108 @@
+# ============================================================
+#  표면 절단(단면)·방향 도함수·접평면 계산
+#  - 단면선은 캐시된 표면 격자를 쌍선형 보간해 함수 재평가 없이 생성
+#    (보간된 선은 화면에 그려지는 격자 표면 위에 정확히 놓임)
+#  - 분석점의 함숫값·기울기·방향 도함수·접선·접평면은 정확히 계산
+# ============================================================
+
+import numpy as np
+
+
+class SurfaceSlicer:
+    """균일 격자 (X, Y, Z) 위의 단면과 분석점의 접선·접평면 계산기"""
+
+    def __init__(self, X, Y, Z, f_np_func, dx_np_func, dy_np_func):
+        self.X = np.asarray(X, dtype=float)
+        self.Y = np.asarray(Y, dtype=float)
+        self.Z = np.asarray(Z, dtype=float)
+        self.f = f_np_func
+        self.dx = dx_np_func
+        self.dy = dy_np_func
+        self.x_min, self.x_max = self.X[0], self.X[-1]
+        self.y_min, self.y_max = self.Y[0], self.Y[-1]
+        self._hx = (self.x_max - self.x_min) / (len(self.X) - 1)
+        self._hy = (self.y_max - self.y_min) / (len(self.Y) - 1)
+
+    # ----- 보간 기반 단면 -----
+    def interpolate(self, xs, ys):
+        """격자 쌍선형 보간으로 z 값 계산 (범위 밖은 NaN)"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        fx = (xs - self.x_min) / self._hx
+        fy = (ys - self.y_min) / self._hy
+        inside = (fx >= 0) & (fx <= len(self.X) - 1) & (fy >= 0) & (fy <= len(self.Y) - 1)
+
+        ix = np.clip(np.floor(fx).astype(int), 0, len(self.X) - 2)
+        iy = np.clip(np.floor(fy).astype(int), 0, len(self.Y) - 2)
+        tx = np.clip(fx - ix, 0.0, 1.0)
+        ty = np.clip(fy - iy, 0.0, 1.0)
+
+        # Z[행=y, 열=x]
+        z00 = self.Z[iy, ix]
+        z01 = self.Z[iy, ix + 1]
+        z10 = self.Z[iy + 1, ix]
+        z11 = self.Z[iy + 1, ix + 1]
+        zs = (z00 * (1 - tx) * (1 - ty) + z01 * tx * (1 - ty)
+              + z10 * (1 - tx) * ty + z11 * tx * ty)
+        return np.where(inside, zs, np.nan)
+
+    def slice_at_y(self, y0):
+        """y=y0 평면과 곡면의 교선 (x 방향 단면)"""
+        return self.X, np.full_like(self.X, y0), self.interpolate(self.X, np.full_like(self.X, y0))
+
+    def slice_at_x(self, x0):
+        """x=x0 평면과 곡면의 교선 (y 방향 단면)"""
+        return np.full_like(self.Y, x0), self.Y, self.interpolate(np.full_like(self.Y, x0), self.Y)
+
+    def slice_along(self, x0, y0, theta, n=None):
+        """(x0, y0)를 지나고 방향각 theta인 수직 평면과 곡면의 교선 (격자 범위로 자름)"""
+        ux, uy = np.cos(theta), np.sin(theta)
+        t_lo, t_hi = self._line_extent(x0, y0, ux, uy)
+        n = n or max(len(self.X), len(self.Y))
+        t = np.linspace(t_lo, t_hi, n)
+        xs, ys = x0 + t * ux, y0 + t * uy
+        return xs, ys, self.interpolate(xs, ys)
+
+    def _line_extent(self, x0, y0, ux, uy):
+        """직선 (x0, y0) + t·u 가 격자 사각형 안에 있는 t 구간"""
+        t_lo, t_hi = -np.inf, np.inf
+        for p0, u, lo, hi in ((x0, ux, self.x_min, self.x_max), (y0, uy, self.y_min, self.y_max)):
+            if abs(u) < 1e-12:
+                continue
+            a, b = (lo - p0) / u, (hi - p0) / u
+            t_lo, t_hi = max(t_lo, min(a, b)), min(t_hi, max(a, b))
+        if not np.isfinite(t_lo) or t_lo > t_hi:
+            return 0.0, 0.0
+        return t_lo, t_hi
+
+    # ----- 분석점에서의 정확한 계산 -----
+    def point(self, x0, y0):
+        """분석점의 함숫값과 기울기 (z, ∂f/∂x, ∂f/∂y)"""
+        return float(self.f(x0, y0)), float(self.dx(x0, y0)), float(self.dy(x0, y0))
+
+    def gradient_angle(self, x0, y0):
+        """기울기(가장 가파르게 증가하는) 방향의 각도 (기울기가 0이면 0)"""
+        _, gdx, gdy = self.point(x0, y0)
+        if gdx == 0 and gdy == 0:
+            return 0.0
+        return float(np.arctan2(gdy, gdx))
+
+    def directional_derivative(self, x0, y0, theta):
+        """방향 u=(cosθ, sinθ)로의 방향 도함수 ∇f·u"""
+        _, gdx, gdy = self.point(x0, y0)
+        return gdx * np.cos(theta) + gdy * np.sin(theta)
+
+    def tangent_line(self, x0, y0, theta, half_length=2.0, n=20):
+        """방향 theta의 단면 곡선에 대한 분석점의 접선 (z = f + t·D_u f)"""
+        z0 = float(self.f(x0, y0))
+        slope = self.directional_derivative(x0, y0, theta)
+        t = np.linspace(-half_length, half_length, n)
+        return x0 + t * np.cos(theta), y0 + t * np.sin(theta), z0 + slope * t
+
+    def tangent_plane(self, x0, y0, half_size=1.5, n=10):
+        """분석점의 접평면 조각 z = f + f_x·(x−x0) + f_y·(y−y0)"""
+        z0, gdx, gdy = self.point(x0, y0)
+        xs = np.linspace(x0 - half_size, x0 + half_size, n)
+        ys = np.linspace(y0 - half_size, y0 + half_size, n)
+        Xp, Yp = np.meshgrid(xs, ys)
+        return xs, ys, z0 + gdx * (Xp - x0) + gdy * (Yp - y0)
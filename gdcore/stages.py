@@ -0,0 +1,86 @@
+# ============================================================
+#  계산 단계 의존성 그래프 (입력 지문으로 다시 계산할 단계만 고름)
+#  - 단계마다 입력 값 + 앞 단계의 지문으로 지문(fingerprint)을 만들고 (지문, 결과)를 세션에 보관
+#  - 지문이 이전과 같으면 계산을 건너뛰고 보관한 결과 사용 → 타이머에 "건너뜀"으로 기록
+#  - 앞 단계가 다시 계산되면 지문이 바뀌므로 뒤 단계도 자동으로 다시 계산
+#  - 04_C: surface ← (함수식, 범위), minimum ← (함수식, 시작점), path ← (함수식, 시작점, 학습률, 반복),
+#          figure ← surface + minimum + 시점
+# ============================================================
+
+import hashlib
+import numbers
+
+import numpy as np
+import streamlit as st
+
+
+def _canonical(value):
+    """지문 계산용 정규 표현 (숫자는 float, 배열은 모양·자료형·내용 해시)"""
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+        return ("ndarray", value.shape, str(value.dtype), digest)
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    return repr(value)
+
+
+def fingerprint(*values):
+    """값들의 내용 지문 (같은 내용이면 같은 문자열 – 5와 5.0, 리스트와 튜플은 같게 봄)"""
+    return hashlib.blake2b(repr(_canonical(values)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class StageGraph:
+    """이름 붙은 계산 단계들의 (지문, 결과) 저장소 – store는 재실행 사이에 유지되는 dict"""
+
+    def __init__(self, store, timer=None):
+        self._store = store
+        self.timer = timer
+
+    def key(self, name, inputs, after=()):
+        """단계 지문: 입력 값 + 앞 단계 지문 (앞 단계 결과가 없으면 None)"""
+        return fingerprint(inputs, [self.fingerprint_of(dep) for dep in after])
+
+    def fingerprint_of(self, name):
+        """보관된 단계 지문 (없으면 None)"""
+        entry = self._store.get(name)
+        return entry[0] if entry else None
+
+    def value(self, name, default=None):
+        """보관된 단계 결과"""
+        entry = self._store.get(name)
+        return entry[1] if entry else default
+
+    def run(self, name, inputs, compute, after=()):
+        """지문이 같으면 보관한 결과, 다르면 compute()를 실행해 보관하고 반환"""
+        key = self.key(name, inputs, after)
+        entry = self._store.get(name)
+        if entry is not None and entry[0] == key:
+            if self.timer is not None:
+                self.timer.skip(name)
+            return entry[1]
+        if self.timer is not None:
+            with self.timer.stage(name):
+                value = compute()
+        else:
+            value = compute()
+        self._store[name] = (key, value)
+        return value
+
+    def mark(self, name, inputs, value=None, after=()):
+        """계산은 밖에서 했다고 보고 지문과 결과만 기록 (다음 run은 건너뜀)"""
+        self._store[name] = (self.key(name, inputs, after), value)
+
+    def invalidate(self, name):
+        """보관한 결과 버림 (다음 run에서 다시 계산, 뒤 단계도 지문이 바뀌어 다시 계산)"""
+        self._store.pop(name, None)
+
+
+def stage_graph(page, timer=None):
+    """페이지별로 세션에 보관하는 단계 그래프"""
+    return StageGraph(st.session_state.setdefault(f"_stage_graph_{page}", {}), timer)
@@ -0,0 +1,267 @@
+# ============================================================
+#  3D 표면 + 경사 하강 경로 그림 (04_C 페이지에서 분리)
+#  - 함수식 페이지와 데이터셋 손실 페이지가 같은 3D 보기를 사용
+#  - 카메라 시점이 None이면 2D 등고선 보기로 대체
+#  - 그림은 고정 부분(표면·임계점·최적점·레이아웃)과 경로 부분으로 나뉨
+#    → 스텝마다 고정 부분은 그대로 두고 경로 트레이스(meta=PATH_META)만 바꿔 끼울 수 있음
+# ============================================================
+
+import numpy as np
+import plotly.graph_objects as go
+
+from gdcore.contour_view import (PATH_META, contour_base_figure, critical_point_traces,
+                                 replace_contour_path)
+from gdcore.functions import evaluate_surface
+
+
+def static_figure(f_np_func, dx_np_func, dy_np_func, x_range, y_range, min_point_scipy, current_camera_eye,
+                  surface=None, axis_titles=("x", "y", "f(x, y)"), title_text="경사 하강법 경로 및 함수 표면",
+                  critical_points=None, overlay=None):
+    """경로를 뺀 고정 부분 그림 (3D 표면 또는 2D 등고선) – 경로는 replace_gd_path로 추가"""
+    # 그래프 데이터 준비 (미리 계산된 표면이 있으면 재사용)
+    if surface is None:
+        surface = evaluate_surface(f_np_func, x_range, y_range)
+    
+    # 2D 등고선 보기 선택 시 가벼운 2D 그림 반환
+    if current_camera_eye is None:
+        return contour_base_figure(surface, dx_np_func, dy_np_func, min_point_scipy,
+                                   critical_points=critical_points, overlay=overlay)
+    
+    X_plot, Y_plot, Zs_plot = surface
+    
+    # 그래프 객체 생성
+    fig = go.Figure()
+    
+    # 함수 표면 추가
+    fig.add_trace(go.Surface(
+        x=X_plot, y=Y_plot, z=Zs_plot, 
+        opacity=0.7, 
+        colorscale='Viridis',
+        contours_z=dict(
+            show=True, 
+            usecolormap=True, 
+            highlightcolor="limegreen", 
+            project_z=True
+        ),
+        name="함수 표면 f(x,y)", 
+        showscale=False
+    ))
+    
+    # 곡률 지도: 표면 높이는 f 그대로, 색만 선택한 지도 값으로
+    if overlay is not None:
+        fig.update_traces(
+            selector=dict(type="surface"),
+            surfacecolor=overlay["values"], colorscale=overlay["colorscale"],
+            cmin=overlay["cmin"], cmax=overlay["cmax"], opacity=0.9, showscale=True,
+            colorbar=dict(title=dict(text=overlay["title"], side="right"), thickness=14, len=0.7)
+        )
+    
+    # 임계점 (최소점·안장점·최대점) 추가
+    if critical_points is not None:
+        fig.add_traces(critical_point_traces(critical_points, three_d=True))
+    
+    # SciPy 최적점 추가
+    if min_point_scipy:
+        min_x_sp, min_y_sp, min_z_sp = min_point_scipy
+        fig.add_trace(go.Scatter3d(
+            x=[min_x_sp], y=[min_y_sp], z=[min_z_sp], 
+            mode='markers+text',
+            marker=dict(size=10, color='cyan', symbol='diamond'),
+            text=["SciPy 최적점"], 
+            textposition="bottom center", 
+            name="SciPy 최적점"
+        ))
+    
+    # 그래프 레이아웃 설정
+    fig.update_layout(
+        scene=dict(
+            xaxis_title=axis_titles[0], 
+            yaxis_title=axis_titles[1], 
+            zaxis_title=axis_titles[2],
+            camera=dict(eye=current_camera_eye),
+            aspectmode='cube'
+        ),
+        height=600, 
+        margin=dict(l=0, r=0, t=30, b=0),
+        title_text=title_text, 
+        title_x=0.5,
+        legend=dict(
+            orientation="h", 
+            yanchor="bottom", 
+            y=1.02, 
+            xanchor="right", 
+            x=1
+        )
+    )
+    return fig
+
+
+def add_gd_path(fig, f_np_func, dx_np_func, dy_np_func, gd_path, educational_mode=False, z_floor=0.0):
+    """3D 그림에 경사 하강 경로·기울기 화살표·현재 위치 추가 (추가한 트레이스는 meta=PATH_META)"""
+    n_static = len(fig.data)
+    
+    # 경사 하강 경로 데이터 준비
+    px, py = zip(*gd_path)
+    try: 
+        pz = [f_np_func(pt_x, pt_y) for pt_x, pt_y in gd_path]
+    except Exception: 
+        pz = [np.nan_to_num(f_np_func(pt_x, pt_y)) for pt_x, pt_y in gd_path]
+    
+    # 경로 텍스트 준비 (교육 모드에서는 더 자세한 정보 표시)
+    if educational_mode and len(gd_path) > 1:
+        path_texts = []
+        for idx, ((pt_x, pt_y), pt_z) in enumerate(zip(gd_path, pz)):
+            if idx == 0:
+                path_texts.append(f"시작점<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
+            elif idx == len(gd_path) - 1:
+                path_texts.append(f"현재점<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
+            else:
+                path_texts.append(f"S{idx}<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
+    else:
+        path_texts = [f"S{idx}<br>({pt_x:.2f}, {pt_y:.2f})" for idx, (pt_x, pt_y) in enumerate(gd_path)]
+    
+    # 경로 트레이스 추가
+    fig.add_trace(go.Scatter3d(
+        x=px, y=py, z=pz, 
+        mode='lines+markers+text',
+        marker=dict(
+            size=5, 
+            color='red', 
+            symbol='circle',
+            colorscale=[[0, 'pink'], [1, 'red']],  # 시작점에서 현재점까지 색상 그라데이션
+            showscale=False
+        ), 
+        line=dict(color='red', width=3),
+        name="경사 하강 경로", 
+        text=path_texts, 
+        textposition="top right", 
+        textfont=dict(size=10, color='black')
+    ))
+    
+    # 기울기 화살표 추가
+    arrow_scale_factor = 0.3
+    num_arrows_to_show = min(5, len(gd_path) - 1)
+    if num_arrows_to_show > 0:
+        for i in range(num_arrows_to_show):
+            arrow_start_idx = len(gd_path) - 1 - i - 1
+            if arrow_start_idx < 0: 
+                continue
+                
+            gx, gy = gd_path[arrow_start_idx]
+            try:
+                gz = f_np_func(gx, gy)
+                grad_x_arrow = dx_np_func(gx, gy)
+                grad_y_arrow = dy_np_func(gx, gy)
+                
+                if not (np.isnan(grad_x_arrow) or np.isnan(grad_y_arrow) or np.isnan(gz)):
+                    # 기울기 벡터(경사) 화살표
+                    fig.add_trace(go.Cone(
+                        x=[gx], y=[gy], 
+                        z=[gz + 0.02 * np.abs(gz) if gz != 0 else 0.02],
+                        u=[-grad_x_arrow * arrow_scale_factor], 
+                        v=[-grad_y_arrow * arrow_scale_factor], 
+                        w=[0], 
+                        sizemode="absolute", 
+                        sizeref=0.25, 
+                        colorscale=[[0, 'magenta'], [1, 'magenta']], 
+                        showscale=False, 
+                        anchor="tail", 
+                        name=f"기울기 S{arrow_start_idx}" if i == 0 else "", 
+                        hoverinfo='skip',
+                        opacity = 0.15
+                    ))
+                    
+                    # 교육 모드에서는 추가 정보 표시
+                    if educational_mode and i == 0:
+                        grad_mag = np.sqrt(grad_x_arrow**2 + grad_y_arrow**2)
+                        fig.add_annotation(
+                            x=gx, y=gy, z=gz + 0.5,
+                            text=f"기울기 크기: {grad_mag:.2f}",
+                            showarrow=True,
+                            arrowhead=2,
+                            arrowcolor="magenta",
+                            arrowwidth=2,
+                            ax=20, ay=-40
+                        )
+            except Exception: 
+                continue
+    
+    # 현재 GD 위치 강조
+    last_x_gd, last_y_gd = gd_path[-1]
+    try: 
+        last_z_gd = f_np_func(last_x_gd, last_y_gd)
+    except Exception: 
+        last_z_gd = np.nan
+    
+    fig.add_trace(go.Scatter3d(
+        x=[last_x_gd], y=[last_y_gd], 
+        z=[last_z_gd if not np.isnan(last_z_gd) else z_floor], 
+        mode='markers+text',
+        marker=dict(
+            size=8, 
+            color='orange', 
+            symbol='circle', 
+            line=dict(color='black', width=1)
+        ),
+        text=["현재 위치"], 
+        textposition="top left", 
+        name="GD 현재 위치"
+    ))
+    
+    # 교육 모드에서 추가적인 설명 추가
+    if educational_mode and len(gd_path) > 1:
+        # 최근 스텝에 대한 정보 추가
+        if len(gd_path) >= 2:
+            current_x, current_y = gd_path[-1]
+            prev_x, prev_y = gd_path[-2]
+            try:
+                current_z = f_np_func(current_x, current_y)
+                prev_z = f_np_func(prev_x, prev_y)
+                grad_x = dx_np_func(prev_x, prev_y)
+                grad_y = dy_np_func(prev_x, prev_y)
+                grad_magnitude = np.sqrt(grad_x**2 + grad_y**2)
+                
+                # 함수값 변화에 대한 주석
+                change = current_z - prev_z
+                change_text = f"함수값 변화: {change:.4f}"
+                color = "green" if change < 0 else "red"
+                
+                fig.add_annotation(
+                    x=(current_x + prev_x)/2, 
+                    y=(current_y + prev_y)/2,
+                    z=(current_z + prev_z)/2 + 0.5,
+                    text=change_text,
+                    showarrow=True,
+                    arrowhead=2,
+                    arrowcolor=color,
+                    arrowwidth=2,
+                    ax=0, ay=-40
+                )
+            except Exception:
+                pass
+    
+    for trace in fig.data[n_static:]:
+        trace.meta = PATH_META
+    return fig
+
+
+def replace_gd_path(fig, f_np_func, dx_np_func, dy_np_func, gd_path, educational_mode=False):
+    """고정 부분 그림의 경로 트레이스만 새 경로로 교체 (fig를 제자리에서 수정해 반환)"""
+    if any(t.type == "contour" for t in fig.data):
+        return replace_contour_path(fig, gd_path)
+    fig.data = [t for t in fig.data if t.meta != PATH_META]
+    fig.layout.annotations = ()
+    surface_z = next((t.z for t in fig.data if t.type == "surface"), None)
+    z_floor = float(np.nanmin(surface_z)) if surface_z is not None else 0.0
+    return add_gd_path(fig, f_np_func, dx_np_func, dy_np_func, gd_path, educational_mode, z_floor)
+
+
+def plot_gd(f_np_func, dx_np_func, dy_np_func, x_range, y_range, gd_path, 
+            min_point_scipy, current_camera_eye, educational_mode=False, surface=None,
+            axis_titles=("x", "y", "f(x, y)"), title_text="경사 하강법 경로 및 함수 표면",
+            critical_points=None, overlay=None):
+    """경사 하강법 경로 및 함수 표면 플롯팅 (critical_points가 있으면 임계점 모두 표시, overlay가 있으면 표면을 곡률 지도 색으로)"""
+    fig = static_figure(f_np_func, dx_np_func, dy_np_func, x_range, y_range, min_point_scipy, current_camera_eye,
+                        surface=surface, axis_titles=axis_titles, title_text=title_text,
+                        critical_points=critical_points, overlay=overlay)
+    return replace_gd_path(fig, f_np_func, dx_np_func, dy_np_func, gd_path, educational_mode)
@@ -0,0 +1,124 @@
+# ============================================================
+#  재실행(rerun) 단계별 시간 측정
+#  - 파싱/lambdify, SciPy, 표면 계산, 그림 생성, 직렬화 등 단계별 소요 시간 기록
+#  - 사이드바 디버그 패널에 마지막 재실행의 내역 표시
+#  - 재실행마다 JSON-lines 파일로 남겨 사후 분석에 사용
+#  - 입력이 그대로라 건너뛴 계산 단계(gdcore/stages.py)도 함께 기록
+# ============================================================
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 로그 파일 경로 (빈 문자열이면 파일 기록 끔)
+TIMING_LOG_PATH = os.environ.get("GD_TIMING_LOG", os.path.join("logs", "rerun_timings.jsonl"))
+
+_log_lock = threading.Lock()
+
+
+def current_session_id():
+    """현재 Streamlit 세션 ID (스크립트 실행 컨텍스트 밖이면 None)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+    except Exception:
+        return None
+
+
+def append_jsonl(record, path=TIMING_LOG_PATH):
+    """레코드 한 줄을 JSON-lines 파일에 추가 (프로세스 내 스레드 간 직렬화)"""
+    if not path:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class RerunTimer:
+    """한 번의 재실행 동안 단계별 소요 시간을 모으는 타이머"""
+
+    def __init__(self, page):
+        self.page = page
+        self.stages = {}
+        self.skipped = set()
+        self._t0 = time.perf_counter()
+        self._finished = False
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록의 실행 시간을 name 단계에 누적"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def add(self, name, seconds):
+        """단계 시간(초)을 직접 누적"""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def skip(self, name):
+        """입력이 그대로라 계산을 건너뛴 단계 기록"""
+        self.skipped.add(name)
+
+    def total(self):
+        """재실행 시작부터 지금까지의 경과 시간(초)"""
+        return time.perf_counter() - self._t0
+
+    def as_record(self):
+        """JSON으로 저장할 재실행 기록"""
+        return {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "session": current_session_id(),
+            "total_ms": round(self.total() * 1000.0, 3),
+            "stages_ms": {k: round(v * 1000.0, 3) for k, v in self.stages.items()},
+            "skipped": sorted(self.skipped - set(self.stages)),
+        }
+
+    def finish(self, log_path=TIMING_LOG_PATH):
+        """재실행 종료 처리: 기록을 파일에 남기고 반환 (여러 번 불러도 한 번만 기록)"""
+        record = self.as_record()
+        if not self._finished:
+            self._finished = True
+            try:
+                append_jsonl(record, log_path)
+            except OSError:
+                pass  # 로그 기록 실패가 화면 표시를 막지 않도록 함
+        return record
+
+
+# ----- 사이드바 디버그 패널 -----
+def debug_panel_enabled():
+    """사이드바 체크박스로 디버그 패널 사용 여부 선택"""
+    import streamlit as st
+    return st.sidebar.checkbox(
+        "🐞 성능 디버그 패널",
+        value=False,
+        help="마지막 재실행에서 단계별로 걸린 시간을 보여줍니다.",
+        key="debug_timing_panel_checkbox",
+    )
+
+
+def render_timing_panel(container, record):
+    """재실행 기록을 표 형태로 container(사이드바 placeholder 등)에 표시"""
+    stages = record["stages_ms"]
+    total = record["total_ms"]
+    lines = ["| 단계 | 시간(ms) | 비율 |", "|---|---:|---:|"]
+    for name, ms in sorted(stages.items(), key=lambda kv: -kv[1]):
+        share = (ms / total * 100.0) if total > 0 else 0.0
+        lines.append(f"| {name} | {ms:.1f} | {share:.0f}% |")
+    other = max(total - sum(stages.values()), 0.0)
+    lines.append(f"| (기타) | {other:.1f} | |")
+    lines.append(f"| **합계** | **{total:.1f}** | |")
+    if record.get("skipped"):
+        lines.append(f"\n건너뛴 단계 (입력 그대로): {', '.join(record['skipped'])}")
+    container.markdown("**⏱️ 마지막 재실행 단계별 시간**\n\n" + "\n".join(lines))
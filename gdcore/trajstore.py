@@ -0,0 +1,378 @@
+# ============================================================
+#  대규모 시작점 스윕용 디스크 기반(out-of-core) 경로 저장소
+#  - 격자의 모든 시작점에서 동시에 경사 하강 → 경로 텐서를 np.memmap 파일에 기록
+#  - 타일 우선(tile-major) 배치: [타일 y, 타일 x, 스텝, 좌표(x/y), 타일 행, 타일 열]
+#    → 타일 하나·스텝 하나가 파일에서 연속 구간이라 필요한 부분만 읽고 씀
+#  - 스윕 엔진은 타일 단위로 계산·기록하므로 메모리 사용량은 타일 크기에만 비례
+#  - 요약(수렴 영역, 스텝별 손실)은 타일을 하나씩 읽는 스트리밍 방식으로 계산
+#    수렴 영역: 최종 위치를 격자 칸으로 반올림 → 이웃 칸을 연결 성분으로 묶음 (배열 연산, 영역 수 상한 MAX_BASINS)
+#    마지막 스텝의 이동·함숫값 변화가 작은(수렴한) 최종 위치만 묶고, 나머지는 "미수렴"으로 따로 셈
+#  - 저장소 전체 크기는 SWEEP_BUDGET_BYTES 이하로 유지 (새 저장소를 만들 때 오래 쓰지 않은 저장소부터 삭제)
+# ============================================================
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from gdcore.diskcache import canonical_expression
+from gdcore.functions import evaluate_on_grid
+
+# 스윕 저장 위치 (스윕 설정별 하위 디렉터리)
+SWEEP_DIR = os.environ.get("GD_SWEEP_DIR", os.path.join(".cache", "sweeps"))
+# 스윕 저장소 전체 크기 상한 (바이트, 경로 파일의 전체 크기 기준)
+SWEEP_BUDGET_BYTES = int(float(os.environ.get("GD_SWEEP_BUDGET_GB", "4")) * 1e9)
+FORMAT_VERSION = 1
+MAX_BASINS = 64          # 요약에 따로 세는 수렴 영역 수 (나머지는 하나로 묶음)
+DIVERGED, UNCONVERGED = -1, -2   # 요약 라벨: 발산, 미수렴 (0 이상은 수렴 영역)
+CONVERGE_MOVE = 1e-3     # 수렴 판정: 마지막 스텝 이동 거리 ≤ 격자 칸 크기 × CONVERGE_MOVE (기울기 크기 × 학습률)
+CONVERGE_RTOL = 1e-6     # 또는 마지막 스텝 함숫값 변화 ≤ CONVERGE_RTOL × (1 + |f|)
+_KEY_LIMIT = 2 ** 30     # 격자 칸 좌표 제한 (아주 먼 최종 위치는 가장자리 칸으로 – 칸 부호가 int64 안에 들어가도록)
+
+# 같은 프로세스의 여러 세션이 같은 스윕을 동시에 계산하지 않도록 저장소별 잠금
+_sweep_locks = {}
+_sweep_locks_guard = threading.Lock()
+
+
+def _write_json(path, payload):
+    """JSON 파일 원자적 저장"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json.tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _read_meta(directory):
+    """저장소 meta.json 읽기 (없거나 형식이 다르면 None)"""
+    try:
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("format") == FORMAT_VERSION else None
+
+
+def store_directory(formula, x_range, y_range, resolution, steps, learning_rate, tile, root=SWEEP_DIR):
+    """스윕 설정별 저장소 디렉터리 (설정 해시로 이름 지정)"""
+    parts = [canonical_expression(formula), repr(tuple(map(float, x_range))), repr(tuple(map(float, y_range))),
+             str(int(resolution)), str(int(steps)), repr(float(learning_rate)), str(int(tile)),
+             f"format={FORMAT_VERSION}"]
+    return os.path.join(root, hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:20])
+
+
+def store_nbytes(resolution, steps, tile):
+    """설정별 경로 파일 크기 (바이트, 타일 패딩 포함)"""
+    n_tiles = -(-int(resolution) // int(tile))
+    return n_tiles * n_tiles * (int(steps) + 1) * 2 * int(tile) * int(tile) * 4
+
+
+def _in_use(directory):
+    """이 프로세스에서 계산 중인 저장소인지"""
+    with _sweep_locks_guard:
+        lock = _sweep_locks.get(directory)
+    return lock is not None and lock.locked()
+
+
+def evict_stores(root, needed, budget=SWEEP_BUDGET_BYTES, keep=None):
+    """needed 바이트를 더해도 budget을 넘지 않도록 오래 쓰지 않은 저장소부터 삭제 (삭제한 디렉터리 목록)
+    사용 시각은 저장소를 열 때 갱신하는 meta.json의 수정 시각, 계산 중인 저장소와 keep은 지우지 않음"""
+    stores = []
+    for entry in (os.scandir(root) if os.path.isdir(root) else []):
+        meta = _read_meta(entry.path) if entry.is_dir() else None
+        if meta is None:
+            continue
+        size = store_nbytes(meta["resolution"], meta["steps"], meta["tile"])
+        stores.append((os.path.getmtime(os.path.join(entry.path, "meta.json")), entry.path, size))
+    total = sum(size for _, _, size in stores)
+    removed = []
+    for _, directory, size in sorted(stores):
+        if total + needed <= budget:
+            break
+        if directory == keep or _in_use(directory):
+            continue
+        shutil.rmtree(directory, ignore_errors=True)
+        total -= size
+        removed.append(directory)
+    return removed
+
+
+class TrajectoryStore:
+    """memmap 기반 타일 우선 경로 텐서 (시작점 resolution×resolution, 스텝 steps+1)"""
+
+    def __init__(self, directory, meta, mode="r"):
+        self.directory = directory
+        self.meta = meta
+        self.resolution = meta["resolution"]
+        self.steps = meta["steps"]
+        self.tile = meta["tile"]
+        self.n_tiles = -(-self.resolution // self.tile)
+        self.shape = (self.n_tiles, self.n_tiles, self.steps + 1, 2, self.tile, self.tile)
+        self.paths = np.memmap(os.path.join(directory, "paths.f32"), dtype=np.float32,
+                               mode=mode, shape=self.shape)
+        self.xs = np.linspace(*meta["x_range"], self.resolution)
+        self.ys = np.linspace(*meta["y_range"], self.resolution)
+
+    # ----- 1. 생성·열기 -----
+    @classmethod
+    def create(cls, formula, x_range, y_range, resolution, steps, learning_rate, tile=128, root=SWEEP_DIR,
+               budget=SWEEP_BUDGET_BYTES):
+        """설정에 맞는 저장소를 열거나 새로 만듦 (이미 있으면 이어서 계산 가능)
+        새로 만들 때는 전체 크기가 budget 안에 들도록 오래된 저장소를 지우고, 그래도 넘으면 ValueError"""
+        directory = store_directory(formula, x_range, y_range, resolution, steps, learning_rate, tile, root)
+        existing = cls.open(directory, mode="r+")
+        if existing is not None:
+            return existing
+        n_bytes = store_nbytes(resolution, steps, tile)
+        if n_bytes > budget:
+            raise ValueError(f"스윕 저장 크기({n_bytes / 1e9:.2f} GB)가 저장 한도({budget / 1e9:.2f} GB)를 넘습니다. "
+                             "해상도나 스텝 수를 줄여 주세요.")
+        evict_stores(root, n_bytes, budget)
+        os.makedirs(directory, exist_ok=True)
+        meta = {
+            "format": FORMAT_VERSION, "formula": formula,
+            "x_range": [float(v) for v in x_range], "y_range": [float(v) for v in y_range],
+            "resolution": int(resolution), "steps": int(steps), "learning_rate": float(learning_rate),
+            "tile": int(tile), "tiles_done": 0,
+        }
+        with open(os.path.join(directory, "paths.f32"), "wb") as f:
+            f.truncate(n_bytes)  # 희소 파일: 실제 디스크는 기록한 타일만큼만 사용
+        _write_json(os.path.join(directory, "meta.json"), meta)
+        return cls(directory, meta, mode="r+")
+
+    @classmethod
+    def open(cls, directory, mode="r"):
+        """기존 저장소 열기 (없거나 형식이 다르면 None) – 사용 시각(meta.json 수정 시각)을 갱신"""
+        meta = _read_meta(directory)
+        if meta is None:
+            return None
+        try:
+            os.utime(os.path.join(directory, "meta.json"))
+        except OSError:
+            pass
+        return cls(directory, meta, mode=mode)
+
+    @property
+    def complete(self):
+        return self.meta["tiles_done"] >= self.n_tiles * self.n_tiles
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape)) * 4
+
+    def tile_bounds(self, index):
+        """타일 번호 → (ty, tx, 행 슬라이스, 열 슬라이스, 타일 내 유효 크기)"""
+        ty, tx = divmod(index, self.n_tiles)
+        r0, c0 = ty * self.tile, tx * self.tile
+        rows = min(self.tile, self.resolution - r0)
+        cols = min(self.tile, self.resolution - c0)
+        return ty, tx, slice(r0, r0 + rows), slice(c0, c0 + cols), (rows, cols)
+
+    def tile_view(self, ty, tx, mode="r"):
+        """타일 하나만 매핑한 (steps+1, 2, tile, tile) 배열 – 사용 후 버리면 매핑 해제"""
+        tile_shape = self.shape[2:]
+        offset = (ty * self.n_tiles + tx) * int(np.prod(tile_shape)) * 4
+        return np.memmap(os.path.join(self.directory, "paths.f32"), dtype=np.float32,
+                         mode=mode, offset=offset, shape=tile_shape)
+
+    def mark_tiles_done(self, count):
+        self.meta["tiles_done"] = int(count)
+        _write_json(os.path.join(self.directory, "meta.json"), self.meta)
+
+    # ----- 2. 읽기 (필요한 타일·스텝만) -----
+    def positions_at(self, step, stride=1):
+        """스텝 step의 모든 시작점 위치 (2, 행, 열) – stride 간격으로 솎아 필요한 구간만 읽음"""
+        step = int(np.clip(step, 0, self.steps))
+        n_out = len(range(0, self.resolution, stride))
+        out = np.empty((2, n_out, n_out), dtype=np.float32)
+        for ty in range(self.n_tiles):
+            r0 = ty * self.tile
+            rows, r_off = min(self.tile, self.resolution - r0), (-r0) % stride
+            if r_off >= rows:
+                continue
+            ri = (r0 + r_off) // stride
+            for tx in range(self.n_tiles):
+                c0 = tx * self.tile
+                cols, c_off = min(self.tile, self.resolution - c0), (-c0) % stride
+                if c_off >= cols:
+                    continue
+                ci = (c0 + c_off) // stride
+                block = self.paths[ty, tx, step, :, r_off:rows:stride, c_off:cols:stride]
+                out[:, ri:ri + block.shape[1], ci:ci + block.shape[2]] = block
+        return out
+
+    def trajectory(self, row, col):
+        """시작점 (row, col) 하나의 전체 경로 (steps+1, 2)"""
+        ty, r = divmod(int(row), self.tile)
+        tx, c = divmod(int(col), self.tile)
+        return np.asarray(self.paths[ty, tx, :, :, r, c], dtype=float)
+
+    def nearest_start(self, x, y):
+        """좌표에 가장 가까운 시작점 (row, col)"""
+        return (int(np.clip(np.rint((y - self.ys[0]) / (self.ys[1] - self.ys[0])), 0, self.resolution - 1)),
+                int(np.clip(np.rint((x - self.xs[0]) / (self.xs[1] - self.xs[0])), 0, self.resolution - 1)))
+
+
+# ----- 3. 스윕 엔진 (타일 단위 계산·기록) -----
+def iter_sweep(store, f_np_func, dx_np_func, dy_np_func):
+    """남은 타일을 하나씩 계산·기록하며 (완료 타일 수, 전체 타일 수, 타일 번호, 타일 최종 위치 (2, 행, 열)) 생성"""
+    with _sweep_locks_guard:
+        lock = _sweep_locks.setdefault(store.directory, threading.Lock())
+    # 중간에 멈춰도(제너레이터 종료) 잠금은 풀리고, 완료한 타일까지는 meta에 기록되어 이어서 계산 가능
+    with lock:
+        # 잠금을 기다리는 동안 다른 세션이 진행한 타일은 건너뜀
+        meta = _read_meta(store.directory)
+        if meta is not None:
+            store.meta["tiles_done"] = max(store.meta["tiles_done"], meta["tiles_done"])
+        yield from _iter_tiles(store, dx_np_func, dy_np_func)
+
+
+def run_sweep(store, f_np_func, dx_np_func, dy_np_func, progress=None):
+    """남은 타일을 모두 계산해 저장소에 기록 (progress(완료 타일, 전체 타일) 콜백)"""
+    for done, total, _, _ in iter_sweep(store, f_np_func, dx_np_func, dy_np_func):
+        if progress is not None:
+            progress(done, total)
+    return store
+
+
+def _iter_tiles(store, dx_np_func, dy_np_func):
+    total = store.n_tiles * store.n_tiles
+    lr = store.meta["learning_rate"]
+    for index in range(store.meta["tiles_done"], total):
+        ty, tx, rs, cs, (rows, cols) = store.tile_bounds(index)
+        px, py = np.meshgrid(store.xs[cs], store.ys[rs])
+        # 타일별로 매핑·해제해 기록한 페이지가 프로세스 메모리에 쌓이지 않게 함
+        out = store.tile_view(ty, tx, mode="r+")
+        with np.errstate(all="ignore"):
+            for step in range(store.steps + 1):
+                out[step, 0, :rows, :cols] = px
+                out[step, 1, :rows, :cols] = py
+                if step == store.steps:
+                    break
+                gx = evaluate_on_grid(dx_np_func, px, py)
+                gy = evaluate_on_grid(dy_np_func, px, py)
+                px, py = px - lr * gx, py - lr * gy
+        out.flush()
+        del out
+        store.mark_tiles_done(index + 1)
+        yield index + 1, total, index, np.stack([px, py])
+
+
+# ----- 4. 스트리밍 요약 -----
+def summarize(store, f_np_func, basin_tol=None, bins=40, max_basins=MAX_BASINS):
+    """타일을 하나씩 읽어 수렴 영역 라벨·스텝별 평균 손실·발산 비율·최종 손실 분포 계산
+    마지막 스텝에서 거의 움직이지 않은 시작점만 수렴 영역으로 묶고, 아직 움직이는 시작점은 미수렴으로 셈"""
+    res, steps = store.resolution, store.steps
+    x_span = store.meta["x_range"][1] - store.meta["x_range"][0]
+    basin_tol = basin_tol or x_span / 200.0
+
+    labels = np.full((res, res), DIVERGED, dtype=np.int64)   # 발산·미수렴, 그 외: 타일별 격자 칸 번호(전체 순번)
+    final_f = np.full((res, res), np.nan, dtype=np.float32)
+    loss_sum = np.zeros(steps + 1)
+    loss_count = np.zeros(steps + 1)
+    cell_keys, cell_counts, cell_fsums = [], [], []   # 타일별 (격자 칸, 개수, f 합)
+    n_cells = 0
+
+    for index in range(store.n_tiles * store.n_tiles):
+        ty, tx, rs, cs, (rows, cols) = store.tile_bounds(index)
+        tile_paths = store.tile_view(ty, tx)
+        with np.errstate(all="ignore"):
+            for step in range(steps + 1):
+                prev_pts, prev_fv = (pts, fv) if step else (None, None)
+                pts = np.asarray(tile_paths[step, :, :rows, :cols], dtype=float)
+                fv = evaluate_on_grid(f_np_func, pts[0], pts[1])
+                ok = np.isfinite(fv)
+                loss_sum[step] += fv[ok].sum()
+                loss_count[step] += ok.sum()
+            # 수렴 판정: 마지막 스텝의 이동 거리 또는 함숫값 변화가 작음
+            converged = ((np.hypot(*(pts - prev_pts)) <= basin_tol * CONVERGE_MOVE)
+                         | (np.abs(fv - prev_fv) <= CONVERGE_RTOL * (1.0 + np.abs(fv))))
+        final_f[rs, cs] = fv
+
+        # 수렴한 최종 위치를 basin_tol 격자 칸으로 반올림 → 타일 안에서 칸별 개수·f 합 (파이썬 반복 없음)
+        fin = pts.reshape(2, -1)
+        ok_flat = ok.ravel() & np.isfinite(fin).all(axis=0)
+        seed = ok_flat & converged.ravel()
+        keys = np.clip(np.rint(fin[:, seed] / basin_tol), -_KEY_LIMIT, _KEY_LIMIT).astype(np.int64).T
+        tile_labels = np.full(fin.shape[1], DIVERGED, dtype=np.int64)
+        tile_labels[ok_flat & ~seed] = UNCONVERGED
+        if len(keys):
+            uniq, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            tile_labels[seed] = n_cells + inverse
+            cell_keys.append(uniq)
+            cell_counts.append(np.bincount(inverse, minlength=len(uniq)))
+            cell_fsums.append(np.bincount(inverse, weights=fv.ravel()[seed], minlength=len(uniq)))
+            n_cells += len(uniq)
+        labels[rs, cs] = tile_labels.reshape(rows, cols)
+
+    finite_final = final_f[np.isfinite(final_f)]
+    hist, edges = (np.histogram(finite_final, bins=bins) if finite_final.size
+                   else (np.zeros(bins, dtype=int), np.linspace(0, 1, bins + 1)))
+    basins, remap, other_count = [], np.empty(0, dtype=np.int32), 0
+    if n_cells:
+        basins, remap, other_count = _merge_basins(
+            np.concatenate(cell_keys), np.concatenate(cell_counts), np.concatenate(cell_fsums),
+            basin_tol, radius=3, max_basins=max_basins
+        )
+    labels = np.where(labels >= 0, remap[np.maximum(labels, 0)] if n_cells else DIVERGED, labels).astype(np.int32)
+    return {
+        "labels": labels,             # 수렴 영역 번호 (DIVERGED: 발산, UNCONVERGED: 미수렴)
+        "final_f": final_f,
+        "basins": basins,
+        "other_count": other_count,   # max_basins개 밖의 작은 영역에 속한 시작점 수 (라벨 = max_basins)
+        "mean_loss": np.where(loss_count > 0, loss_sum / np.maximum(loss_count, 1), np.nan),
+        "diverged_fraction": 1.0 - loss_count / float(res * res),
+        "unconverged_count": int((labels == UNCONVERGED).sum()),   # 마지막 스텝에도 움직이던 시작점 수
+        "final_hist": (hist, edges),
+    }
+
+
+def _merge_basins(keys, counts, fsums, cell, radius=3, max_basins=MAX_BASINS):
+    """격자 칸별 (개수, f 합)을 모아, 반지름 radius칸 안의 이웃 칸을 연결 성분으로 묶어 수렴 영역 생성
+    → (큰 것부터 max_basins개 영역 목록, 입력 칸 → 라벨 배열, 나머지 영역의 시작점 수)"""
+    cells, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    n = len(cells)
+    cell_counts = np.bincount(inverse, weights=counts, minlength=n)
+    cell_fsums = np.bincount(inverse, weights=fsums, minlength=n)
+
+    # 칸 좌표를 정수 하나로 부호화 (np.unique가 사전순 정렬하므로 부호도 오름차순) → 이웃 칸을 이진 탐색으로 찾음
+    origin = cells.min(axis=0) - radius
+    span = int(cells[:, 1].max() - origin[1]) + radius + 1
+    code = (cells[:, 0] - origin[0]) * span + (cells[:, 1] - origin[1])
+    edge_from, edge_to = [], []
+    for dx in range(0, radius + 1):
+        for dy in range(-radius, radius + 1):
+            if (dx == 0 and dy <= 0) or dx * dx + dy * dy > radius * radius:
+                continue   # 반평면의 이웃만 (무방향 그래프라 반대쪽은 같은 간선)
+            target = code + dx * span + dy
+            pos = np.minimum(np.searchsorted(code, target), n - 1)
+            hit = np.nonzero(code[pos] == target)[0]
+            edge_from.append(hit)
+            edge_to.append(pos[hit])
+    edge_from, edge_to = np.concatenate(edge_from), np.concatenate(edge_to)
+    graph = coo_matrix((np.ones(len(edge_from), dtype=np.int8), (edge_from, edge_to)), shape=(n, n))
+    n_components, component = connected_components(graph, directed=False)
+
+    comp_counts = np.bincount(component, weights=cell_counts, minlength=n_components)
+    comp_fsums = np.bincount(component, weights=cell_fsums, minlength=n_components)
+    comp_x = np.bincount(component, weights=cell_counts * cells[:, 0], minlength=n_components)
+    comp_y = np.bincount(component, weights=cell_counts * cells[:, 1], minlength=n_components)
+
+    # 큰 영역부터 라벨 0, 1, … (max_basins개 밖은 모두 라벨 max_basins)
+    order = np.argsort(-comp_counts, kind="stable")
+    rank = np.empty(n_components, dtype=np.int32)
+    rank[order] = np.minimum(np.arange(n_components), max_basins)
+    basins = [
+        {"label": j, "x": float(comp_x[c] / comp_counts[c] * cell), "y": float(comp_y[c] / comp_counts[c] * cell),
+         "count": int(comp_counts[c]), "mean_f": float(comp_fsums[c] / comp_counts[c])}
+        for j, c in enumerate(order[:max_basins])
+    ]
+    other_count = int(comp_counts[order[max_basins:]].sum())
+    return basins, rank[component[inverse]], other_count
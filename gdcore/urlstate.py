@@ -0,0 +1,99 @@
+# ============================================================
+#  페이지 설정 ↔ URL 쿼리 파라미터 ("이 설정 그대로 열기" 링크)
+#  - 페이지마다 {파라미터 이름: 형식} 목록을 정하고, 세션의 첫 실행에서만 URL 값을 읽어 둠
+#    → 이후 재실행은 위젯 값이 우선, URL 값은 위젯 기본값·세션 상태 초기값으로만 사용
+#  - 매 실행 끝에 현재 설정을 URL에 다시 기록 → 주소창의 URL을 그대로 공유하면 같은 화면
+#  - 형식: "str", "int", "float", "range"(실수 두 개, 쉼표 구분)
+#  - 잘못된 값은 조용히 무시하고 페이지 기본값 사용
+# ============================================================
+
+import math
+
+import streamlit as st
+
+from gdcore.diskcache import canonical_expression
+
+SHARE_HINT = "🔗 주소창의 URL에 현재 설정이 담겨 있습니다. 그대로 공유하면 같은 설정으로 열립니다."
+
+
+def _decode(kind, text):
+    """쿼리 문자열 → 값 (형식이 맞지 않으면 ValueError)"""
+    if kind == "str":
+        return text
+    if kind == "int":
+        return int(text)
+    if kind == "float":
+        value = float(text)
+        if not math.isfinite(value):
+            raise ValueError(text)
+        return value
+    if kind == "range":
+        low, high = (float(v) for v in text.split(","))
+        if not (math.isfinite(low) and math.isfinite(high) and low < high):
+            raise ValueError(text)
+        return (low, high)
+    raise ValueError(f"알 수 없는 형식: {kind}")
+
+
+def _encode(kind, value):
+    """값 → 쿼리 문자열 (실수는 유효숫자 10자리)"""
+    if kind == "float":
+        return format(float(value), ".10g")
+    if kind == "range":
+        return ",".join(format(float(v), ".10g") for v in value)
+    if kind == "int":
+        return str(int(value))
+    return str(value)
+
+
+class PageLink:
+    """한 페이지의 URL 설정 (첫 실행 때 읽은 값 + 현재 값 기록)"""
+
+    def __init__(self, page, fields):
+        self.fields = fields
+        snapshot_key = f"_url_snapshot_{page}"
+        self.first_run = snapshot_key not in st.session_state
+        if self.first_run:
+            values = {}
+            for name, kind in fields.items():
+                if name in st.query_params:
+                    try:
+                        values[name] = _decode(kind, st.query_params[name])
+                    except ValueError:
+                        continue
+            st.session_state[snapshot_key] = values
+        self.values = st.session_state[snapshot_key]
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def get(self, name, default, bounds=None):
+        """URL 값 (없으면 default) – bounds=(최소, 최대)면 그 안으로 자름"""
+        value = self.values.get(name, default)
+        if bounds is None or value is default:
+            return value
+        low, high = bounds
+        if isinstance(value, tuple):
+            clipped = tuple(min(max(v, low), high) for v in value)
+            return clipped if clipped[0] < clipped[1] else default
+        return type(value)(min(max(value, low), high))
+
+    def index(self, name, options, default=0):
+        """선택 위젯의 기본 index (URL 값이 options에 없으면 default)"""
+        value = self.values.get(name)
+        return options.index(value) if value in options else default
+
+    def update(self, **values):
+        """현재 설정을 URL에 기록 (None 값은 생략, 바뀐 경우에만 갱신)"""
+        encoded = {name: _encode(self.fields[name], value) for name, value in values.items() if value is not None}
+        if st.query_params.to_dict() != encoded:
+            st.query_params.from_dict(encoded)
+
+
+def preset_for_formula(formula, presets, formula_of):
+    """URL의 함수식에 해당하는 프리셋 이름 (없으면 None – 사용자 정의 함수)"""
+    canonical = canonical_expression(formula)
+    for name, preset in presets.items():
+        if formula_of(preset) and canonical_expression(formula_of(preset)) == canonical:
+            return name
+    return None
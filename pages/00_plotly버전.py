@@ -1,43 +1,51 @@
 import streamlit as st
-from sympy import symbols, diff, sympify, lambdify
 import numpy as np
 import plotly.graph_objects as go
 
+from gdcore.cache import get_compiled_function, get_surface_grid
+from gdcore.slicing import SurfaceSlicer
+from gdcore.urlstate import SHARE_HINT, PageLink
+
 st.title("경사하강법 이해를 위한  - 3D 곡면, 절단선, 교점 시각화(석리송 선생님)")
 
-func_input = st.text_input("함수 f(x, y)를 입력하세요 (예: 2*x**3 + 3*y**3)", value="2*x**3 + 3*y**3")
-x_min, x_max = st.slider("x 범위", -10, 10, (-5, 5))
-y_min, y_max = st.slider("y 범위", -10, 10, (-5, 5))
+# 공유 링크(URL 쿼리 파라미터)의 값은 위젯 기본값으로 사용
+link = PageLink("00_plotly", {"f": "str", "xr": "range", "yr": "range", "gx": "int", "gy": "int", "angle": "int"})
+link_xr = tuple(int(v) for v in link.get("xr", (-5, 5), (-10, 10)))
+link_yr = tuple(int(v) for v in link.get("yr", (-5, 5), (-10, 10)))
+
+func_input = st.text_input("함수 f(x, y)를 입력하세요 (예: 2*x**3 + 3*y**3)", value=link.get("f", "2*x**3 + 3*y**3"))
+x_min, x_max = st.slider("x 범위", -10, 10, link_xr if link_xr[0] < link_xr[1] else (-5, 5))
+y_min, y_max = st.slider("y 범위", -10, 10, link_yr if link_yr[0] < link_yr[1] else (-5, 5))
 
-gx = st.slider("분석할 x 위치", x_min, x_max, 1)
-gy = st.slider("분석할 y 위치", y_min, y_max, 1)
+gx = st.slider("분석할 x 위치", x_min, x_max, link.get("gx", 1, (x_min, x_max)))
+gy = st.slider("분석할 y 위치", y_min, y_max, link.get("gy", 1, (y_min, y_max)))
 
-x, y = symbols('x y')
+direction_mode = st.radio("접선 방향", ["기울기 방향", "직접 각도 지정"], index=int("angle" in link), horizontal=True)
+angle_deg = st.slider("방향 각도 (x축 기준, 도)", 0, 359, link.get("angle", 45, (0, 359)),
+                      disabled=(direction_mode == "기울기 방향"))
+show_plane = st.checkbox("접평면 보기", value=False)
+link.update(f=func_input, xr=(x_min, x_max), yr=(y_min, y_max), gx=gx, gy=gy,
+            angle=angle_deg if direction_mode == "직접 각도 지정" else None)
+st.caption(SHARE_HINT)
 
 try:
-    f = sympify(func_input)
-    f_np = lambdify((x, y), f, modules='numpy')
-    dx_f = diff(f, x)
-    dy_f = diff(f, y)
-    dx_np = lambdify((x, y), dx_f, modules='numpy')
-    dy_np = lambdify((x, y), dy_f, modules='numpy')
-
-    # 전체 곡면
-    X = np.linspace(x_min, x_max, 80)
-    Y = np.linspace(y_min, y_max, 80)
-    Xs, Ys = np.meshgrid(X, Y)
-    Zs = f_np(Xs, Ys)
+    # 함수 변환과 전체 곡면은 (함수식, 범위)별로 캐시 → 분석점 이동 시 선만 다시 계산
+    f_np, dx_np, dy_np = get_compiled_function(func_input)
+    X, Y, Zs = get_surface_grid(func_input, (x_min, x_max), (y_min, y_max), 80)
+    slicer = SurfaceSlicer(X, Y, Zs, f_np, dx_np, dy_np)
 
     # y=gy에서 x 방향 단면 (즉, 곡면과 y=b 평면의 교선)
-    Z_x = f_np(X, np.full_like(X, gy))
+    sx_x, sx_y, Z_x = slicer.slice_at_y(gy)
     # x=gx에서 y 방향 단면 (즉, 곡면과 x=a 평면의 교선)
-    Z_y = f_np(np.full_like(Y, gx), Y)
+    sy_x, sy_y, Z_y = slicer.slice_at_x(gx)
 
-    # 기울기 벡터
-    gz = float(f_np(gx, gy))
-    gdx = float(dx_np(gx, gy))
-    gdy = float(dy_np(gx, gy))
-    arrow_scale = 0.7
+    # 분석점의 함숫값과 기울기 (정확히 계산)
+    gz, gdx, gdy = slicer.point(gx, gy)
+    if direction_mode == "기울기 방향":
+        theta = slicer.gradient_angle(gx, gy)
+    else:
+        theta = np.deg2rad(angle_deg)
+    dir_deriv = slicer.directional_derivative(gx, gy, theta)
 
     fig = go.Figure()
 
@@ -46,14 +54,20 @@ try:
 
     # 2. y=gy 단면선 (x축 평면)
     fig.add_trace(go.Scatter3d(
-        x=X, y=[gy]*len(X), z=Z_x,
+        x=sx_x, y=sx_y, z=Z_x,
         mode='lines', line=dict(color='blue', width=7), name="y=b 단면"
     ))
     # 3. x=gx 단면선 (y축 평면)
     fig.add_trace(go.Scatter3d(
-        x=[gx]*len(Y), y=Y, z=Z_y,
+        x=sy_x, y=sy_y, z=Z_y,
         mode='lines', line=dict(color='orange', width=7), name="x=a 단면"
     ))
+    # 3-1. 선택한 방향의 단면선 (임의 각도 수직 평면)
+    su_x, su_y, Z_u = slicer.slice_along(gx, gy, theta)
+    fig.add_trace(go.Scatter3d(
+        x=su_x, y=su_y, z=Z_u,
+        mode='lines', line=dict(color='green', width=5), name="선택 방향 단면"
+    ))
 
     # 4. 두 곡선의 교차점 (a, b, f(a, b))
     fig.add_trace(go.Scatter3d(
@@ -65,17 +79,21 @@ try:
         name="교차점"
     ))
 
-    # 5. 두 단면선의 교선 (즉, x=a, y=b, z의 직선) - 실제론 곡면위 교차점 하나뿐
-    # 대신, 기울기 방향 직선(접선) 표시 (dx/dy 기준)
-    t = np.linspace(-2, 2, 20)
-    tangent_x = gx + t
-    tangent_y = gy + t * (gdy / gdx) if gdx != 0 else gy + t
-    tangent_z = gz + gdx * t + gdy * t  # 대략적인 tangent 방향
+    # 5. 선택 방향 단면 곡선의 접선: z = f(a, b) + t·(∇f·u)
+    tangent_x, tangent_y, tangent_z = slicer.tangent_line(gx, gy, theta)
     fig.add_trace(go.Scatter3d(
         x=tangent_x, y=tangent_y, z=tangent_z,
-        mode='lines', line=dict(color='red', width=4, dash='dash'), name="기울기(접선) 방향"
+        mode='lines', line=dict(color='red', width=4, dash='dash'), name="접선 (방향 도함수)"
     ))
 
+    # 6. 접평면 조각
+    if show_plane:
+        px, py, pz = slicer.tangent_plane(gx, gy)
+        fig.add_trace(go.Surface(
+            x=px, y=py, z=pz, opacity=0.5, showscale=False,
+            colorscale=[[0, 'salmon'], [1, 'salmon']], name="접평면"
+        ))
+
     fig.update_layout(
         scene=dict(
             xaxis_title='x',
@@ -91,8 +109,10 @@ try:
     st.markdown(
         f"""- **파란색 선:** y={gy} 평면의 단면  
         - **주황색 선:** x={gx} 평면의 단면  
+        - **초록색 선:** 선택한 방향({np.rad2deg(theta) % 360:.1f}°)의 단면  
         - **빨간 점:** 두 단면선의 교점 (즉, 선택한 점)  
-        - **빨간 점선:** 선택점에서의 기울기(gradient) 방향 접선  
+        - **빨간 점선:** 선택한 방향의 접선, 기울기 = 방향 도함수  
+        - **기울기 ∇f:** `({gdx:.3f}, {gdy:.3f})`, **방향 도함수 ∇f·u:** `{dir_deriv:.3f}`  
         """
     )
 
@@ -1,10 +1,31 @@
 # claude 3.7 sonnet
 import streamlit as st
-from sympy import symbols, diff, sympify, lambdify
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
-from scipy.optimize import minimize
-import time
+from plotly.subplots import make_subplots
+
+from gdcore.background import submit_once, wait_for
+from gdcore.bundle import get_bundle
+from gdcore.cache import (get_compiled_function, get_compiled_hessian, get_critical_points, get_curvature_grid,
+                          get_lr_sweep, get_surface_grid)
+from gdcore.classstats import record_run
+from gdcore.compute import minimum as service_minimum, service_available
+from gdcore.contour_view import CONTOUR_VIEW_NAME
+from gdcore.critical import KINDS, summary_text
+from gdcore.curvature import FIELDS as CURVATURE_FIELDS, overlay_spec
+from gdcore.fragments import fragment_timer
+from gdcore.lrsweep import CONVERGE_TOL, RATE_COUNT, best_index, stability_limit
+from gdcore.optimize import (STOP_MESSAGES, STOP_NAN, STOP_OVERFLOW, multi_start_minimum, multi_start_minimum_iter,
+                             stop_reason)
+from gdcore.progressive import cancel_button, consume_cancel, render_progressively
+from gdcore.replay import build_replay_figure, replay_html, replay_npz
+from gdcore.results import cached_prefix, cached_trajectory, get_trajectory, store_trajectory
+from gdcore.runarchive import archive_run
+from gdcore.stages import stage_graph
+from gdcore.surface_view import replace_gd_path, static_figure
+from gdcore.timing import RerunTimer, current_session_id, debug_panel_enabled, render_timing_panel
+from gdcore.urlstate import SHARE_HINT, PageLink, preset_for_formula
 
 # ----- 애플리케이션 설정 및 메타데이터 -----
 st.set_page_config(
@@ -83,11 +104,29 @@ CAMERA_ANGLES = {
     "정면(y+방향)": dict(x=0.0, y=2.0, z=0.5),
     "위에서 내려다보기": dict(x=0.0, y=0.0, z=3.0),
     "뒤쪽(x-방향)": dict(x=-2.0, y=0.0, z=0.5),
-    "옆(y-방향)": dict(x=0.0, y=-2.0, z=0.5)
+    "옆(y-방향)": dict(x=0.0, y=-2.0, z=0.5),
+    CONTOUR_VIEW_NAME: None  # 저사양 기기용 2D 등고선 보기 (카메라 없음)
+}
+
+# 곡률 지도 겹쳐 보기 옵션 (이름 → curvature.FIELDS 키, None은 끄기)
+CURVATURE_OPTIONS = {"끄기": None, **{label: name for name, (label, _, _) in CURVATURE_FIELDS.items()}}
+CURVATURE_RESOLUTIONS = {"보통 (80×80)": 80, "자세히 (160×160, 격자점 4배)": 160}
+
+# 학습률 탐색기 범위 선택지 (학습률 입력 범위 0.0001 ~ 1.0 안)
+LR_EXPLORER_OPTIONS = [0.0001, 0.0003, 0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0]
+
+# 배경 SciPy 탐색: 재실행 끝에서는 잠깐만 기다리고, 그 뒤로는 진행 표시 fragment가 주기적으로 완료 여부 확인
+SCIPY_WAIT = 0.3            # 초
+SCIPY_POLL_INTERVAL = 0.5   # 초
+
+# 공유 링크(URL 쿼리 파라미터)에 담는 설정
+LINK_FIELDS = {
+    "f": "str", "xr": "range", "yr": "range", "sx": "float", "sy": "float",
+    "lr": "float", "n": "int", "cam": "str", "step": "int", "heat": "str", "hres": "int"
 }
 
 # ----- 2. 세션 상태 초기화 및 관리 함수 -----
-def initialize_session_state():
+def initialize_session_state(stages):
     """세션 상태 변수 초기화"""
     # 기본 함수 선택
     if "selected_func_type" not in st.session_state:
@@ -114,35 +153,37 @@ def initialize_session_state():
             st.session_state[session_key] = preset_params[preset_key]
     
     # 경사하강법 경로 초기화
-    update_gd_path_if_needed()
+    update_gd_path_if_needed(stages)
 
-def update_gd_path_if_needed():
-    """파라미터 변경 시 경사하강법 경로 초기화"""
-    current_func = get_current_function_string()
-    start_x = st.session_state.start_x_slider
-    start_y = st.session_state.start_y_slider
-    learning_rate = st.session_state.learning_rate_input
-    
-    # 주요 파라미터가 변경되었는지 확인
-    if ("gd_path" not in st.session_state or
-        st.session_state.get("last_func_eval", "") != current_func or
-        st.session_state.get("last_start_x_eval", 0.0) != start_x or
-        st.session_state.get("last_start_y_eval", 0.0) != start_y or
-        st.session_state.get("last_lr_eval", 0.0) != learning_rate):
-        
-        # 경로 초기화
-        st.session_state.gd_path = [(float(start_x), float(start_y))]
-        st.session_state.gd_step = 0
-        st.session_state.play = False
-        
-        # 현재 상태 저장
-        st.session_state.last_func_eval = current_func
-        st.session_state.last_start_x_eval = start_x
-        st.session_state.last_start_y_eval = start_y
-        st.session_state.last_lr_eval = learning_rate
-        st.session_state.animation_camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
-        st.session_state.messages = []
-        st.session_state.educational_logs = []
+def path_stage_inputs():
+    """경로 단계의 입력 (함수식, 시작점, 학습률) – 하나라도 바뀌면 경로를 처음부터
+    최대 반복은 넣지 않음: 늘리면 지금 경로에서 이어서 진행, 줄이면 그 스텝까지 잘라 냄"""
+    return (
+        get_current_function_string(),
+        (st.session_state.start_x_slider, st.session_state.start_y_slider),
+        st.session_state.learning_rate_input
+    )
+
+def reset_gd_path():
+    """경로를 시작점만 남기고 초기화"""
+    st.session_state.gd_path = [(float(st.session_state.start_x_slider), float(st.session_state.start_y_slider))]
+    st.session_state.gd_step = 0
+    st.session_state.play = False
+    st.session_state.animation_camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
+    st.session_state.messages = []
+    st.session_state.educational_logs = []
+
+def update_gd_path_if_needed(stages):
+    """경로 단계의 입력 지문이 바뀌었을 때만 경사하강법 경로 초기화"""
+    if not st.session_state.get("gd_path"):
+        stages.invalidate("path")
+    stages.run("path", path_stage_inputs(), reset_gd_path)
+    # 최대 반복을 줄였으면 그 스텝까지만 남김 (같은 설정의 앞부분이라 다시 계산할 필요 없음)
+    steps = st.session_state.steps_slider
+    if st.session_state.get("gd_step", 0) > steps:
+        st.session_state.gd_path = st.session_state.gd_path[:steps + 1]
+        st.session_state.gd_step = steps
+        st.session_state.educational_logs = st.session_state.educational_logs[:steps]
 
 def apply_preset_for_func_type(func_type_name):
     """함수 유형에 맞는 프리셋 적용"""
@@ -167,6 +208,55 @@ def apply_preset_for_func_type(func_type_name):
     st.session_state.start_x_slider = max(new_x_min, min(new_x_max, st.session_state.start_x_slider))
     st.session_state.start_y_slider = max(new_y_min, min(new_y_max, st.session_state.start_y_slider))
 
+def apply_page_link(link, stages):
+    """공유 링크의 설정을 세션 상태에 반영 (세션의 첫 실행에서만)"""
+    if not link.first_run or not link.values:
+        return
+    
+    # 함수식이 프리셋과 같으면 그 프리셋, 아니면 사용자 정의 함수
+    if "f" in link:
+        func_type = preset_for_formula(link.values["f"], PRESETS, lambda p: p["formula"]) or "사용자 정의 함수 입력"
+        st.session_state.selected_func_type = func_type
+        st.session_state.user_func_input = link.values["f"]
+        apply_preset_for_func_type(func_type)
+    
+    for session_key, name, bounds in (
+        ("x_min_max_slider", "xr", (-10.0, 10.0)),
+        ("y_min_max_slider", "yr", (-10.0, 10.0)),
+        ("learning_rate_input", "lr", (0.0001, 1.0)),
+        ("steps_slider", "n", (1, 100)),
+    ):
+        value = link.get(name, None, bounds)
+        if value is not None:
+            st.session_state[session_key] = value
+    if link.get("cam", None) in CAMERA_ANGLES:
+        st.session_state.selected_camera_option_name = link.values["cam"]
+    if link.get("heat", None) in CURVATURE_FIELDS:
+        st.session_state.curvature_overlay = link.values["heat"]
+    if link.get("hres", None) in CURVATURE_RESOLUTIONS.values():
+        st.session_state.curvature_resolution = link.values["hres"]
+    
+    # 시작점은 범위 안으로 조정
+    st.session_state.start_x_slider = link.get("sx", st.session_state.start_x_slider, st.session_state.x_min_max_slider)
+    st.session_state.start_y_slider = link.get("sy", st.session_state.start_y_slider, st.session_state.y_min_max_slider)
+    update_gd_path_if_needed(stages)
+
+def update_page_link(link, current_func):
+    """현재 설정과 진행 스텝을 URL에 기록"""
+    link.update(
+        f=current_func,
+        xr=st.session_state.x_min_max_slider,
+        yr=st.session_state.y_min_max_slider,
+        sx=st.session_state.start_x_slider,
+        sy=st.session_state.start_y_slider,
+        lr=st.session_state.learning_rate_input,
+        n=st.session_state.steps_slider,
+        cam=st.session_state.selected_camera_option_name,
+        step=st.session_state.gd_step or None,
+        heat=st.session_state.get("curvature_overlay"),
+        hres=st.session_state.get("curvature_resolution") if st.session_state.get("curvature_overlay") else None
+    )
+
 def get_current_function_string():
     """현재 선택된 함수식 문자열 반환"""
     if st.session_state.selected_func_type == "사용자 정의 함수 입력":
@@ -180,283 +270,186 @@ def get_current_educational_tip():
 
 # ----- 3. 수학적 함수 계산 및 시각화 함수 -----
 def prepare_function_and_gradients(func_input):
-    """함수 문자열로부터 함수와 기울기 함수 생성"""
-    x_sym, y_sym = symbols('x y')
-    
+    """함수 문자열로부터 함수와 기울기 함수 생성 (도함수가 크면 자동 미분 사용)"""
     try:
-        # 함수식 파싱 및 변환
-        f_sym_parsed = sympify(func_input)
-        f_np_parsed = lambdify(
-            (x_sym, y_sym), 
-            f_sym_parsed, 
-            modules=['numpy', {'cos': np.cos, 'sin': np.sin, 'exp': np.exp, 'sqrt': np.sqrt, 'pi': np.pi}]
-        )
-        
-        # 미분 계산
-        dx_f_sym_parsed = diff(f_sym_parsed, x_sym)
-        dy_f_sym_parsed = diff(f_sym_parsed, y_sym)
-        
-        # 넘파이 함수로 변환
-        dx_np_parsed = lambdify(
-            (x_sym, y_sym), 
-            dx_f_sym_parsed, 
-            modules=['numpy', {'cos': np.cos, 'sin': np.sin, 'exp': np.exp, 'sqrt': np.sqrt, 'pi': np.pi}]
-        )
-        dy_np_parsed = lambdify(
-            (x_sym, y_sym), 
-            dy_f_sym_parsed, 
-            modules=['numpy', {'cos': np.cos, 'sin': np.sin, 'exp': np.exp, 'sqrt': np.sqrt, 'pi': np.pi}]
-        )
-        
+        f_np_parsed, dx_np_parsed, dy_np_parsed = get_compiled_function(func_input)
         return f_np_parsed, dx_np_parsed, dy_np_parsed, None
     except Exception as e:
         return None, None, None, str(e)
 
-def find_scipy_minimum(f_np_func, start_x, start_y, func_type):
-    """SciPy 최적화 함수를 사용하여 최소값 찾기"""
+def scipy_start_points(start_x, start_y, func_type):
+    """SciPy 최적화 시작점 목록"""
+    potential_starts = [[0.0, 0.0], [float(start_x), float(start_y)]]
+    if "Himmelblau" in func_type:
+        # Himmelblau 함수의 알려진 최소점 근처에서 시작
+        potential_starts.extend([[3, 2], [-2.805, 3.131], [-3.779, -3.283], [3.584, -1.848]])
+    return potential_starts
+
+def find_scipy_minimum(current_func, f_np_func, start_x, start_y, func_type, on_progress=None):
+    """SciPy 최적화 함수를 사용하여 최소값 찾기 (on_progress로 시작점별 중간 결과 표시)"""
     try:
-        def min_func_scipy(vars_list): 
-            return f_np_func(vars_list[0], vars_list[1])
-        
-        # 여러 시작점에서 최적화 시도
-        potential_starts = [[0.0, 0.0], [float(start_x), float(start_y)]]
-        if "Himmelblau" in func_type:
-            # Himmelblau 함수의 알려진 최소점 근처에서 시작
-            potential_starts.extend([[3, 2], [-2.805, 3.131], [-3.779, -3.283], [3.584, -1.848]])
-        
-        best_res = None
-        for p_start in potential_starts:
-            res_temp = minimize(
-                min_func_scipy, 
-                p_start, 
-                method='Nelder-Mead', 
-                tol=1e-6, 
-                options={'maxiter': 200, 'adaptive': True}
-            )
-            if best_res is None or (res_temp.success and res_temp.fun < best_res.fun) or (res_temp.success and not best_res.success):
-                best_res = res_temp
-        
-        if best_res and best_res.success:
-            min_x_sp, min_y_sp = best_res.x
-            min_z_sp = f_np_func(min_x_sp, min_y_sp)
-            return (min_x_sp, min_y_sp, min_z_sp), None
+        # 여러 시작점에서 최적화 시도 (계산 서비스가 있으면 그쪽에서 한 번에 – 중간 결과 없음)
+        potential_starts = scipy_start_points(start_x, start_y, func_type)
+        if service_available():
+            min_point = service_minimum(current_func, potential_starts,
+                                        lambda: multi_start_minimum(f_np_func, potential_starts))
+        elif on_progress is not None:
+            _, _, min_point = render_progressively(multi_start_minimum_iter(f_np_func, potential_starts), on_progress)
+        else:
+            min_point = multi_start_minimum(f_np_func, potential_starts)
+        if min_point is not None:
+            return min_point, None
         else:
             return None, "SciPy 최적점을 찾지 못했습니다."
     except Exception as e:
         return None, f"SciPy 오류: {str(e)[:100]}..."
 
-def plot_gd(f_np_func, dx_np_func, dy_np_func, x_range, y_range, gd_path, 
-            min_point_scipy, current_camera_eye, educational_mode=False):
-    """경사 하강법 경로 및 함수 표면 플롯팅"""
-    x_min, x_max = x_range
-    y_min, y_max = y_range
-    
-    # 그래프 데이터 준비
-    X_plot = np.linspace(x_min, x_max, 80)
-    Y_plot = np.linspace(y_min, y_max, 80)
-    Xs_plot, Ys_plot = np.meshgrid(X_plot, Y_plot)
-    
-    try: 
-        Zs_plot = f_np_func(Xs_plot, Ys_plot)
-    except Exception: 
-        Zs_plot = np.zeros_like(Xs_plot)
-    
-    # 그래프 객체 생성
-    fig = go.Figure()
-    
-    # 함수 표면 추가
-    fig.add_trace(go.Surface(
-        x=X_plot, y=Y_plot, z=Zs_plot, 
-        opacity=0.7, 
-        colorscale='Viridis',
-        contours_z=dict(
-            show=True, 
-            usecolormap=True, 
-            highlightcolor="limegreen", 
-            project_z=True
-        ),
-        name="함수 표면 f(x,y)", 
-        showscale=False
-    ))
-    
-    # 경사 하강 경로 데이터 준비
-    px, py = zip(*gd_path)
-    try: 
-        pz = [f_np_func(pt_x, pt_y) for pt_x, pt_y in gd_path]
-    except Exception: 
-        pz = [np.nan_to_num(f_np_func(pt_x, pt_y)) for pt_x, pt_y in gd_path]
-    
-    # 경로 텍스트 준비 (교육 모드에서는 더 자세한 정보 표시)
-    if educational_mode and len(gd_path) > 1:
-        path_texts = []
-        for idx, ((pt_x, pt_y), pt_z) in enumerate(zip(gd_path, pz)):
-            if idx == 0:
-                path_texts.append(f"시작점<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
-            elif idx == len(gd_path) - 1:
-                path_texts.append(f"현재점<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
-            else:
-                path_texts.append(f"S{idx}<br>({pt_x:.2f}, {pt_y:.2f})<br>f={pt_z:.2f}")
+def submit_scipy_search(current_func, f_np_func, start_x, start_y, func_type):
+    """SciPy 최소값 탐색을 공유 스레드 풀에 제출 (같은 함수·시작점의 진행 중 탐색은 재사용)"""
+    key = ("scipy_minimum", current_func, float(start_x), float(start_y), func_type)
+    return submit_once(
+        key, lambda report: find_scipy_minimum(current_func, f_np_func, start_x, start_y, func_type,
+                                               on_progress=report)
+    )
+
+def show_scipy_result(scipy_result_placeholder, min_point_scipy_coords, scipy_error):
+    """사이드바에 SciPy 최적점 결과 표시"""
+    if min_point_scipy_coords:
+        min_x_sp, min_y_sp, min_z_sp = min_point_scipy_coords
+        scipy_result_placeholder.markdown(
+            f"""- **위치 (x, y)**: `({min_x_sp:.3f}, {min_y_sp:.3f})` <br> - **함수 값 f(x,y)**: `{min_z_sp:.4f}`""", 
+            unsafe_allow_html=True
+        )
     else:
-        path_texts = [f"S{idx}<br>({pt_x:.2f}, {pt_y:.2f})" for idx, (pt_x, pt_y) in enumerate(gd_path)]
-    
-    # 경로 트레이스 추가
-    fig.add_trace(go.Scatter3d(
-        x=px, y=py, z=pz, 
-        mode='lines+markers+text',
-        marker=dict(
-            size=5, 
-            color='red', 
-            symbol='circle',
-            colorscale=[[0, 'pink'], [1, 'red']],  # 시작점에서 현재점까지 색상 그라데이션
-            showscale=False
-        ), 
-        line=dict(color='red', width=3),
-        name="경사 하강 경로", 
-        text=path_texts, 
-        textposition="top right", 
-        textfont=dict(size=10, color='black')
-    ))
-    
-    # 기울기 화살표 추가
-    arrow_scale_factor = 0.3
-    num_arrows_to_show = min(5, len(gd_path) - 1)
-    if num_arrows_to_show > 0:
-        for i in range(num_arrows_to_show):
-            arrow_start_idx = len(gd_path) - 1 - i - 1
-            if arrow_start_idx < 0: 
-                continue
-                
-            gx, gy = gd_path[arrow_start_idx]
-            try:
-                gz = f_np_func(gx, gy)
-                grad_x_arrow = dx_np_func(gx, gy)
-                grad_y_arrow = dy_np_func(gx, gy)
-                
-                if not (np.isnan(grad_x_arrow) or np.isnan(grad_y_arrow) or np.isnan(gz)):
-                    # 기울기 벡터(경사) 화살표
-                    fig.add_trace(go.Cone(
-                        x=[gx], y=[gy], 
-                        z=[gz + 0.02 * np.abs(gz) if gz != 0 else 0.02],
-                        u=[-grad_x_arrow * arrow_scale_factor], 
-                        v=[-grad_y_arrow * arrow_scale_factor], 
-                        w=[0], 
-                        sizemode="absolute", 
-                        sizeref=0.25, 
-                        colorscale=[[0, 'magenta'], [1, 'magenta']], 
-                        showscale=False, 
-                        anchor="tail", 
-                        name=f"기울기 S{arrow_start_idx}" if i == 0 else "", 
-                        hoverinfo='skip',
-                        opacity = 0.15
-                    ))
-                    
-                    # 교육 모드에서는 추가 정보 표시
-                    if educational_mode and i == 0:
-                        grad_mag = np.sqrt(grad_x_arrow**2 + grad_y_arrow**2)
-                        fig.add_annotation(
-                            x=gx, y=gy, z=gz + 0.5,
-                            text=f"기울기 크기: {grad_mag:.2f}",
-                            showarrow=True,
-                            arrowhead=2,
-                            arrowcolor="magenta",
-                            arrowwidth=2,
-                            ax=20, ay=-40
-                        )
-            except Exception: 
-                continue
-    
-    # SciPy 최적점 추가
-    if min_point_scipy:
-        min_x_sp, min_y_sp, min_z_sp = min_point_scipy
-        fig.add_trace(go.Scatter3d(
-            x=[min_x_sp], y=[min_y_sp], z=[min_z_sp], 
-            mode='markers+text',
-            marker=dict(size=10, color='cyan', symbol='diamond'),
-            text=["SciPy 최적점"], 
-            textposition="bottom center", 
-            name="SciPy 최적점"
-        ))
-    
-    # 현재 GD 위치 강조
-    last_x_gd, last_y_gd = gd_path[-1]
-    try: 
-        last_z_gd = f_np_func(last_x_gd, last_y_gd)
-    except Exception: 
-        last_z_gd = np.nan
-    
-    fig.add_trace(go.Scatter3d(
-        x=[last_x_gd], y=[last_y_gd], 
-        z=[last_z_gd if not np.isnan(last_z_gd) else Zs_plot.min()], 
-        mode='markers+text',
-        marker=dict(
-            size=8, 
-            color='orange', 
-            symbol='circle', 
-            line=dict(color='black', width=1)
-        ),
-        text=["현재 위치"], 
-        textposition="top left", 
-        name="GD 현재 위치"
-    ))
-    
-    # 그래프 레이아웃 설정
-    fig.update_layout(
-        scene=dict(
-            xaxis_title='x', 
-            yaxis_title='y', 
-            zaxis_title='f(x, y)',
-            camera=dict(eye=current_camera_eye),
-            aspectmode='cube'
-        ),
-        height=600, 
-        margin=dict(l=0, r=0, t=30, b=0),
-        title_text="경사 하강법 경로 및 함수 표면", 
-        title_x=0.5,
-        legend=dict(
-            orientation="h", 
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1
+        scipy_result_placeholder.info(scipy_error if scipy_error else "SciPy 최적점을 찾지 못했습니다.")
+
+@st.fragment(run_every=SCIPY_POLL_INTERVAL)
+def scipy_progress_panel(scipy_job):
+    """배경 SciPy 탐색 진행 표시 (fragment: 주기적으로 완료 여부만 확인, 끝나면 전체 재실행으로 결과 반영)"""
+    if scipy_job.done():
+        st.rerun()  # 다음 재실행의 minimum 단계가 끝난 작업의 결과를 바로 사용 (사이드바·그래프 최적점)
+    partial = scipy_job.progress
+    st.markdown(f"SciPy 탐색 중... ({partial[0]}/{partial[1]} 시작점)" if partial else "SciPy 탐색 중...")
+
+def prepare_critical_points(current_func):
+    """현재 함수·범위의 임계점 목록 (표시 끔 또는 계산 실패 시 None)"""
+    if not st.session_state.get("show_critical_points", True):
+        return None
+    try:
+        return get_critical_points(
+            current_func, 
+            tuple(st.session_state.x_min_max_slider), 
+            tuple(st.session_state.y_min_max_slider)
         )
-    )
-    
-    # 교육 모드에서 추가적인 설명 추가
-    if educational_mode and len(gd_path) > 1:
-        # 최근 스텝에 대한 정보 추가
-        if len(gd_path) >= 2:
-            current_x, current_y = gd_path[-1]
-            prev_x, prev_y = gd_path[-2]
-            try:
-                current_z = f_np_func(current_x, current_y)
-                prev_z = f_np_func(prev_x, prev_y)
-                grad_x = dx_np_func(prev_x, prev_y)
-                grad_y = dy_np_func(prev_x, prev_y)
-                grad_magnitude = np.sqrt(grad_x**2 + grad_y**2)
-                
-                # 함수값 변화에 대한 주석
-                change = current_z - prev_z
-                change_text = f"함수값 변화: {change:.4f}"
-                color = "green" if change < 0 else "red"
-                
-                fig.add_annotation(
-                    x=(current_x + prev_x)/2, 
-                    y=(current_y + prev_y)/2,
-                    z=(current_z + prev_z)/2 + 0.5,
-                    text=change_text,
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowcolor=color,
-                    arrowwidth=2,
-                    ax=0, ay=-40
-                )
-            except Exception:
-                pass
-    
-    return fig
+    except Exception:
+        return None
+
+def show_critical_points(critical_placeholder, critical_points):
+    """사이드바에 임계점 요약과 목록 표시"""
+    if critical_points is None:
+        critical_placeholder.empty()
+        return
+    with critical_placeholder.container():
+        st.markdown(f"**임계점 (∇f = 0)**: {summary_text(critical_points)}")
+        if len(critical_points["x"]):
+            with st.expander("임계점 목록 (헤세 행렬 고윳값으로 분류)"):
+                st.dataframe(pd.DataFrame({
+                    "종류": [KINDS[k] for k in critical_points["kind"]],
+                    "x": critical_points["x"],
+                    "y": critical_points["y"],
+                    "f(x, y)": critical_points["z"],
+                    "λ₁": critical_points["eigenvalues"][:, 0],
+                    "λ₂": critical_points["eigenvalues"][:, 1],
+                }), hide_index=True)
+
+def surface_resolution():
+    """표면 격자 해상도 (곡률 지도를 켜면 선택한 해상도, 아니면 기본 80)"""
+    if st.session_state.get("curvature_overlay"):
+        return st.session_state.get("curvature_resolution", 80)
+    return 80
+
+def prepare_curvature_overlay(current_func):
+    """선택한 곡률 지도의 겹쳐 그리기 정보 (끔 또는 계산 실패 시 None)"""
+    name = st.session_state.get("curvature_overlay")
+    if not name:
+        return None
+    try:
+        fields = get_curvature_grid(
+            current_func, 
+            tuple(st.session_state.x_min_max_slider), 
+            tuple(st.session_state.y_min_max_slider),
+            surface_resolution()
+        )
+        return overlay_spec(name, fields)
+    except Exception:
+        return None
 
 # ----- 4. 경사 하강법 알고리즘 구현 -----
-def gradient_descent_step(f_np_func, dx_np_func, dy_np_func, current_point, learning_rate):
+def logs_from_trajectory(path, values, grads):
+    """미리 계산된 경로 배열로 교육용 스텝 로그 생성"""
+    return [
+        {
+            "step": i + 1,
+            "current_point": (float(path[i][0]), float(path[i][1])),
+            "current_value": float(values[i]),
+            "gradient": (float(grads[i][0]), float(grads[i][1])),
+            "gradient_magnitude": float(np.hypot(grads[i][0], grads[i][1])),
+            "next_point": (float(path[i + 1][0]), float(path[i + 1][1])),
+            "next_value": float(values[i + 1]),
+            "improvement": float(values[i] - values[i + 1])
+        }
+        for i in range(len(grads))
+    ]
+
+def trajectory_from_logs(gd_path, logs, f_np_func):
+    """스텝 로그 → 경로 배열 (path, values, grads) – 결과 캐시 저장용"""
+    path = np.array(gd_path, dtype=float)
+    if logs:
+        values = [log["current_value"] for log in logs] + [logs[-1]["next_value"]]
+    else:
+        values = [f_np_func(*path[0])]
+    grads = np.array([log["gradient"] for log in logs], dtype=float).reshape(-1, 2)
+    return path, np.array(values, dtype=float), grads
+
+def restore_linked_run(link, current_func, functions):
+    """공유 링크의 진행 스텝까지 경로 복원 (설정별 결과 캐시의 전체 실행 경로에서 잘라 씀)"""
+    step = min(link.get("step", 0), st.session_state.steps_slider)
+    if not link.first_run or step <= 0:
+        return
+    path_arr, values_arr, grads_arr = get_trajectory(
+        current_func,
+        functions,
+        (st.session_state.start_x_slider, st.session_state.start_y_slider),
+        st.session_state.learning_rate_input,
+        st.session_state.steps_slider
+    )
+    path_arr, values_arr, grads_arr = path_arr[:step + 1], values_arr[:step + 1], grads_arr[:step]
+    st.session_state.gd_path = [(float(px), float(py)) for px, py in path_arr]
+    st.session_state.gd_step = len(grads_arr)
+    st.session_state.educational_logs = logs_from_trajectory(path_arr, values_arr, grads_arr)
+
+def gd_step_chunks(f_np_func, dx_np_func, dy_np_func, start_point, learning_rate, steps, chunk_size=10,
+                   first_step=1):
+    """전체 실행을 chunk_size 스텝씩 나눠 (새 점 목록, 새 로그 목록, 오류 메시지 또는 None) 생성"""
+    current_point = start_point
+    points, logs = [], []
+    for step_index in range(steps):
+        next_point, step_result = gradient_descent_step(
+            f_np_func, dx_np_func, dy_np_func, current_point, learning_rate, step_number=first_step + step_index
+        )
+        if not isinstance(step_result, dict):  # 오류 발생
+            yield points, logs, step_result
+            return
+        points.append(next_point)
+        logs.append(step_result)
+        current_point = next_point
+        if len(points) >= chunk_size:
+            yield points, logs, None
+            points, logs = [], []
+    if points:
+        yield points, logs, None
+
+def gradient_descent_step(f_np_func, dx_np_func, dy_np_func, current_point, learning_rate, step_number=None):
     """경사 하강법 한 스텝 실행"""
     curr_x, curr_y = current_point
     
@@ -465,9 +458,10 @@ def gradient_descent_step(f_np_func, dx_np_func, dy_np_func, current_point, lear
         grad_x_val = dx_np_func(curr_x, curr_y)
         grad_y_val = dy_np_func(curr_x, curr_y)
         
-        # NaN 체크
+        # NaN 체크 (이미 발산한 점에서 나온 NaN이면 발산으로 안내)
         if np.isnan(grad_x_val) or np.isnan(grad_y_val):
-            return None, "기울기 계산 결과가 NaN입니다."
+            reason = stop_reason(f_np_func, dx_np_func, dy_np_func, current_point, learning_rate)
+            return None, STOP_MESSAGES.get(reason, STOP_MESSAGES[STOP_NAN])
         
         # 다음 위치 계산
         next_x = curr_x - learning_rate * grad_x_val
@@ -479,7 +473,7 @@ def gradient_descent_step(f_np_func, dx_np_func, dy_np_func, current_point, lear
         grad_magnitude = np.sqrt(grad_x_val**2 + grad_y_val**2)
         
         log_info = {
-            "step": st.session_state.gd_step + 1,
+            "step": step_number if step_number is not None else st.session_state.gd_step + 1,
             "current_point": (curr_x, curr_y),
             "current_value": current_value,
             "gradient": (grad_x_val, grad_y_val),
@@ -490,6 +484,8 @@ def gradient_descent_step(f_np_func, dx_np_func, dy_np_func, current_point, lear
         }
         
         return (next_x, next_y), log_info
+    except OverflowError:
+        return None, STOP_MESSAGES[STOP_OVERFLOW]
     except Exception as e:
         return None, f"스텝 진행 중 오류: {e}"
 
@@ -628,6 +624,7 @@ def create_sidebar():
             on_change=lambda: setattr(st.session_state, "steps_slider", 
                                      st.session_state.steps_key_widget)
         )
+        st.caption(SHARE_HINT)
         
         # 교육 모드 설정
         st.checkbox(
@@ -639,19 +636,55 @@ def create_sidebar():
                                      st.session_state.educational_mode_checkbox)
         )
         
+        # 임계점 표시 설정
+        st.checkbox(
+            "임계점 모두 표시 (최소점·안장점·최대점)", 
+            value=st.session_state.get("show_critical_points", True),
+            help="범위 안의 여러 시작점에서 뉴턴법으로 ∇f = 0 인 점을 모두 찾아 헤세 행렬로 종류를 구분합니다",
+            key="show_critical_points_checkbox",
+            on_change=lambda: setattr(st.session_state, "show_critical_points", 
+                                     st.session_state.show_critical_points_checkbox)
+        )
+        
+        # 곡률 지도 겹쳐 보기 설정
+        curvature_labels = list(CURVATURE_OPTIONS)
+        current_curvature = st.session_state.get("curvature_overlay")
+        st.selectbox(
+            "곡률 지도 겹쳐 보기",
+            options=curvature_labels,
+            index=list(CURVATURE_OPTIONS.values()).index(current_curvature),
+            help="표면 색을 헤세 행렬 고윳값(휘어진 정도), 조건수(골짜기가 얼마나 길쭉한지), 기울기 크기로 바꿔 봅니다. "
+                 "조건수가 크면 경사 하강이 지그재그로 움직이고, 고윳값이 음수인 곳은 위로 볼록한 방향이 있습니다.",
+            key="curvature_overlay_select_widget",
+            on_change=lambda: setattr(st.session_state, "curvature_overlay", 
+                                     CURVATURE_OPTIONS[st.session_state.curvature_overlay_select_widget])
+        )
+        if current_curvature:
+            resolution_labels = list(CURVATURE_RESOLUTIONS)
+            st.radio(
+                "곡률 지도 해상도",
+                options=resolution_labels,
+                index=list(CURVATURE_RESOLUTIONS.values()).index(st.session_state.get("curvature_resolution", 80)),
+                horizontal=True,
+                key="curvature_resolution_radio_widget",
+                on_change=lambda: setattr(st.session_state, "curvature_resolution", 
+                                         CURVATURE_RESOLUTIONS[st.session_state.curvature_resolution_radio_widget])
+            )
+        
         # SciPy 최적화 결과 섹션
         st.subheader("🔬 SciPy 최적화 결과 (참고용)")
         scipy_result_placeholder = st.empty()
+        critical_placeholder = st.empty()
         
-        return scipy_result_placeholder
+        # 성능 디버그 패널 (재실행 마지막에 채워짐)
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+        
+        return scipy_result_placeholder, critical_placeholder, debug_placeholder
 
 def create_main_interface():
-    """메인 인터페이스 구성"""
-    # 구분선
-    st.markdown("---")
-    
+    """제어 버튼과 진행 상황·그래프 자리 (차트 fragment 안에서 구성)"""
     # 제어 버튼
-    col_btn1, col_btn2, col_btn3, col_btn4 = st.columns([1, 1, 1, 1])
+    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
     
     with col_btn1: 
         step_btn = st.button("🚶 한 스텝 진행", use_container_width=True)
@@ -659,16 +692,14 @@ def create_main_interface():
         play_btn = st.button("▶️ 전체 실행", key="playbtn_widget_key", use_container_width=True)
     with col_btn3: 
         reset_btn = st.button("🔄 초기화", key="resetbtn_widget_key", use_container_width=True)
-    with col_btn4:
-        analytics_btn = st.button("📊 분석 보기", key="analytics_btn_key", use_container_width=True)
+    
+    # 진행 상황·중지 버튼 영역 (전체 실행 중에만 사용)
+    progress_placeholder = st.empty()
     
     # 그래프 표시 영역
     graph_placeholder = st.empty()
     
-    # 분석 결과 표시 영역
-    analytics_placeholder = st.empty()
-    
-    return step_btn, play_btn, reset_btn, analytics_btn, graph_placeholder, analytics_placeholder
+    return step_btn, play_btn, reset_btn, progress_placeholder, graph_placeholder
 
 # 함수 유형 변경 시 콜백
 def handle_func_type_change():
@@ -735,7 +766,6 @@ def display_analytics(f_np_func, gd_path, logs):
             """
             
             # 데이터프레임 생성
-            import pandas as pd
             df = pd.DataFrame({
                 "스텝": steps,
                 "함수값": function_values,
@@ -752,53 +782,205 @@ def display_analytics(f_np_func, gd_path, logs):
     
     return analytics_md, None
 
-# ----- 7. 메인 애플리케이션 실행 -----
-def main():
-    """메인 애플리케이션 실행"""
-    # 세션 상태 초기화
-    initialize_session_state()
-    
-    # 교육 모드 초기화
-    if "educational_mode" not in st.session_state:
-        st.session_state.educational_mode = False
-    
-    if "educational_logs" not in st.session_state:
-        st.session_state.educational_logs = []
-    
-    # 사이드바 생성
-    scipy_result_placeholder = create_sidebar()
-    
-    # 메인 인터페이스 생성
-    step_btn, play_btn, reset_btn, analytics_btn, graph_placeholder, analytics_placeholder = create_main_interface()
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_run_exports(current_func, x_range, y_range, gd_path, min_point_scipy, learning_rate, camera_eye):
+    """현재 실행의 오프라인 재생 HTML과 .npz (같은 실행이면 한 번만 생성)"""
+    f_np_func, dx_np_func, dy_np_func = get_compiled_function(current_func)
+    path = np.asarray(gd_path, dtype=float)
+    with np.errstate(all="ignore"):
+        values = np.array([float(f_np_func(px, py)) for px, py in path])
+        grads = np.array([(float(dx_np_func(px, py)), float(dy_np_func(px, py))) for px, py in path[:-1]]).reshape(-1, 2)
+    surface = get_surface_grid(current_func, x_range, y_range)
+    meta = {
+        "함수": current_func,
+        "x 범위": list(x_range),
+        "y 범위": list(y_range),
+        "시작점": [float(path[0, 0]), float(path[0, 1])],
+        "학습률": learning_rate,
+        "스텝 수": len(path) - 1,
+        "SciPy 최적점": list(min_point_scipy) if min_point_scipy else None,
+    }
+    fig = build_replay_figure(surface, path, values, min_point_scipy, camera_eye)
+    return replay_html(fig, path, values, grads, meta), replay_npz(surface, path, values, grads, min_point_scipy, meta)
+
+def render_export_panel(current_func, min_point_scipy):
+    """실행 결과 내보내기 (파일은 다운로드 버튼을 누를 때 만들어짐)"""
+    if len(st.session_state.gd_path) < 2:
+        return
+    export_args = (
+        current_func,
+        tuple(st.session_state.x_min_max_slider),
+        tuple(st.session_state.y_min_max_slider),
+        tuple(tuple(map(float, p)) for p in st.session_state.gd_path),
+        tuple(min_point_scipy) if min_point_scipy else None,
+        float(st.session_state.learning_rate_input),
+        CAMERA_ANGLES[st.session_state.selected_camera_option_name],
+    )
+    with st.expander("📤 실행 결과 내보내기 (오프라인 재생)"):
+        st.caption("HTML 파일 하나에 그래프와 스텝별 재생, 스텝 로그가 모두 들어 있어 인터넷 없이 브라우저로 열 수 있습니다. "
+                   ".npz 파일은 NumPy로 불러와 직접 분석할 수 있습니다.")
+        col_html, col_npz = st.columns(2)
+        col_html.download_button(
+            "🎞️ HTML 재생 파일", data=lambda: build_run_exports(*export_args)[0],
+            file_name="gd_replay.html", mime="text/html", on_click="ignore",
+            use_container_width=True, key="export_html_btn"
+        )
+        col_npz.download_button(
+            "🗂️ .npz 데이터", data=lambda: build_run_exports(*export_args)[1],
+            file_name="gd_run.npz", mime="application/octet-stream", on_click="ignore",
+            use_container_width=True, key="export_npz_btn"
+        )
+
+def apply_learning_rate(learning_rate):
+    """학습률 입력값 변경 (입력 위젯 상태를 지워 새 값으로 다시 만들어지게 함)"""
+    st.session_state.learning_rate_input = learning_rate
+    st.session_state.pop("lr_key_widget", None)
+
+def plot_lr_sweep(sweep, current_lr, limits, best):
+    """학습률별 최종 함숫값과 수렴 스텝 (로그 x축, 안정성 한계·현재 학습률·추천 학습률 표시)"""
+    rates = sweep["rates"]
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                        subplot_titles=("최종 함숫값 f", f"수렴까지 걸린 스텝 (|∇f| < {CONVERGE_TOL:g})"))
+    fig.add_trace(go.Scatter(x=rates, y=sweep["final_loss"], mode="lines", line=dict(color="#1f77b4"),
+                             name="최종 f", hovertemplate="α=%{x:.4g}<br>f=%{y:.4g}<extra></extra>"), row=1, col=1)
+    fig.add_trace(go.Scatter(x=rates, y=sweep["converge_step"], mode="lines", line=dict(color="#2ca02c"),
+                             name="수렴 스텝", hovertemplate="α=%{x:.4g}<br>%{y:.0f} 스텝<extra></extra>"), row=2, col=1)
+    if sweep["diverged"].any():
+        fig.add_trace(go.Scatter(x=rates[sweep["diverged"]], y=np.zeros(int(sweep["diverged"].sum())), mode="markers",
+                                 marker=dict(size=5, color="gray", symbol="x"), name="발산",
+                                 hovertemplate="α=%{x:.4g}<br>발산<extra></extra>"), row=2, col=1)
     
-    # 현재 함수 준비
-    current_func = get_current_function_string()
-    f_np_func, dx_np_func, dy_np_func, func_error = prepare_function_and_gradients(current_func)
+    # 세로 기준선: 각 행의 값 범위를 잇는 선 트레이스 (로그 축에서도 위치가 그대로)
+    spans = []
+    for values in (sweep["final_loss"], sweep["converge_step"]):
+        finite = values[np.isfinite(values)]
+        spans.append((float(finite.min()), float(finite.max())) if finite.size else (0.0, 1.0))
+    lines = [(value, label, color, dash) for value, label, color, dash in (
+        (limits[0], "2/λmax (시작점)", "red", "dash"),
+        (limits[1], "2/λmax (도착점)", "orange", "dash"),
+        (current_lr, "현재 학습률", "black", "solid"),
+        (best, "추천 학습률", "#9467bd", "dot"),
+    ) if value is not None and rates[0] <= value <= rates[-1]]
+    for value, label, color, dash in lines:
+        for row, (low, high) in enumerate(spans, start=1):
+            fig.add_trace(go.Scatter(x=[value, value], y=[low, high], mode="lines", line=dict(color=color, dash=dash),
+                                     name=label, legendgroup=label, showlegend=row == 1,
+                                     hovertemplate=f"{label}<br>α=%{{x:.4g}}<extra></extra>"), row=row, col=1)
     
-    if func_error:
-        st.error(f"🚨 함수 정의 오류: {func_error}. 함수 수식을 확인해주세요.")
-        st.stop()
+    fig.update_xaxes(type="log")
+    fig.update_xaxes(title_text="학습률 α", row=2, col=1)
+    finite_loss = sweep["final_loss"][np.isfinite(sweep["final_loss"])]
+    if finite_loss.size and finite_loss.min() > 0:
+        fig.update_yaxes(type="log", row=1, col=1)
+    fig.update_layout(height=520, margin=dict(l=20, r=20, t=40, b=20),
+                      legend=dict(orientation="h", yanchor="bottom", y=1.06, xanchor="right", x=1))
+    return fig
+
+def render_lr_explorer(current_func):
+    """학습률 탐색기: 현재 시작점에서 학습률 수백 개를 한 번에 실행해 비교"""
+    with st.expander("🧪 학습률 탐색기 (학습률 수백 개를 한 번에 비교)"):
+        st.caption(f"현재 시작점과 반복 횟수로 학습률 {RATE_COUNT}개(로그 간격)를 배열 연산 한 번에 실행합니다. "
+                   "2/λmax는 헤세 행렬의 가장 큰 고윳값으로 구한 안정성 한계로, 이보다 큰 학습률은 "
+                   "가장 가파르게 휜 방향으로 진동하며 커지기 쉽습니다.")
+        rate_range = st.select_slider("학습률 범위", options=LR_EXPLORER_OPTIONS, value=(0.0001, 1.0),
+                                      key="lr_explorer_range_widget")
+        if rate_range[0] >= rate_range[1]:
+            st.info("학습률 범위의 양 끝을 다르게 골라 주세요.")
+            return
+        start = (float(st.session_state.start_x_slider), float(st.session_state.start_y_slider))
+        try:
+            sweep = get_lr_sweep(current_func, start, tuple(rate_range), st.session_state.steps_slider)
+            hessian = get_compiled_hessian(current_func)
+        except Exception as e:
+            st.error(f"학습률 스윕 오류: {str(e)[:100]}")
+            return
+        
+        best = best_index(sweep)
+        best_rate = float(sweep["rates"][best]) if best is not None else None
+        limits = (
+            stability_limit(hessian, start),
+            stability_limit(hessian, (sweep["final_x"][best], sweep["final_y"][best])) if best is not None else None,
+        )
+        
+        summary = [
+            "- **시작점의 안정성 한계 2/λmax**: " + (f"`{limits[0]:.4g}`" if limits[0] else "없음 (시작점 근처가 아래로 볼록하지 않음)"),
+            "- **도착한 점의 안정성 한계 2/λmax**: " + (f"`{limits[1]:.4g}`" if limits[1] else "-"),
+        ]
+        if best_rate is not None:
+            summary.append(f"- **가장 빨리 수렴한 학습률**: `{best_rate:.4g}` "
+                           f"({int(sweep['converge_step'][best])} 스텝, 도착점 "
+                           f"`({sweep['final_x'][best]:.3f}, {sweep['final_y'][best]:.3f})`)")
+        else:
+            summary.append(f"- {st.session_state.steps_slider} 스텝 안에 수렴한 학습률이 없습니다.")
+        if sweep["diverged"].any():
+            summary.append(f"- **발산하기 시작한 학습률**: `{sweep['rates'][sweep['diverged']].min():.4g}`")
+        st.markdown("\n".join(summary))
+        
+        st.plotly_chart(plot_lr_sweep(sweep, st.session_state.learning_rate_input, limits, best_rate),
+                        use_container_width=True, key="lr_explorer_chart")
+        if best_rate is not None:
+            st.button(
+                f"⭐ 추천 학습률 {max(round(best_rate, 4), 0.0001):.4f} 적용",
+                key="lr_explorer_apply_btn",
+                on_click=apply_learning_rate, args=(max(round(best_rate, 4), 0.0001),)
+            )
+
+# ----- 7. 메인 애플리케이션 실행 -----
+def resolve_scipy_minimum(min_point_scipy_coords, scipy_job):
+    """SciPy 최적점 (전체 재실행 때 탐색 중이었으면 지금 끝났는지 확인)"""
+    if min_point_scipy_coords is None and scipy_job is not None and scipy_job.done():
+        return scipy_job.result()[0]
+    return min_point_scipy_coords
+
+def prepare_surface(stages, current_func):
+    """surface 단계: (함수식, 범위, 해상도)가 그대로면 이전 재실행의 표면 격자 재사용"""
+    x_range, y_range = tuple(st.session_state.x_min_max_slider), tuple(st.session_state.y_min_max_slider)
+    return stages.run(
+        "surface", (current_func, x_range, y_range, surface_resolution()),
+        # (함수식, 범위)별로 모든 세션이 공유하는 캐시된 표면 사용
+        lambda: get_surface_grid(current_func, x_range, y_range, surface_resolution())
+    )
+
+def main_chart_figure(stages, current_func, functions, min_point_scipy_coords, critical_points, curvature_overlay):
+    """메인 그래프 – figure 단계(고정 부분)는 surface·minimum·시점 등이 그대로면 재사용, 현재 경로만 바꿔 끼움"""
+    x_range, y_range = tuple(st.session_state.x_min_max_slider), tuple(st.session_state.y_min_max_slider)
+    camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
+    figure_inputs = (
+        st.session_state.selected_camera_option_name, min_point_scipy_coords,
+        critical_points is not None, st.session_state.get("curvature_overlay")
+    )
     
-    if not callable(f_np_func):
-        st.error("함수 변환 실패.")
-        st.stop()
+    def build_static():
+        return static_figure(*functions, x_range, y_range, min_point_scipy_coords, camera_eye,
+                             surface=stages.value("surface"), critical_points=critical_points,
+                             overlay=curvature_overlay)
     
-    # SciPy 최적화 결과 계산
-    min_point_scipy_coords, scipy_error = find_scipy_minimum(
-        f_np_func, 
-        st.session_state.start_x_slider, 
-        st.session_state.start_y_slider,
-        st.session_state.selected_func_type
-    )
+    base = stages.run("figure", figure_inputs, build_static, after=("surface", "minimum"))
+    with stages.timer.stage("path_traces"):
+        return replace_gd_path(base, *functions, st.session_state.gd_path, st.session_state.educational_mode)
+
+@st.fragment
+def chart_panel(current_func, functions, min_point_scipy_coords, scipy_job, critical_points, curvature_overlay,
+                link, timer):
+    """제어 버튼 + 그래프 + 메시지 + 내보내기 (fragment: 버튼을 누르면 이 부분만 다시 실행)"""
+    with fragment_timer("04_C", timer) as panel_timer:
+        return run_chart_panel(current_func, functions, min_point_scipy_coords, scipy_job, critical_points,
+                               curvature_overlay, link, panel_timer)
+
+def run_chart_panel(current_func, functions, min_point_scipy_coords, scipy_job, critical_points, curvature_overlay,
+                    link, timer):
+    """차트 fragment 본문 → 늦게 도착한 SciPy 최적점으로 그래프를 다시 그리는 함수 반환"""
+    f_np_func, dx_np_func, dy_np_func = functions
+    min_point_scipy_coords = resolve_scipy_minimum(min_point_scipy_coords, scipy_job)
+    bundle = get_bundle()
+    stages = stage_graph("04_C", timer)
+    step_btn, play_btn, reset_btn, progress_placeholder, graph_placeholder = create_main_interface()
     
-    if min_point_scipy_coords:
-        min_x_sp, min_y_sp, min_z_sp = min_point_scipy_coords
-        scipy_result_placeholder.markdown(
-            f"""- **위치 (x, y)**: `({min_x_sp:.3f}, {min_y_sp:.3f})` <br> - **함수 값 f(x,y)**: `{min_z_sp:.4f}`""", 
-            unsafe_allow_html=True
+    # 전체 실행 중지 요청 처리 (중지 전까지 계산된 경로는 그대로 유지)
+    if consume_cancel("gd_play_cancelled"):
+        st.session_state.messages.append(
+            ("warning", f"전체 실행을 중지했습니다. {st.session_state.gd_step} 스텝까지의 경로를 표시합니다.")
         )
-    else:
-        scipy_result_placeholder.info(scipy_error if scipy_error else "SciPy 최적점을 찾지 못했습니다.")
     
     # 버튼 동작 처리
     if reset_btn:
@@ -807,39 +989,26 @@ def main():
         apply_preset_for_func_type(st.session_state.selected_func_type)
         st.session_state.user_func_input = "x**2 + y**2"
         
-        # 현재 설정된 값 사용
-        current_start_x_on_reset = st.session_state.start_x_slider
-        current_start_y_on_reset = st.session_state.start_y_slider
-        current_func_input_on_reset = PRESETS[st.session_state.selected_func_type]["formula"]
-        
-        # 경로 초기화
-        st.session_state.gd_path = [(float(current_start_x_on_reset), float(current_start_y_on_reset))]
-        st.session_state.gd_step = 0
-        st.session_state.play = False
-        st.session_state.animation_camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
-        st.session_state.messages = []
-        st.session_state.educational_logs = []
-        
-        # 현재 상태 저장
-        st.session_state.last_func_eval = current_func_input_on_reset
-        st.session_state.last_start_x_eval = current_start_x_on_reset
-        st.session_state.last_start_y_eval = current_start_y_on_reset
-        st.session_state.last_lr_eval = st.session_state.learning_rate_input
+        # 경로 초기화 후 새 설정의 지문 기록 (다음 재실행에서 다시 초기화하지 않음)
+        reset_gd_path()
+        stages.mark("path", path_stage_inputs())
         
-        st.rerun()
+        # 사이드바 값이 바뀌므로 페이지 전체 재실행
+        st.rerun(scope="app")
     
     # 한 스텝 진행 버튼
     if step_btn and st.session_state.gd_step < st.session_state.steps_slider:
         st.session_state.play = False
         
         # 경사 하강법 한 스텝 실행
-        next_point, step_result = gradient_descent_step(
-            f_np_func, 
-            dx_np_func, 
-            dy_np_func, 
-            st.session_state.gd_path[-1], 
-            st.session_state.learning_rate_input
-        )
+        with timer.stage("gd_steps"):
+            next_point, step_result = gradient_descent_step(
+                f_np_func, 
+                dx_np_func, 
+                dy_np_func, 
+                st.session_state.gd_path[-1], 
+                st.session_state.learning_rate_input
+            )
         
         if isinstance(step_result, dict):  # 성공적인 스텝
             st.session_state.gd_path.append(next_point)
@@ -847,8 +1016,6 @@ def main():
             st.session_state.educational_logs.append(step_result)
         else:  # 오류 발생
             st.session_state.messages.append(("error", step_result))
-        
-        st.rerun()
     
     # 전체 실행 버튼 - 애니메이션 대신 모든 계산을 즉시 수행
     if play_btn:
@@ -860,74 +1027,90 @@ def main():
         st.session_state.gd_step = 0
         st.session_state.educational_logs = []
         
-        # 모든 스텝을 한번에 계산
-        for _ in range(st.session_state.steps_slider):
-            next_point, step_result = gradient_descent_step(
+        # 미리 계산된 경로 사용 (기본 설정의 프리셋은 번들, 그 외에는 같은 설정의 이전 실행 결과를 잘라 씀)
+        run_config = (
+            current_func,
+            (st.session_state.start_x_slider, st.session_state.start_y_slider),
+            st.session_state.learning_rate_input,
+            st.session_state.steps_slider
+        )
+        precomputed_traj = bundle.trajectory(*run_config) if bundle else None
+        if precomputed_traj is None:
+            precomputed_traj = cached_trajectory(*run_config)
+        if precomputed_traj is not None:
+            path_arr, values_arr, grads_arr = precomputed_traj
+            st.session_state.gd_path = [(float(px), float(py)) for px, py in path_arr]
+            st.session_state.gd_step = len(grads_arr)
+            st.session_state.educational_logs = logs_from_trajectory(path_arr, values_arr, grads_arr)
+            if len(grads_arr) < st.session_state.steps_slider:
+                # 끝까지 가지 못한 경로 – 마지막 점에서 멈춘 이유(NaN·발산)를 다시 판정해 안내
+                reason = stop_reason(*functions, path_arr[-1], st.session_state.learning_rate_input)
+                st.session_state.messages.append(("error", STOP_MESSAGES.get(reason, STOP_MESSAGES[STOP_NAN])))
+        else:
+            # 같은 설정으로 전에 더 적은 스텝까지 계산했으면 그 경로에서 이어서 계산 (새 스텝만 계산)
+            prefix = cached_prefix(*run_config[:3])
+            if prefix is not None:
+                path_arr, values_arr, grads_arr, _ = prefix
+                st.session_state.gd_path = [(float(px), float(py)) for px, py in path_arr]
+                st.session_state.gd_step = len(grads_arr)
+                st.session_state.educational_logs = logs_from_trajectory(path_arr, values_arr, grads_arr)
+            
+            # 조각(10 스텝) 단위로 계산하며 부분 경로를 바로 그림 (중지 시 그때까지의 경로 유지)
+            with progress_placeholder.container():
+                progress_bar = st.progress(0.0, text="전체 실행 중...")
+                cancel_button(st, "gd_play_cancelled", key="gd_play_cancel_btn")
+            chunks = gd_step_chunks(
                 f_np_func, 
                 dx_np_func, 
                 dy_np_func, 
                 st.session_state.gd_path[-1], 
-                st.session_state.learning_rate_input
+                st.session_state.learning_rate_input,
+                st.session_state.steps_slider - st.session_state.gd_step,
+                first_step=st.session_state.gd_step + 1
             )
             
-            if isinstance(step_result, dict):  # 성공적인 스텝
-                st.session_state.gd_path.append(next_point)
-                st.session_state.gd_step += 1
-                st.session_state.educational_logs.append(step_result)
-            else:  # 오류 발생
-                st.session_state.messages.append(("error", step_result))
-                break
-        
-        # 카메라 각도 설정
-        st.session_state.animation_camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
+            def record_chunk(chunk):
+                points, logs, error = chunk
+                st.session_state.gd_path.extend(points)
+                st.session_state.gd_step += len(points)
+                st.session_state.educational_logs.extend(logs)
+                if error:
+                    st.session_state.messages.append(("error", error))
+                return chunk
+            
+            def show_partial(_):
+                progress_bar.progress(
+                    st.session_state.gd_step / max(st.session_state.steps_slider, 1),
+                    text=f"전체 실행 중... {st.session_state.gd_step}/{st.session_state.steps_slider} 스텝"
+                )
+                graph_placeholder.plotly_chart(
+                    main_chart_figure(stages, current_func, functions, min_point_scipy_coords, critical_points, curvature_overlay),
+                    use_container_width=True, key=f"main_chart_partial_{st.session_state.gd_step}"
+                )
+            
+            with timer.stage("gd_steps"):
+                render_progressively((record_chunk(c) for c in chunks), show_partial)
+            progress_placeholder.empty()
+            
+            # 끝까지 계산한 경로는 설정별 결과 캐시에 저장 (중지하면 여기까지 오지 않음, 더 긴 경로가 있으면 유지)
+            store_trajectory(*run_config, *trajectory_from_logs(
+                st.session_state.gd_path, st.session_state.educational_logs, f_np_func
+            ))
         
-        # 재실행하여 최종 결과 표시
-        st.rerun()
-    
-    # 정적 그래프 표시
-    current_display_cam = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
-    
-    fig_static = plot_gd(
-        f_np_func, 
-        dx_np_func, 
-        dy_np_func, 
-        st.session_state.x_min_max_slider, 
-        st.session_state.y_min_max_slider,
-        st.session_state.gd_path, 
-        min_point_scipy_coords, 
-        current_display_cam,
-        st.session_state.educational_mode
-    )
-    graph_placeholder.plotly_chart(fig_static, use_container_width=True, key="main_chart_static")
-    
-    # 분석 보기 버튼
-    if analytics_btn:
-        analytics_md, df = display_analytics(
-            f_np_func, 
-            st.session_state.gd_path, 
-            st.session_state.educational_logs
+        # 끝까지 실행한 경로를 수업 현황 집계·실행 기록 보관소에 추가 (중지하면 여기까지 오지 않음)
+        path_arr, values_arr, grads_arr = trajectory_from_logs(
+            st.session_state.gd_path, st.session_state.educational_logs, f_np_func
         )
+        outcome = record_run(current_session_id(), current_func, functions, *run_config[1:], path_arr, values_arr)
+        archive_run("04_C", current_session_id(), *run_config, path_arr, values_arr, grads_arr, outcome)
         
-        with analytics_placeholder.container():
-            st.markdown(analytics_md)
-            if df is not None:
-                st.dataframe(df)
-                
-                # 학습 곡선 차트
-                st.subheader("🔍 학습 곡선 시각화")
-                chart_tab1, chart_tab2, chart_tab3 = st.tabs(["함수값 변화", "기울기 크기 변화", "개선값 변화"])
-                
-                with chart_tab1:
-                    st.line_chart(df, x="스텝", y="함수값")
-                    st.caption("스텝이 진행됨에 따라 함수값이 감소하는 것이 이상적입니다.")
-                
-                with chart_tab2:
-                    st.line_chart(df, x="스텝", y="기울기 크기")
-                    st.caption("기울기 크기가 0에 가까워질수록 최적점에 근접한 것입니다.")
-                
-                with chart_tab3:
-                    st.line_chart(df, x="스텝", y="개선값")
-                    st.caption("각 스텝에서의 함수값 감소량입니다. 양수일수록 좋습니다.")
+        # 카메라 각도 설정 (최종 결과는 아래에서 이어서 그림)
+        st.session_state.animation_camera_eye = CAMERA_ANGLES[st.session_state.selected_camera_option_name]
+    
+    # 정적 그래프 표시 (figure 단계는 입력이 그대로면 재사용, 경로 트레이스만 교체)
+    fig_static = main_chart_figure(stages, current_func, functions, min_point_scipy_coords, critical_points, curvature_overlay)
+    with timer.stage("serialize"):
+        graph_placeholder.plotly_chart(fig_static, use_container_width=True, key="main_chart_static")
     
     # 메시지 표시
     temp_messages = st.session_state.get("messages", [])
@@ -959,6 +1142,190 @@ def main():
                 st.success(f"🎉 기울기({grad_norm_final:.4f})가 매우 작아 최적점 또는 안장점에 근접했습니다!")
         except Exception:
             pass
+    
+    # 현재 설정과 진행 스텝을 URL에 기록 (주소창 링크로 같은 화면 공유)
+    update_page_link(link, current_func)
+    
+    # 실행 결과 내보내기 (오프라인 재생 HTML / .npz)
+    render_export_panel(current_func, min_point_scipy_coords)
+    
+    def redraw(min_point):
+        fig = main_chart_figure(stages, current_func, functions, min_point, critical_points, curvature_overlay)
+        with timer.stage("serialize"):
+            graph_placeholder.plotly_chart(fig, use_container_width=True, key="main_chart_static_min")
+    return redraw
+
+@st.fragment
+def analytics_panel(f_np_func, timer):
+    """분석 보기 버튼 + 결과 (fragment: 버튼을 누르면 이 부분만 다시 실행)"""
+    with fragment_timer("04_C", timer) as panel_timer:
+        run_analytics_panel(f_np_func, panel_timer)
+
+def run_analytics_panel(f_np_func, timer):
+    """분석 fragment 본문 (누른 시점의 경로와 로그로 분석)"""
+    analytics_btn = st.button("📊 분석 보기", key="analytics_btn_key", use_container_width=True)
+    analytics_placeholder = st.empty()
+    
+    if analytics_btn:
+        with timer.stage("analytics"):
+            analytics_md, df = display_analytics(
+                f_np_func, 
+                st.session_state.gd_path, 
+                st.session_state.educational_logs
+            )
+        
+        with analytics_placeholder.container():
+            st.caption(f"{st.session_state.gd_step} 스텝까지의 경로 기준입니다. 경로가 바뀌면 다시 눌러 주세요.")
+            st.markdown(analytics_md)
+            if df is not None:
+                st.dataframe(df)
+                
+                # 학습 곡선 차트
+                st.subheader("🔍 학습 곡선 시각화")
+                chart_tab1, chart_tab2, chart_tab3 = st.tabs(["함수값 변화", "기울기 크기 변화", "개선값 변화"])
+                
+                with chart_tab1:
+                    st.line_chart(df, x="스텝", y="함수값")
+                    st.caption("스텝이 진행됨에 따라 함수값이 감소하는 것이 이상적입니다.")
+                
+                with chart_tab2:
+                    st.line_chart(df, x="스텝", y="기울기 크기")
+                    st.caption("기울기 크기가 0에 가까워질수록 최적점에 근접한 것입니다.")
+                
+                with chart_tab3:
+                    st.line_chart(df, x="스텝", y="개선값")
+                    st.caption("각 스텝에서의 함수값 감소량입니다. 양수일수록 좋습니다.")
+
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("04_C")
+    try:
+        run_app(timer)
+    finally:
+        # st.rerun()/st.stop()으로 중단된 재실행도 기록
+        timer.finish()
+
+def run_app(timer):
+    """앱 본문 실행"""
+    # 세션 상태 초기화 (공유 링크로 열었으면 URL의 설정 반영)
+    link = PageLink("04_C", LINK_FIELDS)
+    stages = stage_graph("04_C", timer)
+    initialize_session_state(stages)
+    apply_page_link(link, stages)
+    
+    # 교육 모드 초기화
+    if "educational_mode" not in st.session_state:
+        st.session_state.educational_mode = False
+    
+    if "educational_logs" not in st.session_state:
+        st.session_state.educational_logs = []
+    
+    # 사이드바 생성
+    scipy_result_placeholder, critical_placeholder, debug_placeholder = create_sidebar()
+    
+    # 현재 함수 준비
+    current_func = get_current_function_string()
+    with timer.stage("parse_lambdify"):
+        f_np_func, dx_np_func, dy_np_func, func_error = prepare_function_and_gradients(current_func)
+    
+    if func_error:
+        st.error(f"🚨 함수 정의 오류: {func_error}. 함수 수식을 확인해주세요.")
+        st.stop()
+    
+    if not callable(f_np_func):
+        st.error("함수 변환 실패.")
+        st.stop()
+    
+    # 공유 링크에 진행 스텝이 있으면 그 스텝까지의 경로 복원
+    with timer.stage("gd_steps"):
+        restore_linked_run(link, current_func, (f_np_func, dx_np_func, dy_np_func))
+    
+    # 프리셋 미리 계산 번들 (준비 전이면 None → 실시간 계산)
+    bundle = get_bundle()
+    
+    # SciPy 최적화 결과 (minimum 단계: 함수식·시작점이 그대로면 이전 결과 재사용)
+    # 번들에 있으면 그대로 사용, 없으면 배경 스레드에서 탐색
+    # → 탐색이 끝나기 전에는 최적점 표시 없이 그래프를 먼저 그리고, 맨 끝에서 결과를 채움
+    def search_minimum():
+        # 번들 최소점은 같은 시작점 목록(프리셋의 SciPy 시작점 포함)으로 찾은 경우에만 사용
+        bundled_min = bundle.minimum(current_func, scipy_start_points(
+            st.session_state.start_x_slider, st.session_state.start_y_slider, st.session_state.selected_func_type
+        )) if bundle else None
+        if bundled_min is not None:
+            return bundled_min, None, None
+        job = submit_scipy_search(
+            current_func,
+            f_np_func, 
+            st.session_state.start_x_slider, 
+            st.session_state.start_y_slider,
+            st.session_state.selected_func_type
+        )
+        if job.done():
+            return (*job.result(), None)
+        return None, None, job
+    
+    minimum_inputs = (
+        current_func, 
+        (st.session_state.start_x_slider, st.session_state.start_y_slider),
+        st.session_state.selected_func_type
+    )
+    min_point_scipy_coords, scipy_error, scipy_job = stages.run("minimum", minimum_inputs, search_minimum)
+    if scipy_job is not None:
+        stages.invalidate("minimum")  # 탐색 중인 결과는 보관하지 않음 (끝나면 아래에서 기록)
+    
+    if scipy_job is None:
+        show_scipy_result(scipy_result_placeholder, min_point_scipy_coords, scipy_error)
+    else:
+        scipy_result_placeholder.markdown("SciPy 탐색 중...")
+    
+    # 임계점 전체 (격자 시작점 뉴턴법, (함수식, 범위)별 공유 캐시)
+    with timer.stage("critical_points"):
+        critical_points = prepare_critical_points(current_func)
+    show_critical_points(critical_placeholder, critical_points)
+    
+    # 곡률 지도 (표면 격자와 같은 X, Y 위에서 계산, (함수식, 범위, 해상도)별 공유 캐시)
+    with timer.stage("curvature"):
+        curvature_overlay = prepare_curvature_overlay(current_func)
+    
+    # 표면 격자 (surface 단계 – 그래프의 figure 단계가 이 결과에 의존)
+    prepare_surface(stages, current_func)
+    
+    # 제어 버튼·그래프, 분석 영역 (각각 fragment – 버튼 클릭은 해당 영역만 다시 실행)
+    st.markdown("---")
+    redraw_chart = chart_panel(
+        current_func, (f_np_func, dx_np_func, dy_np_func), min_point_scipy_coords, scipy_job,
+        critical_points, curvature_overlay, link, timer=timer
+    )
+    analytics_panel(f_np_func, timer=timer)
+    
+    # 학습률 탐색기 (학습률을 배열 축으로 둔 스윕, 설정별 공유 캐시)
+    with timer.stage("lr_sweep"):
+        render_lr_explorer(current_func)
+    
+    # 배경 SciPy 탐색 결과가 곧 도착하면 사이드바와 그래프의 최적점 표시 채우기
+    # 더 걸리면 재실행을 붙잡지 않고 끝내고, 진행 표시 fragment가 완료를 확인해 다시 실행
+    if scipy_job is not None:
+        with timer.stage("scipy_wait"):
+            scipy_result = wait_for(
+                scipy_job,
+                on_progress=lambda partial: scipy_result_placeholder.markdown(
+                    f"SciPy 탐색 중... ({partial[0]}/{partial[1]} 시작점)"
+                ),
+                timeout=SCIPY_WAIT
+            )
+        if scipy_result is None:
+            with scipy_result_placeholder.container():
+                scipy_progress_panel(scipy_job)
+        else:
+            min_point_scipy_coords, scipy_error = scipy_result
+            stages.mark("minimum", minimum_inputs, (min_point_scipy_coords, scipy_error, None))
+            show_scipy_result(scipy_result_placeholder, min_point_scipy_coords, scipy_error)
+            if min_point_scipy_coords:
+                redraw_chart(min_point_scipy_coords)
+    
+    # 성능 디버그 패널 표시
+    if debug_placeholder is not None:
+        render_timing_panel(debug_placeholder, timer.as_record())
 
 # 애플리케이션 실행
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+import os
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from gdcore.cache import get_compiled_function, get_surface_grid
+from gdcore.functions import evaluate_on_grid
+from gdcore.presets import PRESET_SPECS
+from gdcore.timing import RerunTimer, debug_panel_enabled, render_timing_panel
+from gdcore.progressive import cancel_button, consume_cancel, render_progressively
+from gdcore.trajstore import SWEEP_BUDGET_BYTES, UNCONVERGED, TrajectoryStore, iter_sweep, store_directory, store_nbytes, summarize
+from gdcore.urlstate import SHARE_HINT, PageLink, preset_for_formula
+
+# ----- 애플리케이션 설정 -----
+st.set_page_config(layout="wide", page_title="수렴 영역 스윕", page_icon="🗺️")
+
+st.title("🗺️ 시작점 스윕: 수렴 영역 지도")
+st.caption("격자의 모든 점에서 동시에 경사 하강을 실행하고, 어느 최소점으로 수렴하는지 지도로 확인합니다. "
+           "경로는 디스크에 타일 단위로 저장되어 해상도가 커도 서버 메모리는 일정합니다.")
+
+CUSTOM_LABEL = "사용자 정의 함수 입력"
+RESOLUTION_OPTIONS = [128, 256, 512, 1024, 2048]
+DISPLAY_RESOLUTION = 256   # 지도 표시 해상도 (저장 해상도와 무관하게 솎아서 읽음)
+POINT_GRID = 24            # 스텝별 위치 표시용 점 격자
+TILE = 128
+# 저장 크기가 이보다 큰 스윕(큰 해상도·많은 스텝)은 교사용 접근 코드를 입력해야 실행 (코드를 지정하지 않으면 실행 불가)
+OPEN_SWEEP_BYTES = 256 * 2 ** 20
+TEACHER_CODE = os.environ.get("GD_TEACHER_CODE", "")
+LINK_FIELDS = {"f": "str", "xr": "range", "yr": "range", "res": "int", "n": "int", "lr": "float"}
+
+
+# ----- 1. 계산 함수 -----
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_summary(directory, tiles_done, formula):
+    """완료된 스윕의 스트리밍 요약 (저장소·진행 상태별 캐시)"""
+    store = TrajectoryStore.open(directory)
+    return summarize(store, get_compiled_function(formula)[0])
+
+
+def basin_colorscale(n_basins):
+    """수렴 영역 라벨용 색상 (미수렴 = 밝은 회색, 발산 = 어두운 회색)"""
+    palette = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+               "#8c564b", "#e377c2", "#bcbd22", "#17becf", "#7f7f7f"]
+    colors = ["#cccccc", "#444444"] + [palette[i % len(palette)] for i in range(max(n_basins, 1))]
+    scale = []
+    for i, color in enumerate(colors):
+        scale += [[i / len(colors), color], [(i + 1) / len(colors), color]]
+    return scale
+
+
+def plot_basin_map(store, summary, step, surface, inspect_path=None, max_basins=8):
+    """수렴 영역 지도 + 스텝 step의 위치 + 선택한 시작점 경로"""
+    stride = max(1, store.resolution // DISPLAY_RESOLUTION)
+    labels = summary["labels"][::stride, ::stride]
+    # 작은 영역은 "기타"로 묶어 색 개수 제한 (z: 0 미수렴, 1 발산, 2부터 수렴 영역)
+    shown = np.where(labels >= max_basins, max_basins, labels) - UNCONVERGED
+    n_colors = min(len(summary["basins"]), max_basins + 1)
+    names = np.array(["미수렴", "발산"] + [f"영역 {i + 1}" for i in range(max(n_colors, 1))], dtype=object)
+
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        x=store.xs[::stride], y=store.ys[::stride], z=shown, customdata=names[shown],
+        zmin=-0.5, zmax=len(names) - 0.5, colorscale=basin_colorscale(n_colors),
+        showscale=False, hovertemplate="시작점 (%{x:.2f}, %{y:.2f})<br>%{customdata}<extra></extra>"
+    ))
+    X, Y, Z = surface
+    fig.add_trace(go.Contour(
+        x=X, y=Y, z=Z, ncontours=20, showscale=False, hoverinfo="skip",
+        contours=dict(coloring="none"), line=dict(color="white", width=0.6), name="등고선"
+    ))
+
+    point_stride = max(1, store.resolution // POINT_GRID)
+    pos = store.positions_at(step, stride=point_stride)
+    fig.add_trace(go.Scatter(
+        x=pos[0].ravel(), y=pos[1].ravel(), mode="markers",
+        marker=dict(size=4, color="black", line=dict(color="white", width=0.5)),
+        name=f"{step} 스텝 후 위치", hoverinfo="skip"
+    ))
+
+    for b in summary["basins"][:max_basins]:
+        fig.add_trace(go.Scatter(
+            x=[b["x"]], y=[b["y"]], mode="markers", showlegend=False,
+            marker=dict(size=12, symbol="x", color="white", line=dict(color="black", width=1)),
+            hovertemplate=f"수렴점 ({b['x']:.2f}, {b['y']:.2f})<br>비율 {b['count'] / store.resolution ** 2:.1%}<extra></extra>"
+        ))
+
+    if inspect_path is not None:
+        fig.add_trace(go.Scatter(
+            x=inspect_path[:, 0], y=inspect_path[:, 1], mode="lines+markers",
+            marker=dict(size=4, color="red"), line=dict(color="red", width=2), name="선택한 시작점 경로"
+        ))
+
+    fig.update_layout(
+        height=620, margin=dict(l=0, r=0, t=30, b=0),
+        title_text="시작점별 수렴 영역", title_x=0.5,
+        xaxis=dict(title="x", range=list(store.meta["x_range"]), constrain="domain"),
+        yaxis=dict(title="y", range=list(store.meta["y_range"]), scaleanchor="x", scaleratio=1),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def plot_partial_sweep(store, preview):
+    """계산 중인 스윕의 완료된 타일만 최종 함숫값(log10)으로 표시"""
+    stride = max(1, store.resolution // DISPLAY_RESOLUTION)
+    fig = go.Figure(go.Heatmap(
+        x=store.xs[::stride], y=store.ys[::stride], z=preview, colorscale="Viridis",
+        colorbar=dict(title="log10 f"), hovertemplate="시작점 (%{x:.2f}, %{y:.2f})<br>log10 f=%{z:.2f}<extra></extra>"
+    ))
+    fig.update_layout(
+        height=620, margin=dict(l=0, r=0, t=30, b=0),
+        title_text="스윕 진행 중: 완료된 타일의 최종 함숫값", title_x=0.5,
+        xaxis=dict(title="x", range=list(store.meta["x_range"]), constrain="domain"),
+        yaxis=dict(title="y", range=list(store.meta["y_range"]), scaleanchor="x", scaleratio=1)
+    )
+    return fig
+
+
+def plot_loss_curve(summary, step):
+    """스텝별 평균 손실과 발산 비율"""
+    fig = go.Figure()
+    steps = np.arange(len(summary["mean_loss"]))
+    fig.add_trace(go.Scatter(x=steps, y=summary["mean_loss"], mode="lines", name="평균 f (발산 제외)"))
+    fig.add_trace(go.Scatter(x=steps, y=summary["diverged_fraction"], mode="lines", name="발산 비율",
+                             yaxis="y2", line=dict(dash="dot")))
+    fig.add_vline(x=step, line=dict(color="gray", dash="dash"))
+    fig.update_layout(
+        height=300, margin=dict(l=20, r=20, t=40, b=20), title_text="스텝별 평균 함숫값", title_x=0.5,
+        xaxis_title="Step", yaxis=dict(title="평균 f", type="log"),
+        yaxis2=dict(title="발산 비율", overlaying="y", side="right", range=[0, 1]),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+# ----- 2. 앱 본문 -----
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("05_sweep")
+    try:
+        run_app(timer)
+    finally:
+        timer.finish()
+
+
+def run_app(timer):
+    labels = [spec["label"] for spec in PRESET_SPECS] + [CUSTOM_LABEL]
+    # 공유 링크의 설정은 위젯 기본값으로 사용 (같은 설정의 스윕은 디스크 저장소에서 바로 열림)
+    link = PageLink("05_sweep", LINK_FIELDS)
+    link_choice = labels[2]
+    if "f" in link:
+        link_choice = preset_for_formula(link.values["f"], {s["label"]: s for s in PRESET_SPECS},
+                                         lambda s: s["formula"]) or CUSTOM_LABEL
+    with st.sidebar:
+        st.header("⚙️ 스윕 설정")
+        choice = st.selectbox("함수 선택", labels, index=labels.index(link_choice), key="sweep_func_select")
+        spec = next((s for s in PRESET_SPECS if s["label"] == choice), None)
+        if spec is None:
+            formula = st.text_input("함수 f(x, y)", value=link.get("f", "x**2 + y**2"), key="sweep_custom_formula")
+            x_range = st.slider("x 범위", -10.0, 10.0, link.get("xr", (-6.0, 6.0), (-10.0, 10.0)), key="sweep_x_range")
+            y_range = st.slider("y 범위", -10.0, 10.0, link.get("yr", (-6.0, 6.0), (-10.0, 10.0)), key="sweep_y_range")
+            default_lr, default_steps = 0.1, 50
+        else:
+            formula, x_range, y_range = spec["formula"], spec["x_range"], spec["y_range"]
+            default_lr, default_steps = spec["learning_rate"], spec["steps"]
+            st.code(formula, language="python")
+        if choice == link_choice:
+            default_lr, default_steps = link.get("lr", default_lr, (0.0001, 1.0)), link.get("n", default_steps, (10, 300))
+
+        link_resolution = link.get("res", 256)
+        resolution = st.select_slider("시작점 격자 해상도", RESOLUTION_OPTIONS,
+                                      value=link_resolution if link_resolution in RESOLUTION_OPTIONS else 256,
+                                      key="sweep_resolution")
+        steps = st.slider("스텝 수", 10, 300, default_steps, key=f"sweep_steps_{choice}")
+        learning_rate = st.number_input("학습률 (α)", 0.0001, 1.0, default_lr, step=0.001,
+                                        format="%.4f", key=f"sweep_lr_{choice}")
+
+        n_tiles = -(-resolution // TILE)
+        n_bytes = store_nbytes(resolution, steps, TILE)
+        st.caption(f"시작점 {resolution}×{resolution} = {resolution ** 2:,}개 · 저장 크기 약 {n_bytes / 1e9:.2f} GB "
+                   f"(전체 한도 {SWEEP_BUDGET_BYTES / 1e9:.0f} GB, 오래된 스윕부터 삭제)")
+        allowed = n_bytes <= OPEN_SWEEP_BYTES
+        if not allowed and TEACHER_CODE:
+            allowed = st.text_input("교사용 접근 코드", type="password", key="sweep_teacher_code") == TEACHER_CODE
+        if not allowed:
+            st.caption(f"⚠️ 저장 크기가 {OPEN_SWEEP_BYTES / 2 ** 20:.0f} MB를 넘는 스윕은 교사용 접근 코드가 필요합니다. "
+                       "해상도나 스텝 수를 줄여 주세요.")
+        run_btn = st.button("🚀 스윕 실행", use_container_width=True, key="sweep_run_btn", disabled=not allowed)
+        st.caption(SHARE_HINT)
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+
+    link.update(f=formula, xr=x_range, yr=y_range, res=resolution, n=steps, lr=learning_rate)
+
+    with timer.stage("parse_lambdify"):
+        try:
+            f_np, dx_np, dy_np = get_compiled_function(formula)
+        except Exception as e:
+            st.error(f"🚨 함수 정의 오류: {e}")
+            st.stop()
+
+    # 같은 설정의 스윕이 이미 있으면 그대로 사용 (다른 세션·이전 실행 결과 포함)
+    store = TrajectoryStore.open(store_directory(formula, x_range, y_range, resolution, steps, learning_rate, TILE))
+    if run_btn:
+        try:
+            store = TrajectoryStore.create(formula, x_range, y_range, resolution, steps, learning_rate, tile=TILE)
+        except ValueError as e:
+            st.error(f"🚨 {e}")
+            st.stop()
+
+    if consume_cancel("sweep_cancelled"):
+        st.warning("스윕을 중지했습니다. 완료된 타일은 저장되어 있어 '스윕 실행'을 다시 누르면 이어서 계산합니다.")
+
+    if run_btn and not store.complete:
+        progress_slot, graph_slot = st.empty(), st.empty()
+        with progress_slot.container():
+            progress = st.progress(0.0, text="스윕 계산 중...")
+            cancel_button(st, "sweep_cancelled", key="sweep_cancel_btn")
+
+        # 완료된 타일을 표시 해상도로 솎아 미리 보기 (계산 중에도 서버 메모리는 표시 크기만 사용)
+        stride = max(1, resolution // DISPLAY_RESOLUTION)
+        preview = np.full((len(range(0, resolution, stride)),) * 2, np.nan)
+
+        def record_tile(chunk):
+            done, total, index, final = chunk
+            _, _, rs, cs, _ = store.tile_bounds(index)
+            r_off, c_off = (-rs.start) % stride, (-cs.start) % stride
+            fx, fy = final[0, r_off::stride, c_off::stride], final[1, r_off::stride, c_off::stride]
+            with np.errstate(all="ignore"):
+                fv = np.log10(np.abs(evaluate_on_grid(f_np, fx, fy)) + 1e-12)
+            ri, ci = (rs.start + r_off) // stride, (cs.start + c_off) // stride
+            preview[ri:ri + fv.shape[0], ci:ci + fv.shape[1]] = fv
+            return chunk
+
+        def show_partial(chunk):
+            done, total = chunk[0], chunk[1]
+            progress.progress(done / total, text=f"타일 {done}/{total}")
+            graph_slot.plotly_chart(plot_partial_sweep(store, preview), use_container_width=True,
+                                    key=f"sweep_partial_{done}")
+
+        with timer.stage("sweep"):
+            render_progressively((record_tile(c) for c in iter_sweep(store, f_np, dx_np, dy_np)),
+                                 show_partial, min_interval=0.5)
+        progress_slot.empty()
+        graph_slot.empty()
+
+    if store is None or not store.complete:
+        done = store.meta["tiles_done"] if store is not None else 0
+        if done:
+            st.info(f"이전 스윕이 {done}/{n_tiles ** 2} 타일까지 진행되었습니다. "
+                    "'스윕 실행'을 누르면 이어서 계산합니다.")
+        else:
+            st.info("사이드바에서 설정을 고르고 '🚀 스윕 실행'을 눌러 주세요.")
+        return
+
+    with timer.stage("summary"):
+        summary = get_summary(store.directory, store.meta["tiles_done"], formula)
+
+    col_map, col_info = st.columns([3, 2])
+    with col_info:
+        step = st.slider("표시할 스텝", 0, store.steps, store.steps, key="sweep_view_step")
+        st.markdown("#### 🔎 시작점 하나의 경로 보기")
+        c1, c2 = st.columns(2)
+        inspect_x = c1.number_input("시작 x", *map(float, x_range), value=float(np.mean(x_range)), key="sweep_inspect_x")
+        inspect_y = c2.number_input("시작 y", *map(float, y_range), value=float(np.mean(y_range)), key="sweep_inspect_y")
+        row, col = store.nearest_start(inspect_x, inspect_y)
+        inspect_path = store.trajectory(row, col)
+        final = inspect_path[-1]
+        st.markdown(f"- 시작점 `({store.xs[col]:.3f}, {store.ys[row]:.3f})` → "
+                    f"{store.steps} 스텝 후 `({final[0]:.3f}, {final[1]:.3f})`")
+
+        st.markdown("#### 📊 수렴 영역 요약")
+        total = store.resolution ** 2
+        st.markdown(f"- 발산한 시작점 비율: `{summary['diverged_fraction'][-1]:.1%}`")
+        st.markdown(f"- 미수렴 시작점 비율: `{summary['unconverged_count'] / total:.1%}` "
+                    "(마지막 스텝에도 계속 움직임 – 스텝 수나 학습률을 늘려 보세요)")
+        st.dataframe(pd.DataFrame([
+            {"수렴점 x": b["x"], "수렴점 y": b["y"], "비율": f"{b['count'] / total:.1%}", "평균 f": b["mean_f"]}
+            for b in summary["basins"][:10]
+        ]), hide_index=True)
+
+    with timer.stage("figure"):
+        surface = get_surface_grid(formula, tuple(x_range), tuple(y_range))
+        fig_map = plot_basin_map(store, summary, step, surface, inspect_path=inspect_path)
+        fig_loss = plot_loss_curve(summary, step)
+    with timer.stage("serialize"):
+        col_map.plotly_chart(fig_map, use_container_width=True)
+        col_info.plotly_chart(fig_loss, use_container_width=True)
+
+    if debug_placeholder is not None:
+        render_timing_panel(debug_placeholder, timer.as_record())
+
+
+if __name__ == "__main__":
+    main()
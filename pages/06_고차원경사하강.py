@@ -0,0 +1,264 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from gdcore.ndim import (
+    IllConditionedQuadratic, Rastrigin, Rosenbrock, ExpressionProblem,
+    coordinate_plane, descend, pca_plane, plane_grid, project, random_starts,
+)
+from gdcore.timing import RerunTimer, debug_panel_enabled, render_timing_panel
+from gdcore.urlstate import SHARE_HINT, PageLink
+
+# ----- 애플리케이션 설정 -----
+st.set_page_config(layout="wide", page_title="고차원 경사 하강", page_icon="🧊")
+
+st.title("🧊 고차원 경사 하강: 2차원 단면으로 보기")
+st.caption("변수가 수백~수천 개인 함수에서 여러 시작점의 경사 하강을 한 번에 실행하고, "
+           "경로를 좌표 단면 또는 주성분(PCA) 평면에 투영해 살펴봅니다.")
+
+PROBLEM_OPTIONS = {
+    "악조건 이차 함수 (고윳값 1~κ)": "quadratic",
+    "Rosenbrock (좁고 휜 골짜기)": "rosenbrock",
+    "Rastrigin (지역 최소점이 매우 많음)": "rastrigin",
+    "사용자 정의 식 (x1, x2, ...)": "expression",
+}
+DIM_OPTIONS = [2, 3, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+CONDITION_OPTIONS = [1, 10, 100, 1000, 10000]
+LINK_FIELDS = {
+    "p": "str", "f": "str", "dim": "int", "cond": "int", "lrr": "float", "lr": "float",
+    "n": "int", "mom": "float", "k": "int", "r": "float", "seed": "int"
+}
+PATH_COLORS = ["#d62728", "#1f77b4", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b", "#e377c2", "#17becf"]
+
+
+# ----- 1. 계산 함수 -----
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_problem(kind, n, condition, formula):
+    """문제 객체 캐시 (사용자 식이면 sympy 변환 포함)"""
+    if kind == "quadratic":
+        return IllConditionedQuadratic(n, condition)
+    if kind == "rosenbrock":
+        return Rosenbrock(n)
+    if kind == "rastrigin":
+        return Rastrigin(n)
+    return ExpressionProblem(formula)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def run_descent(kind, n, condition, formula, n_starts, radius, seed, learning_rate, steps, momentum):
+    """설정별 경사 하강 결과 캐시 (배열은 읽기 전용)"""
+    problem = get_problem(kind, n, condition, formula)
+    starts = random_starts(problem.n, n_starts, radius=radius, seed=seed, center=problem.minimum)
+    result = descend(problem, starts, learning_rate, steps, momentum=momentum)
+    for arr in result.values():
+        arr.setflags(write=False)
+    return result
+
+
+def plot_plane(problem, result, plane, labels, title_text):
+    """평면 위 함숫값 등고선 + 투영된 경로"""
+    center, u, v = plane
+    coords = project(result["path"], center, u, v)
+    finite = coords[np.isfinite(coords).all(axis=-1)]
+    lo, hi = finite.min(axis=0), finite.max(axis=0)
+    pad = np.maximum((hi - lo) * 0.15, 0.5)
+    a, b, Z = plane_grid(problem, center, u, v, (lo[0] - pad[0], hi[0] + pad[0]), (lo[1] - pad[1], hi[1] + pad[1]))
+    # 값 범위가 넓으면 로그 스케일로 등고선 표시
+    z_show = np.log10(Z - np.nanmin(Z) + 1e-9) if np.nanmax(Z) - np.nanmin(Z) > 1e3 else Z
+
+    fig = go.Figure(go.Contour(
+        x=a, y=b, z=z_show, colorscale="Viridis", ncontours=30, showscale=False,
+        hovertemplate="(%{x:.2f}, %{y:.2f})<extra></extra>"
+    ))
+    for k in range(coords.shape[1]):
+        color = PATH_COLORS[k % len(PATH_COLORS)]
+        fig.add_trace(go.Scatter(
+            x=coords[:, k, 0], y=coords[:, k, 1], mode="lines+markers", name=f"시작점 {k + 1}",
+            line=dict(color=color, width=2), marker=dict(size=3, color=color)
+        ))
+    if problem.minimum is not None:
+        m = project(problem.minimum, center, u, v)
+        fig.add_trace(go.Scatter(
+            x=[m[0]], y=[m[1]], mode="markers", name="최소점",
+            marker=dict(size=12, symbol="x", color="white", line=dict(color="black", width=1))
+        ))
+    fig.update_layout(
+        height=560, margin=dict(l=0, r=0, t=40, b=0), title_text=title_text, title_x=0.5,
+        xaxis_title=labels[0], yaxis_title=labels[1],
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def plot_curves(result):
+    """스텝별 함숫값과 기울기 크기 (로그 축)"""
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                        subplot_titles=("함숫값 f", "기울기 크기 ‖∇f‖"))
+    steps = np.arange(len(result["values"]))
+    for k in range(result["values"].shape[1]):
+        color = PATH_COLORS[k % len(PATH_COLORS)]
+        fig.add_trace(go.Scatter(x=steps, y=result["values"][:, k], mode="lines", line=dict(color=color),
+                                 name=f"시작점 {k + 1}", showlegend=False), row=1, col=1)
+        fig.add_trace(go.Scatter(x=steps, y=result["grad_norms"][:, k], mode="lines", line=dict(color=color),
+                                 name=f"시작점 {k + 1}", showlegend=False), row=2, col=1)
+    fig.update_yaxes(type="log")
+    fig.update_layout(height=560, margin=dict(l=20, r=20, t=40, b=20))
+    fig.update_xaxes(title_text="Step", row=2, col=1)
+    return fig
+
+
+def plot_eigen_residual(problem, result):
+    """이차 함수: 고유 방향별 남은 거리 |(Qᵀx)_i| (작은 고윳값 방향이 가장 늦게 줄어듦)"""
+    start = np.abs(problem.eigen_coordinates(result["path"][0].astype(float)))
+    final = np.abs(problem.eigen_coordinates(result["final"]))
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=problem.eigenvalues, y=start.mean(axis=0), mode="markers",
+                             marker=dict(size=4, color="lightgray"), name="시작"))
+    fig.add_trace(go.Scatter(x=problem.eigenvalues, y=final.mean(axis=0), mode="markers",
+                             marker=dict(size=4, color="#d62728"), name="마지막 스텝"))
+    fig.update_layout(
+        height=320, margin=dict(l=20, r=20, t=40, b=20), title_text="고유 방향별 최소점까지 남은 거리", title_x=0.5,
+        xaxis=dict(title="고윳값 λ (곡률)", type="log"), yaxis=dict(title="|고유 좌표| 평균", type="log"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+# ----- 2. 앱 본문 -----
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("06_ndim")
+    try:
+        run_app(timer)
+    finally:
+        timer.finish()
+
+
+def run_app(timer):
+    # 공유 링크의 설정은 위젯 기본값으로 사용 (같은 설정의 결과는 run_descent 캐시에서 바로 나옴)
+    link = PageLink("06_ndim", LINK_FIELDS)
+    with st.sidebar:
+        st.header("⚙️ 문제 설정")
+        kind = PROBLEM_OPTIONS[st.selectbox("함수 선택", list(PROBLEM_OPTIONS),
+                                            index=link.index("p", list(PROBLEM_OPTIONS.values())),
+                                            key="ndim_problem")]
+        formula, condition = "", 1.0
+        if kind == "expression":
+            formula = st.text_input("함수 f(x1, ..., xn)", value=link.get("f", "x1**2 + 10*x2**2 + (x1 - x3)**2 + x3**4"),
+                                    key="ndim_formula")
+            n = None
+        else:
+            n = st.select_slider("차원 n", DIM_OPTIONS, value=DIM_OPTIONS[link.index("dim", DIM_OPTIONS, 7)],
+                                 key="ndim_dim")
+        if kind == "quadratic":
+            condition = float(st.select_slider("조건수 κ = λmax / λmin", CONDITION_OPTIONS,
+                                               value=CONDITION_OPTIONS[link.index("cond", CONDITION_OPTIONS, 2)],
+                                               key="ndim_condition"))
+
+        with timer.stage("parse_lambdify"):
+            try:
+                problem = get_problem(kind, n, condition, formula)
+            except Exception as e:
+                st.error(f"🚨 함수 정의 오류: {e}")
+                st.stop()
+
+        st.header("🚶 경사 하강 설정")
+        if problem.lipschitz:
+            # 가장 큰 곡률 L에 대해 α < 2/L 이어야 모든 방향에서 안정
+            ratio = st.slider("학습률 (안정 한계 2/L 대비 비율)", 0.05, 1.2, link.get("lrr", 0.9, (0.05, 1.2)), 0.05,
+                              key="ndim_lr_ratio")
+            learning_rate = ratio * 2.0 / problem.lipschitz
+            st.caption(f"α = {learning_rate:.3g} (L = {problem.lipschitz:.3g}, 2/L = {2.0 / problem.lipschitz:.3g})")
+        else:
+            learning_rate = st.number_input("학습률 (α)", 1e-5, 1.0, link.get("lr", 1e-3, (1e-5, 1.0)), step=1e-4,
+                                            format="%.5f", key="ndim_lr")
+        steps = st.slider("스텝 수", 10, 2000, link.get("n", 300, (10, 2000)) // 10 * 10, step=10, key="ndim_steps")
+        momentum = st.slider("모멘텀 β", 0.0, 0.99, link.get("mom", 0.0, (0.0, 0.99)), 0.01, key="ndim_momentum")
+        n_starts = st.slider("시작점 수", 1, 8, link.get("k", 4, (1, 8)), key="ndim_starts")
+        radius = st.slider("최소점으로부터 시작 거리", 0.1, 5.0, link.get("r", 2.0, (0.1, 5.0)), 0.1, key="ndim_radius")
+        seed = st.number_input("난수 시드", 0, 9999, link.get("seed", 0, (0, 9999)), key="ndim_seed")
+        link.update(
+            p=kind, f=formula or None, dim=n, cond=int(condition) if kind == "quadratic" else None,
+            lrr=ratio if problem.lipschitz else None, lr=None if problem.lipschitz else learning_rate,
+            n=steps, mom=momentum, k=n_starts, r=radius, seed=int(seed)
+        )
+        st.caption(SHARE_HINT)
+
+        st.header("🔭 2D 보기")
+        view = st.radio("투영 방식", ["PCA 평면 (경로 주성분)", "좌표 단면 (x_i, x_j)"], key="ndim_view")
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+
+    with timer.stage("gd_steps"):
+        result = run_descent(kind, n, condition, formula, n_starts, radius, int(seed),
+                             learning_rate, steps, momentum)
+
+    col_plane, col_curve = st.columns([3, 2])
+    with col_plane:
+        if view.startswith("PCA"):
+            c1, c2 = st.columns(2)
+            which = c1.selectbox("주성분을 구할 경로", ["모든 시작점"] + [f"시작점 {k + 1}" for k in range(n_starts)],
+                                 key="ndim_pca_source")
+            path = result["path"] if which == "모든 시작점" else result["path"][:, [int(which.split()[-1]) - 1]]
+            with timer.stage("projection"):
+                center, u, v, explained = pca_plane(path)
+            c2.markdown(f"설명 분산: PC1 `{explained[0]:.1%}`, PC2 `{explained[1]:.1%}`")
+            plane, labels, title_text = (center, u, v), ("PC1", "PC2"), "경로 주성분 평면의 함숫값과 경로"
+        else:
+            c1, c2 = st.columns(2)
+            i = int(c1.number_input("가로축 좌표 i", 1, problem.n, 1, key="ndim_axis_i")) - 1
+            j = int(c2.number_input("세로축 좌표 j", 1, problem.n, min(2, problem.n), key="ndim_axis_j")) - 1
+            if i == j:
+                st.warning("서로 다른 두 좌표를 골라 주세요.")
+                st.stop()
+            # 나머지 좌표는 첫 시작점의 마지막 위치로 고정한 단면
+            plane = coordinate_plane(problem.n, i, j, result["final"][0])
+            labels, title_text = (f"x{i + 1}", f"x{j + 1}"), f"x{i + 1}–x{j + 1} 단면 (나머지 좌표는 시작점 1의 마지막 위치)"
+
+        with timer.stage("figure"):
+            fig_plane = plot_plane(problem, result, plane, labels, title_text)
+        with timer.stage("serialize"):
+            st.plotly_chart(fig_plane, use_container_width=True)
+
+    with col_curve:
+        with timer.stage("figure"):
+            fig_curves = plot_curves(result)
+        with timer.stage("serialize"):
+            st.plotly_chart(fig_curves, use_container_width=True)
+        final_values = result["values"][-1]
+        st.markdown(
+            f"- 차원 `n = {problem.n}`, 시작점 `{n_starts}`개, `{steps}` 스텝\n"
+            f"- 마지막 함숫값: 최소 `{np.nanmin(final_values):.4g}` / 최대 `{np.nanmax(final_values):.4g}`\n"
+            f"- 발산한 시작점: `{int(result['diverged'].sum())}`개"
+        )
+
+    st.markdown("---")
+    st.subheader("💡 고차원에서는 무엇이 다를까요?")
+    if kind == "quadratic":
+        col_a, col_b = st.columns([3, 2])
+        with timer.stage("figure"):
+            fig_eigen = plot_eigen_residual(problem, result)
+        col_a.plotly_chart(fig_eigen, use_container_width=True)
+        rate = 1.0 - learning_rate * problem.eigenvalues[0]
+        col_b.markdown(
+            f"- 학습률은 **가장 가파른 방향**(λmax = {problem.eigenvalues[-1]:.3g})이 정합니다: α < 2/λmax.\n"
+            f"- 진행 속도는 **가장 완만한 방향**(λmin = {problem.eigenvalues[0]:.3g})이 정합니다: "
+            f"한 스텝에 오차가 약 `{rate:.4f}` 배로 줄어듭니다.\n"
+            f"- 그래서 조건수 κ가 클수록 느려지고, 차원이 커지면 중간 곡률 방향이 많아져 "
+            "2차원 그림 하나로는 전체 움직임이 보이지 않습니다.\n"
+            "- 왼쪽 그림에서 큰 고윳값 방향은 금방 0에 가까워지고, 작은 고윳값 방향이 끝까지 남습니다."
+        )
+    else:
+        st.markdown(
+            "- 무작위 방향의 두 벡터는 차원이 클수록 거의 수직이므로, 좌표 단면이나 PCA 평면은 "
+            "경로의 일부만 보여 줍니다. PCA 설명 분산 비율로 얼마나 보이는지 확인하세요.\n"
+            "- Rastrigin처럼 지역 최소점이 많은 함수는 차원이 커질수록 지역 최소점 수가 지수적으로 늘어납니다.\n"
+            "- Rosenbrock은 좁고 휜 골짜기를 따라가야 해서 차원이 커지면 필요한 스텝 수가 크게 늘어납니다."
+        )
+
+    if debug_placeholder is not None:
+        render_timing_panel(debug_placeholder, timer.as_record())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import time
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from gdcore.contour_view import CONTOUR_VIEW_NAME
+from gdcore.dataset import MODELS, Dataset, import_csv, make_synthetic, sgd_trajectory
+from gdcore.loss_surface import SUMMARY_BINS, LossSurface, logistic_error_bound
+from gdcore.surface_view import plot_gd
+from gdcore.timing import RerunTimer, debug_panel_enabled, render_timing_panel
+from gdcore.urlstate import SHARE_HINT, PageLink
+
+# ----- 애플리케이션 설정 -----
+st.set_page_config(layout="wide", page_title="데이터셋 미니배치 SGD", page_icon="📦")
+
+st.title("📦 데이터셋 손실에서의 미니배치 경사 하강 (SGD)")
+st.caption("함수식 대신 데이터가 손실을 정합니다. 매개변수 (w, b) 두 개의 선형·로지스틱 회귀를 "
+           "미니배치로 학습하며, 배치 크기에 따라 경로의 흔들림과 계산량이 어떻게 달라지는지 확인합니다.")
+
+SYNTHETIC_LABEL = "예시 데이터 (자동 생성)"
+UPLOAD_LABEL = "CSV 파일 업로드"
+ROW_OPTIONS = [10_000, 100_000, 1_000_000, 5_000_000]
+BATCH_OPTIONS = [1, 4, 16, 64, 256, 1024, 4096]
+COMPARE_BATCHES = [1, 16, 256, 4096]
+# 공유 링크(URL)에 담는 설정 – 업로드한 CSV는 링크로 전달할 수 없어 예시 데이터일 때만 데이터 설정 포함
+LINK_FIELDS = {
+    "task": "str", "rows": "int", "noise": "float", "model": "str", "bs": "int", "lr": "float", "n": "int",
+    "w0": "float", "b0": "float", "seed": "int", "wr": "range", "br": "range"
+}
+CAMERA_ANGLES = {
+    "사선(전체 보기)": dict(x=1.7, y=1.7, z=1.2),
+    "위에서 내려다보기": dict(x=0.0, y=0.0, z=3.0),
+    "정면(w+방향)": dict(x=2.0, y=0.0, z=0.5),
+    CONTOUR_VIEW_NAME: None,
+}
+
+
+# ----- 1. 계산 함수 (설정별 캐시) -----
+@st.cache_resource(max_entries=8, show_spinner="예시 데이터 생성 중...")
+def get_synthetic(task, n_rows, noise):
+    """예시 데이터셋 (디스크에 없으면 조각 단위로 생성)"""
+    return make_synthetic(task, n_rows, noise)
+
+
+@st.cache_resource(max_entries=8, show_spinner="CSV 변환 중...")
+def get_uploaded(file_id, x_column, y_column, _upload):
+    """업로드한 CSV의 두 열을 memmap 데이터셋으로 변환 (같은 파일·열이면 재사용)"""
+    return import_csv(_upload, x_column, y_column)
+
+
+@st.cache_resource(max_entries=8, show_spinner="데이터 요약 중...")
+def get_loss_surface(directory, model):
+    """데이터셋 전체의 손실 평가기 (한 번 스트리밍해 만든 요약 사용)"""
+    return LossSurface(Dataset.open(directory), model)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_surface_grid(directory, model, w_range, b_range, resolution=80):
+    """(w, b) 격자 위의 손실 표면 (배열은 읽기 전용)"""
+    surface = get_loss_surface(directory, model).grid(w_range, b_range, resolution)
+    for arr in surface:
+        arr.setflags(write=False)
+    return surface
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def run_sgd(directory, model, start, learning_rate, steps, batch_size, seed):
+    """미니배치 경사 하강 경로와 배치 손실, 걸린 시간(초)"""
+    t0 = time.perf_counter()
+    path, batch_losses = sgd_trajectory(Dataset.open(directory), model, start, learning_rate, steps, batch_size, seed)
+    return path, batch_losses, time.perf_counter() - t0
+
+
+def plot_loss_curves(batch_losses, path_losses):
+    """배치 손실(흔들림)과 전체 데이터 손실"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=np.arange(1, len(batch_losses) + 1), y=batch_losses, mode="lines",
+                             line=dict(color="lightgray"), name="미니배치 손실"))
+    fig.add_trace(go.Scatter(x=np.arange(len(path_losses)), y=path_losses, mode="lines",
+                             line=dict(color="red", width=2), name="전체 데이터 손실"))
+    fig.update_layout(
+        height=320, margin=dict(l=20, r=20, t=40, b=20), title_text="스텝별 손실", title_x=0.5,
+        xaxis_title="Step", yaxis=dict(title="손실", type="log"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+# ----- 2. 앱 본문 -----
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("07_sgd")
+    try:
+        run_app(timer)
+    finally:
+        timer.finish()
+
+
+def select_dataset(link):
+    """사이드바에서 데이터셋 선택 (없으면 None), 링크에 담을 데이터 설정"""
+    source = st.radio("데이터", [SYNTHETIC_LABEL, UPLOAD_LABEL], key="sgd_source")
+    if source == SYNTHETIC_LABEL:
+        task = st.selectbox("예시 종류", list(MODELS), index=link.index("task", list(MODELS)),
+                            format_func=MODELS.get, key="sgd_synthetic_task")
+        n_rows = st.select_slider("행 수", ROW_OPTIONS, value=ROW_OPTIONS[link.index("rows", ROW_OPTIONS, 1)],
+                                  format_func=lambda n: f"{n:,}", key="sgd_rows")
+        noise = st.slider("잡음 크기", 0.1, 5.0, link.get("noise", 1.0, (0.1, 5.0)), 0.1, key="sgd_noise")
+        return get_synthetic(task, n_rows, noise), dict(task=task, rows=n_rows, noise=noise)
+
+    upload = st.file_uploader("CSV 파일 (첫 행은 열 이름)", type="csv", key="sgd_upload")
+    if upload is None:
+        return None, {}
+    columns = pd.read_csv(upload, nrows=100).select_dtypes("number").columns.tolist()
+    upload.seek(0)
+    if len(columns) < 2:
+        st.error("숫자 열이 두 개 이상 필요합니다.")
+        return None, {}
+    x_column = st.selectbox("입력 열 x", columns, key="sgd_x_column")
+    y_column = st.selectbox("목표 열 y", columns, index=1, key="sgd_y_column")
+    try:
+        return get_uploaded(upload.file_id, x_column, y_column, upload), {}
+    except ValueError as e:
+        st.error(f"CSV 변환 오류: {e}")
+        return None, {}
+
+
+def run_app(timer):
+    # 공유 링크의 설정은 위젯 기본값으로 사용 (같은 설정의 결과는 run_sgd 캐시에서 바로 나옴)
+    link = PageLink("07_sgd", LINK_FIELDS)
+    with st.sidebar:
+        st.header("📂 데이터셋")
+        with timer.stage("dataset"):
+            dataset, data_config = select_dataset(link)
+        if dataset is None:
+            st.info("CSV 파일을 업로드해 주세요.")
+            st.stop()
+        model = st.selectbox("모델", list(MODELS),
+                             index=link.index("model", list(MODELS), list(MODELS).index(dataset.meta["task"])),
+                             format_func=MODELS.get, key=f"sgd_model_{dataset.directory}")
+        if model == "logistic" and dataset.meta["task"] != "logistic":
+            st.warning("로지스틱 회귀는 y가 0 또는 1이어야 합니다.")
+
+        st.header("⚙️ SGD 설정")
+        batch_size = st.select_slider("배치 크기", BATCH_OPTIONS, value=BATCH_OPTIONS[link.index("bs", BATCH_OPTIONS, 3)],
+                                      key="sgd_batch")
+        learning_rate = st.number_input("학습률 (α)", 0.001, 5.0, link.get("lr", 0.1, (0.001, 5.0)), step=0.01,
+                                        format="%.3f", key="sgd_lr")
+        steps = st.slider("스텝 수", 10, 1000, link.get("n", 200, (10, 1000)) // 10 * 10, step=10, key="sgd_steps")
+        c1, c2 = st.columns(2)
+        start_w = c1.number_input("시작 w", -10.0, 10.0, link.get("w0", -3.0, (-10.0, 10.0)), 0.5, key="sgd_start_w")
+        start_b = c2.number_input("시작 b", -10.0, 10.0, link.get("b0", 3.0, (-10.0, 10.0)), 0.5, key="sgd_start_b")
+        seed = st.number_input("난수 시드 (배치 순서)", 0, 9999, link.get("seed", 0, (0, 9999)), key="sgd_seed")
+        w_range = st.slider("w 표시 범위", -10.0, 10.0, link.get("wr", (-4.0, 4.0), (-10.0, 10.0)), key="sgd_w_range")
+        b_range = st.slider("b 표시 범위", -10.0, 10.0, link.get("br", (-4.0, 4.0), (-10.0, 10.0)), key="sgd_b_range")
+        camera = st.radio("보기", list(CAMERA_ANGLES), key="sgd_camera")
+        link.update(**data_config, model=model, bs=batch_size, lr=learning_rate, n=steps,
+                    w0=start_w, b0=start_b, seed=int(seed), wr=w_range, br=b_range)
+        st.caption(SHARE_HINT)
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+
+    st.markdown(f"**데이터**: `{dataset.n_rows:,}`행 · {MODELS[model]} · "
+                "x(와 선형 회귀의 y)는 표준화되어 있어 w, b는 표준화 단위입니다.")
+
+    with timer.stage("gd_steps"):
+        path, batch_losses, seconds = run_sgd(dataset.directory, model, (start_w, start_b),
+                                              learning_rate, steps, batch_size, int(seed))
+    with timer.stage("surface"):
+        f, dw, db = get_loss_surface(dataset.directory, model).functions()
+        surface = get_surface_grid(dataset.directory, model, tuple(w_range), tuple(b_range))
+
+    col_graph, col_info = st.columns([3, 2])
+    with col_graph:
+        with timer.stage("figure"):
+            fig = plot_gd(f, dw, db, w_range, b_range, [tuple(p) for p in path], None,
+                          CAMERA_ANGLES[camera], surface=surface,
+                          axis_titles=("w", "b", "손실 L(w, b)"), title_text="미니배치 SGD 경로와 손실 표면")
+        with timer.stage("serialize"):
+            st.plotly_chart(fig, use_container_width=True)
+        if model == "logistic":
+            bound = logistic_error_bound(max(abs(w_range[0]), abs(w_range[1])))
+            st.caption(f"로지스틱 손실 표면·전체 데이터 손실은 표준화 x를 {SUMMARY_BINS}개 구간으로 요약한 근사값입니다 "
+                       f"(이 w 범위에서 정확한 손실보다 최대 {bound:.1e} 작음, 상대 오차 보통 10⁻⁵ 수준).")
+
+    with col_info:
+        path_losses = f(path[:, 0], path[:, 1])
+        with timer.stage("figure"):
+            fig_loss = plot_loss_curves(batch_losses, path_losses)
+        st.plotly_chart(fig_loss, use_container_width=True)
+        st.markdown(
+            f"- 마지막 위치 `(w, b) = ({path[-1, 0]:.3f}, {path[-1, 1]:.3f})`, 전체 데이터 손실 `{path_losses[-1]:.4f}`\n"
+            f"- 사용한 샘플 수: `{len(batch_losses) * batch_size:,}` ({len(batch_losses) * batch_size / dataset.n_rows:.2f} 에폭)\n"
+            f"- 계산 시간: `{seconds * 1000:.1f} ms` (스텝당 `{seconds / max(len(batch_losses), 1) * 1e6:.0f} µs`)"
+        )
+
+        st.markdown("#### ⚖️ 배치 크기 비교 (같은 스텝 수)")
+        rows = []
+        for bs in COMPARE_BATCHES:
+            p, bl, sec = run_sgd(dataset.directory, model, (start_w, start_b), learning_rate, steps, bs, int(seed))
+            tail = np.diff(f(p[-11:, 0], p[-11:, 1]))
+            rows.append({"배치 크기": bs, "마지막 손실": float(f(*p[-1])), "마지막 10스텝 흔들림": float(np.std(tail)),
+                         "시간 (ms)": sec * 1000})
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+        st.caption("배치가 작으면 한 스텝이 싸지만 기울기 추정이 부정확해 경로가 흔들리고, "
+                   "배치가 크면 경로가 매끄럽지만 스텝마다 더 많은 데이터를 읽습니다.")
+
+    if debug_placeholder is not None:
+        render_timing_panel(debug_placeholder, timer.as_record())
+
+
+if __name__ == "__main__":
+    main()
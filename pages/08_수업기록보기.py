@@ -0,0 +1,134 @@
+import os
+from datetime import datetime, timedelta
+
+import streamlit as st
+import pandas as pd
+
+from gdcore.batchwriter import writer_warnings
+from gdcore.classstats import OUTCOMES, expression_label
+from gdcore.reflections import DB_PATH, get_writer, query_reflections, summary_by_expression
+from gdcore.runarchive import ARCHIVE_DIR, get_writer as get_archive_writer, load_runs
+from gdcore.timing import RerunTimer, debug_panel_enabled, render_timing_panel
+
+# ----- 애플리케이션 설정 -----
+st.set_page_config(layout="wide", page_title="수업 기록 보기 (교사용)", page_icon="📒")
+
+st.title("📒 수업 기록 보기 (교사용)")
+st.caption("학생들이 03_B 페이지에서 남긴 \"오늘 배운 점\"과 그때의 실행 설정을 모아 봅니다. "
+           "기록은 이 서버의 SQLite 파일에 저장되며, 저장 직후 1초 정도 뒤에 보입니다. "
+           "서버 저장은 기본으로 꺼져 있습니다 – `GD_PERSIST=1`(data/ 아래) 또는 "
+           "`GD_REFLECTION_DB`·`GD_RUN_ARCHIVE_DIR`로 위치를 지정해 서버를 실행하면 저장합니다.")
+
+# 교사용 접근 코드 (지정하지 않으면 기록을 볼 수 없음)
+ACCESS_CODE = os.environ.get("GD_TEACHER_CODE", "")
+PERIOD_OPTIONS = {"전체": None, "오늘": 0, "최근 7일": 7, "최근 30일": 30}
+COLUMN_LABELS = {
+    "ts": "시각", "page": "페이지", "text": "배운 점", "expr": "함수식", "start_x": "시작 x", "start_y": "시작 y",
+    "learning_rate": "학습률", "steps": "반복", "final_loss": "최종 f",
+}
+
+
+# ----- 1. 조회 -----
+def period_start(days):
+    """기간 선택 → 조회 시작 시각 문자열 (전체면 None)"""
+    if days is None:
+        return None
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    return start.isoformat(timespec="seconds")
+
+
+def reflections_frame(rows):
+    """조회 결과 → 표시용 DataFrame"""
+    frame = pd.DataFrame(rows, columns=["id", "session", *COLUMN_LABELS])
+    return frame[list(COLUMN_LABELS)].rename(columns=COLUMN_LABELS)
+
+
+def archived_runs_frame(since):
+    """보관된 실행의 함수식·결과별 개수와 평균 (요약 열만 memory-map으로 읽음)"""
+    table = load_runs(["expr", "outcome", "learning_rate", "n_steps", "final_loss"], since=since)
+    if not table.num_rows:
+        return pd.DataFrame()
+    summary = table.group_by(["expr", "outcome"]).aggregate([
+        ("learning_rate", "count"), ("learning_rate", "mean"), ("n_steps", "mean"), ("final_loss", "mean")
+    ]).to_pandas()
+    summary["expr"] = summary["expr"].map(expression_label)
+    summary["outcome"] = summary["outcome"].map(lambda name: OUTCOMES.get(name, name))
+    summary = summary.rename(columns={
+        "expr": "함수식", "outcome": "결과", "learning_rate_count": "실행 수", "learning_rate_mean": "평균 학습률",
+        "n_steps_mean": "평균 진행 스텝", "final_loss_mean": "평균 최종 f"
+    })
+    return summary[["함수식", "결과", "실행 수", "평균 학습률", "평균 진행 스텝", "평균 최종 f"]].sort_values(
+        ["함수식", "실행 수"], ascending=[True, False])
+
+
+# ----- 2. 앱 본문 -----
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("08_reflections")
+    try:
+        run_app(timer)
+    finally:
+        timer.finish()
+
+
+def run_app(timer):
+    with st.sidebar:
+        st.header("🔎 조회 조건")
+        if not ACCESS_CODE:
+            # 코드를 정하지 않은 서버에서는 학생도 열 수 있으므로 교사용 페이지를 잠금
+            st.warning("교사용 접근 코드가 설정되지 않아 기록을 볼 수 없습니다. "
+                       "서버를 `GD_TEACHER_CODE` 환경 변수와 함께 실행해 주세요.")
+            return
+        if st.text_input("교사용 접근 코드", type="password") != ACCESS_CODE:
+            st.info("접근 코드를 입력하면 기록이 보입니다.")
+            return
+        period = st.selectbox("기간", list(PERIOD_OPTIONS), index=1)
+        search = st.text_input("배운 점 검색어", placeholder="예) 학습률")
+        limit = st.select_slider("최대 표시 개수", [50, 100, 200, 500, 1000], value=200)
+        if st.button("🔄 새로 고침", use_container_width=True):
+            for writer in (get_writer(), get_archive_writer()):
+                if writer is not None:
+                    writer.flush(timeout=2.0)  # 이 서버에서 아직 기록 대기 중인 것까지 반영
+        st.caption(f"DB 파일: `{DB_PATH or '(저장 꺼짐)'}`")
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+
+    # 이 서버에서 기록 쓰기가 실패하고 있으면 (디스크 가득 참·권한 등) 조회 결과가 빠져 있을 수 있음
+    for warning in writer_warnings():
+        st.warning(warning)
+
+    with timer.stage("query"):
+        summary = summary_by_expression()
+    selected = st.multiselect("함수식", [row["expr"] for row in summary if row["expr"]], placeholder="전체 함수식")
+    with timer.stage("query"):
+        rows = query_reflections(expr=selected, search=search.strip() or None,
+                                 since=period_start(PERIOD_OPTIONS[period]), limit=limit)
+
+    if not summary:
+        st.info("아직 저장된 기록이 없습니다.")
+    else:
+        st.subheader("📊 함수식별 요약 (전체 기간)")
+        st.dataframe(pd.DataFrame(summary).rename(columns={
+            "expr": "함수식", "count": "기록 수", "mean_lr": "평균 학습률",
+            "mean_final_loss": "평균 최종 f", "last_ts": "마지막 기록"
+        }), hide_index=True, use_container_width=True)
+
+        st.subheader(f"✍️ 기록 {len(rows)}개")
+        frame = reflections_frame(rows)
+        st.dataframe(frame, hide_index=True, use_container_width=True)
+        st.download_button("CSV로 내려받기", frame.to_csv(index=False).encode("utf-8-sig"),
+                           file_name="reflections.csv", mime="text/csv", disabled=frame.empty)
+
+    st.subheader(f"🗄️ 보관된 실행 ({period})")
+    with timer.stage("archive"):
+        archived = archived_runs_frame(period_start(PERIOD_OPTIONS[period]))
+    if archived.empty:
+        st.info(f"보관된 실행이 없습니다. (보관 위치: `{ARCHIVE_DIR or '(보관 꺼짐)'}`)")
+    else:
+        st.dataframe(archived, hide_index=True, use_container_width=True)
+
+    if debug_placeholder is not None:
+        render_timing_panel(debug_placeholder, timer.as_record())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from gdcore.batchwriter import writer_warnings
+from gdcore.classstats import (ACTIVE_WINDOW, ACTIVITY_MINUTES, LR_EDGES, OUTCOMES, START_EDGES, expression_label,
+                               get_aggregator)
+from gdcore.fragments import fragment_timer
+from gdcore.timing import RerunTimer, debug_panel_enabled, render_timing_panel
+
+# ----- 애플리케이션 설정 -----
+st.set_page_config(layout="wide", page_title="수업 현황 (교사용)", page_icon="📡")
+
+st.title("📡 수업 현황 (교사용)")
+st.caption("학생들이 02_A·03_B·04_C 페이지에서 실행한 경사 하강의 요약(함수식, 시작점, 학습률, 결과)을 "
+           "실시간으로 모아 봅니다. 이 서버 프로세스가 시작된 뒤의 실행만 집계합니다.")
+
+# 교사용 접근 코드 (지정하지 않으면 현황을 볼 수 없음)
+ACCESS_CODE = os.environ.get("GD_TEACHER_CODE", "")
+REFRESH_OPTIONS = {"2초": 2, "5초": 5, "10초": 10, "멈춤": None}
+OUTCOME_COLORS = {"converged": "#2ca02c", "diverged": "#d62728", "running": "#ff7f0e"}
+RECENT_COLUMNS = ["시각", "함수식", "시작 x", "시작 y", "학습률", "반복", "결과", "최종 f"]
+
+
+# ----- 1. 스냅샷 → 표·그래프 -----
+def expression_frame(snapshot):
+    """함수식별 결과 개수 표 (발산 많은 순)"""
+    rows = []
+    for key, stats in snapshot["expressions"].items():
+        counts = dict(zip(OUTCOMES, stats["outcomes"].tolist()))
+        total = sum(counts.values())
+        rows.append({"함수식": expression_label(key), "실행": total,
+                     **{OUTCOMES[name]: counts[name] for name in OUTCOMES},
+                     "발산 비율": counts["diverged"] / total if total else 0.0})
+    frame = pd.DataFrame(rows, columns=["함수식", "실행", *OUTCOMES.values(), "발산 비율"])
+    return frame.sort_values(["발산", "실행"], ascending=False)
+
+
+def lr_histogram_figure(stats):
+    """학습률(log₁₀) 구간별 실행 수 – 결과별로 쌓은 막대"""
+    centers = 10 ** ((LR_EDGES[:-1] + LR_EDGES[1:]) / 2)
+    fig = go.Figure()
+    for i, name in enumerate(OUTCOMES):
+        fig.add_trace(go.Bar(x=centers, y=stats["lr_hist"][i], name=OUTCOMES[name],
+                             marker_color=OUTCOME_COLORS[name]))
+    fig.update_layout(barmode="stack", height=320, margin=dict(l=10, r=10, t=30, b=10),
+                      title="학습률 분포", xaxis=dict(type="log", title="학습률 α"), yaxis_title="실행 수")
+    return fig
+
+
+def start_heatmap_figure(stats):
+    """시작점 격자별 실행 수 (범위 밖은 가장자리 칸)"""
+    centers = (START_EDGES[:-1] + START_EDGES[1:]) / 2
+    hist = stats["start_hist"].astype(float)
+    hist[hist == 0] = np.nan   # 빈 칸은 색 없이
+    fig = go.Figure(go.Heatmap(x=centers, y=centers, z=hist, colorscale="Blues", colorbar=dict(title="실행")))
+    fig.update_layout(height=320, margin=dict(l=10, r=10, t=30, b=10), title="시작점 분포",
+                      xaxis_title="시작 x", yaxis=dict(title="시작 y", scaleanchor="x"))
+    return fig
+
+
+def activity_figure(snapshot):
+    """최근 ACTIVITY_MINUTES분 동안 분당 실행 수"""
+    minutes = np.arange(-ACTIVITY_MINUTES + 1, 1)
+    fig = go.Figure(go.Bar(x=minutes, y=snapshot["activity"], marker_color="#1f77b4"))
+    fig.update_layout(height=220, margin=dict(l=10, r=10, t=30, b=10), title="분당 실행 수",
+                      xaxis_title="분 전 (0 = 지금)", yaxis_title="실행 수")
+    return fig
+
+
+def recent_frame(snapshot, limit=50):
+    """최근 실행 표 (최근 순)"""
+    rows = [
+        (datetime.fromtimestamp(ts).strftime("%H:%M:%S"), expression_label(key), sx, sy, lr, steps,
+         OUTCOMES[outcome], final_loss)
+        for ts, key, sx, sy, lr, steps, outcome, final_loss in reversed(snapshot["recent"][-limit:])
+    ]
+    return pd.DataFrame(rows, columns=RECENT_COLUMNS)
+
+
+# ----- 2. 실시간 패널 (자동 새로 고침 fragment) -----
+def render_live_panel(timer):
+    """스냅샷 하나로 지표·표·그래프 그리기"""
+    with timer.stage("snapshot"):
+        snapshot = get_aggregator().snapshot()
+
+    for warning in writer_warnings():
+        st.warning(warning)   # 현황은 메모리 집계라 그대로 보이지만, 파일 기록은 빠지고 있음
+
+    expressions = expression_frame(snapshot)
+    diverged = int(expressions["발산"].sum()) if not expressions.empty else 0
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("전체 실행", f"{snapshot['total']:,}")
+    col2.metric(f"활동 중인 학생 (최근 {int(ACTIVE_WINDOW // 60)}분)", snapshot["active_sessions"])
+    col3.metric("발산한 실행", f"{diverged:,}")
+    col4.metric("발산 비율", f"{diverged / snapshot['total']:.0%}" if snapshot["total"] else "-")
+
+    if not snapshot["total"]:
+        st.info("아직 집계된 실행이 없습니다. 학생들이 경사 하강을 실행하면 여기에 나타납니다.")
+        return
+
+    with timer.stage("figure"):
+        st.plotly_chart(activity_figure(snapshot), use_container_width=True, key="class_activity")
+
+        st.subheader("🧮 함수식별 결과")
+        st.dataframe(expressions, hide_index=True, use_container_width=True,
+                     column_config={"발산 비율": st.column_config.ProgressColumn(format="%.0f%%", min_value=0,
+                                                                                max_value=1)})
+
+        keys = list(snapshot["expressions"])
+        selected = st.selectbox("자세히 볼 함수식", keys, format_func=expression_label, key="class_expr")
+        stats = snapshot["expressions"][selected]
+        col_lr, col_start = st.columns(2)
+        col_lr.plotly_chart(lr_histogram_figure(stats), use_container_width=True, key="class_lr_hist")
+        col_start.plotly_chart(start_heatmap_figure(stats), use_container_width=True, key="class_start_map")
+
+        st.subheader("🕒 최근 실행")
+        st.dataframe(recent_frame(snapshot), hide_index=True, use_container_width=True)
+    st.caption(f"스냅샷 시각: {datetime.fromtimestamp(snapshot['time']).strftime('%H:%M:%S')}")
+
+
+# ----- 3. 앱 본문 -----
+def main():
+    """메인 애플리케이션 실행 (재실행 단계별 시간 측정 포함)"""
+    timer = RerunTimer("09_class_stats")
+    try:
+        run_app(timer)
+    finally:
+        timer.finish()
+
+
+def run_app(timer):
+    with st.sidebar:
+        st.header("⚙️ 보기 설정")
+        if not ACCESS_CODE:
+            # 코드를 정하지 않은 서버에서는 학생도 열 수 있으므로 교사용 페이지를 잠금
+            st.warning("교사용 접근 코드가 설정되지 않아 현황을 볼 수 없습니다. "
+                       "서버를 `GD_TEACHER_CODE` 환경 변수와 함께 실행해 주세요.")
+            return
+        if st.text_input("교사용 접근 코드", type="password") != ACCESS_CODE:
+            st.info("접근 코드를 입력하면 현황이 보입니다.")
+            return
+        refresh = st.radio("자동 새로 고침", list(REFRESH_OPTIONS), horizontal=True)
+        st.caption("서버를 여러 프로세스로 띄운 경우 이 페이지가 연결된 프로세스의 실행만 보입니다.")
+        debug_placeholder = st.empty() if debug_panel_enabled() else None
+
+    # 새로 고침 간격마다 이 부분만 다시 실행 (사이드바·페이지 전체는 그대로)
+    @st.fragment(run_every=REFRESH_OPTIONS[refresh])
+    def live_panel():
+        with fragment_timer("09_class_stats", timer) as panel_timer:
+            render_live_panel(panel_timer)
+        if debug_placeholder is not None:
+            render_timing_panel(debug_placeholder, panel_timer.as_record())
+
+    live_panel()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from sympy import diff, lambdify, sympify
+
+from gdcore.autodiff import X_SYM, Y_SYM, DualGradient
+from gdcore.functions import NUMPY_MODULES
+from gdcore.presets import PRESET_SPECS
+
+COMPOSITES = [
+    "exp(-(x**2 + y**2) / 4) * sin(x * y) + log(1 + x**2) * cos(y) ** 3",
+    "tanh(x - y) + atan(x * y) + sqrt(x**2 + y**2 + 1)",
+    "sinh(x / 3) * y**3 - 2 / (1 + x**2 + y**2)",
+    "(x - 4)**3 + (y + 5)**5",          # 음수 밑, 상수 지수
+    "(x**2 + 1)**(y / 3) + 2**x",       # 변수 지수, 양수 밑
+]
+
+
+def _symbolic_gradient(formula):
+    f_sym = sympify(formula)
+    return [lambdify((X_SYM, Y_SYM), diff(f_sym, s), modules=NUMPY_MODULES) for s in (X_SYM, Y_SYM)]
+
+
+@pytest.mark.parametrize("formula", [spec["formula"] for spec in PRESET_SPECS] + COMPOSITES)
+def test_dual_gradient_matches_symbolic(formula):
+    X, Y = np.meshgrid(np.linspace(-3, 3, 13), np.linspace(-2.5, 2.5, 11))
+    dual = DualGradient(formula)
+    value, gx, gy = dual.value_and_grad(X, Y)
+    f_np = lambdify((X_SYM, Y_SYM), sympify(formula), modules=NUMPY_MODULES)
+    with np.errstate(all="ignore"):
+        expected = [f_np(X, Y)] + [np.broadcast_to(g(X, Y), X.shape) for g in _symbolic_gradient(formula)]
+    for exact, got in zip(expected, (value, gx, gy)):
+        finite = np.isfinite(exact)
+        assert finite.mean() > 0.5
+        assert np.allclose(got[finite], exact[finite], rtol=1e-9, atol=1e-9)
+
+
+def test_dual_gradient_scalar_calls_match_arrays():
+    dual = DualGradient(PRESET_SPECS[2]["formula"])
+    grid = dual.value_and_grad(np.array([0.5, -1.5]), np.array([2.0, 0.25]))
+    for i, (x, y) in enumerate([(0.5, 2.0), (-1.5, 0.25)]):
+        assert dual(x, y) == pytest.approx(grid[0][i])
+        assert (dual.dx(x, y), dual.dy(x, y)) == pytest.approx((grid[1][i], grid[2][i]))
+
+
+def test_negative_base_with_locally_constant_exponent_is_finite():
+    # y = 0 에서 지수가 y 방향으로 변하지 않으므로 ln(음수) 항 없이 유한한 기울기
+    formula = "x**(y**2 + 2)"
+    xs = np.array([-2.0, -0.5, 1.5])
+    value, gx, gy = DualGradient(formula).value_and_grad(xs, np.zeros_like(xs))
+    symbolic_dx = _symbolic_gradient(formula)[0]
+    assert np.allclose(value, xs ** 2)
+    assert np.allclose(gx, symbolic_dx(xs, np.zeros_like(xs))) and np.allclose(gx, 2 * xs)
+    assert np.allclose(gy, 0.0)
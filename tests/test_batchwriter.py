@@ -0,0 +1,44 @@
+from gdcore import batchwriter
+from gdcore.batchwriter import storage_location, writer_warnings
+from gdcore.reflections import get_writer, query_reflections, record_reflection
+
+
+def test_failed_batch_is_kept_and_retried(tmp_path):
+    # DB 파일의 상위 경로가 파일이라 디렉터리를 만들 수 없음 → 기록 실패
+    blocker = tmp_path / "blocked"
+    blocker.write_text("")
+    path = str(blocker / "reflections.sqlite3")
+    writer = get_writer(path)
+    assert record_reflection("학습률이 크면 발산한다", "03_B", path=path)
+    assert not writer.flush()
+    assert writer.status()["pending"] == 1 and writer.last_error
+    assert any(str(blocker) in warning for warning in writer_warnings())
+
+    blocker.unlink()
+    blocker.mkdir()
+    assert writer.flush()
+    assert [row["text"] for row in query_reflections(path)] == ["학습률이 크면 발산한다"]
+    assert writer.status() == {"written": 1, "pending": 0, "dropped": 0, "last_error": None}
+    assert not any(str(blocker) in warning for warning in writer_warnings())
+
+
+def test_get_writer_is_shared_per_location(tmp_path):
+    first, second = str(tmp_path / "a.sqlite3"), str(tmp_path / "b.sqlite3")
+    assert get_writer(first) is get_writer(first)
+    assert get_writer(first) is not get_writer(second)
+    assert get_writer("") is None
+    record_reflection("첫 번째", "03_B", path=first)
+    record_reflection("두 번째", "03_B", path=second)
+    assert get_writer(first).flush() and get_writer(second).flush()
+    assert [row["text"] for row in query_reflections(second)] == ["두 번째"]
+
+
+def test_storage_is_opt_in(monkeypatch, tmp_path):
+    monkeypatch.delenv("GD_TEST_STORE", raising=False)
+    monkeypatch.setattr(batchwriter, "PERSIST", False)
+    assert storage_location("GD_TEST_STORE", "data/x") == ""
+    monkeypatch.setattr(batchwriter, "PERSIST", True)
+    assert storage_location("GD_TEST_STORE", "data/x") == "data/x"
+    monkeypatch.setenv("GD_TEST_STORE", str(tmp_path))
+    monkeypatch.setattr(batchwriter, "PERSIST", False)
+    assert storage_location("GD_TEST_STORE", "data/x") == str(tmp_path)
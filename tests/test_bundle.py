@@ -0,0 +1,14 @@
+from gdcore.bundle import PresetBundle, build_bundle
+from gdcore.presets import PRESET_SPECS
+
+
+def test_bundle_minimum_is_keyed_by_start_list(tmp_path):
+    spec = next(s for s in PRESET_SPECS if s.get("scipy_seeds"))
+    build_bundle(str(tmp_path), specs=[spec], resolutions=[40])
+    bundle = PresetBundle.open(str(tmp_path))
+    assert bundle is not None
+    preset_starts = [(0.0, 0.0), spec["start"], *spec["scipy_seeds"]]
+    assert bundle.minimum(spec["formula"].replace(" ", ""), preset_starts) is not None
+    # 같은 식을 직접 입력하면 시작점 목록이 달라 번들 값을 쓰지 않음
+    assert bundle.minimum(spec["formula"], [(0.0, 0.0), spec["start"]]) is None
+    assert bundle.surface(spec["formula"], spec["x_range"], spec["y_range"], 40) is not None
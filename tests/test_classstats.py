@@ -0,0 +1,75 @@
+import time
+
+import numpy as np
+
+from gdcore import classstats
+from gdcore.classstats import (LR_EDGES, MAX_EXPRESSIONS, OTHER_EXPRESSION, START_EDGES, ClassAggregator, _bin,
+                               classify_run)
+
+
+def test_bin_edges_and_out_of_range():
+    edges = START_EDGES.tolist()
+    assert _bin(edges, -10.0) == 0 and _bin(edges, 0.0) == 10 and _bin(edges, 0.999) == 10
+    assert _bin(edges, 10.0) == len(edges) - 2 and _bin(edges, 1e9) == len(edges) - 2
+    assert _bin(edges, -1e9) == 0 and _bin(edges, float("-inf")) == 0
+    assert _bin(edges, float("nan")) == 0 and _bin(edges, float("inf")) == len(edges) - 2
+
+
+def test_classify_run():
+    path, values = np.zeros((11, 2)), np.ones(11)
+    assert classify_run(path, values, 1e-4, 10) == "converged"
+    assert classify_run(path, values, 0.5, 10) == "running"
+    assert classify_run(path[:5], values[:5], 1e-4, 10) == "diverged"        # 일찍 멈춘 경로
+    assert classify_run(np.full((11, 2), 1e9), values, 0.5, 10) == "diverged"
+
+
+def test_record_fills_histogram_bins():
+    agg = ClassAggregator()
+    agg.record("s1", "x**2 + y**2", (0.5, -9.5), 0.01, 50, "converged", 0.0)
+    agg.record("s2", "x**2+y**2", (0.5, -9.5), 0.01, 50, "diverged", float("nan"))
+    snap = agg.snapshot()
+    assert snap["total"] == 2 and snap["active_sessions"] == 2
+    (stats,) = snap["expressions"].values()
+    lr_bin = int(np.searchsorted(LR_EDGES, -2.0, side="right") - 1)
+    assert stats["lr_hist"][0, lr_bin] == 1 and stats["lr_hist"][1, lr_bin] == 1
+    assert stats["start_hist"][0, 10] == 2                                    # [y 칸, x 칸]
+    assert list(stats["outcomes"]) == [1, 1, 0]
+    assert snap["activity"][-1] == 2 and snap["activity"].sum() == 2
+
+
+def test_expressions_beyond_limit_go_to_other():
+    agg = ClassAggregator()
+    for i in range(MAX_EXPRESSIONS + 3):
+        agg.record("s", f"x**2 + {i}*y**2", (0, 0), 0.1, 10, "running", 1.0)
+    expressions = agg.snapshot()["expressions"]
+    assert len(expressions) == MAX_EXPRESSIONS + 1
+    assert expressions[OTHER_EXPRESSION]["outcomes"].sum() == 3
+
+
+def test_activity_ring_buffer_drops_old_minutes():
+    agg = ClassAggregator()
+    now = time.time()
+    agg.record("s", "x**2", (0, 0), 0.1, 10, "running", 1.0, now=now - 3 * 3600)
+    agg.record("s", "x**2", (0, 0), 0.1, 10, "running", 1.0, now=now - 120)
+    activity = agg.snapshot()["activity"]
+    assert activity.sum() == 1 and activity[-3] == 1
+
+
+def test_snapshot_is_reused_and_never_waits_for_lock(monkeypatch):
+    agg = ClassAggregator()
+    agg.record("s", "x**2", (0, 0), 0.1, 10, "running", 1.0)
+    first = agg.snapshot()
+    agg.record("s", "x**2", (0, 0), 0.1, 10, "running", 1.0)
+    assert agg.snapshot() is first                                            # 아직 새로 만들 때가 아님
+    with agg._lock:
+        assert agg.snapshot(max_age=0.0) is first                            # 잠금이 바쁘면 이전 스냅샷
+    assert agg.snapshot(max_age=0.0)["total"] == 2
+
+
+def test_record_run_classifies_from_end_gradient(monkeypatch):
+    agg = ClassAggregator()
+    monkeypatch.setattr(classstats, "_aggregator", agg)
+    functions = (lambda x, y: x * x, lambda x, y: 2 * x, lambda x, y: 0 * y)
+    path, values = np.array([[1.0, 0.0], [1e-4, 0.0]]), np.array([1.0, 1e-8])
+    assert classstats.record_run("s", "x**2", functions, (1.0, 0.0), 0.5, 1, path, values) == "converged"
+    assert agg.snapshot()["recent"][-1][6] == "converged"
@@ -0,0 +1,93 @@
+import io
+import json
+import urllib.error
+
+import numpy as np
+import pytest
+
+from gdcore import compute
+from gdcore.functions import compile_function
+from gdcore.optimize import gd_trajectory
+
+BOWL = "x**2 + 2*y**2"
+
+
+class _Calls(list):
+    """서비스가 받은 작업 이름 목록 + 응답 함수"""
+    handler = None
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """가짜 계산 서비스 – 요청을 이 프로세스의 execute로 처리 (handler로 응답 바꿈)"""
+    monkeypatch.setattr(compute, "SERVICE_URL", "http://compute.test")
+    monkeypatch.setattr(compute, "_state", compute._ServiceState())
+    calls = _Calls()
+
+    def execute(req, timeout):
+        op = req.full_url.rsplit("/", 1)[1]
+        calls.append(op)
+        return io.BytesIO(compute.execute(op, json.loads(req.data)))
+
+    monkeypatch.setattr(compute.urllib.request, "urlopen", lambda req, timeout: calls.handler(req, timeout))
+    calls.handler = execute
+    return calls
+
+
+def test_encode_decode_round_trip_is_read_only():
+    result = {"path": np.arange(6.0).reshape(3, 2), "ok": np.array(True), "point": np.array([], dtype=float)}
+    decoded = compute.decode_result(compute.encode_result(result))
+    assert set(decoded) == set(result)
+    for name, arr in result.items():
+        assert np.array_equal(decoded[name], arr) and decoded[name].dtype == arr.dtype
+        assert not decoded[name].flags.writeable
+
+
+def test_execute_matches_local_computation():
+    functions = compile_function(BOWL)
+    remote = compute.decode_result(compute.execute("trajectory", {"expr": BOWL, "start": [1.0, -1.0],
+                                                                  "learning_rate": 0.1, "steps": 20}))
+    for name, local in zip(("path", "values", "grads"), gd_trajectory(*functions, (1.0, -1.0), 0.1, 20)):
+        assert np.array_equal(remote[name], local)
+    sweep = compute.decode_result(compute.execute("lr_sweep", {"expr": BOWL, "start": [1.0, -1.0],
+                                                               "rate_range": [0.01, 0.5], "steps": 30}))
+    assert sweep["rates"].shape == sweep["final_loss"].shape
+
+
+def test_no_service_computes_locally(monkeypatch):
+    monkeypatch.setattr(compute, "SERVICE_URL", "")
+    monkeypatch.setattr(compute, "_state", compute._ServiceState())
+    assert compute.trajectory(BOWL, (1, 1), 0.1, 5, lambda: "local") == "local"
+    assert compute.service_status()["local_calls"] == 1 and not compute.warm_compile(BOWL)
+
+
+def test_service_result_is_used(service):
+    path, values, grads = compute.trajectory(BOWL, (1, -1), 0.1, 10, lambda: pytest.fail("로컬 계산"))
+    assert service == ["trajectory"] and len(grads) == 10
+    assert np.array_equal(path, gd_trajectory(*compile_function(BOWL), (1.0, -1.0), 0.1, 10)[0])
+    assert compute.minimum(BOWL, [(1, 1), (-1, 2)], lambda: None) == pytest.approx((0, 0, 0), abs=1e-6)
+    assert compute.service_status()["remote_calls"] == 2
+
+
+def test_connection_failure_falls_back_and_backs_off(service):
+    def refuse(req, timeout):
+        service.append("refused")
+        raise urllib.error.URLError("connection refused")
+
+    service.handler = refuse
+    assert compute.trajectory(BOWL, (1, 1), 0.1, 5, lambda: "local") == "local"
+    assert compute.trajectory(BOWL, (1, 1), 0.1, 5, lambda: "local") == "local"
+    assert service == ["refused"]                                   # RETRY_AFTER 동안 다시 시도하지 않음
+    status = compute.service_status()
+    assert not status["available"] and "connection refused" in status["last_error"]
+    assert status["local_calls"] == 2
+
+
+def test_operation_error_falls_back_without_back_off(service):
+    def bad_request(req, timeout):
+        service.append("error")
+        raise urllib.error.HTTPError(req.full_url, 400, "bad expression", {}, None)
+
+    service.handler = bad_request
+    assert compute.surface_grid("x**", (-1, 1), (-1, 1), 10, lambda: "local") == "local"
+    assert compute.service_available() and compute.service_status()["last_error"] == "surface: HTTP 400"
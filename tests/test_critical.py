@@ -0,0 +1,42 @@
+import numpy as np
+
+from gdcore.critical import classify, deduplicate, find_critical_points, hessian_eigenvalues, summary_text
+from gdcore.functions import compile_function, compile_hessian
+
+HIMMELBLAU = "(x**2 + y - 11)**2 + (x + y**2 - 7)**2"
+HIMMELBLAU_MINIMA = [(3.0, 2.0), (-2.805118, 3.131313), (-3.779310, -3.283186), (3.584428, -1.848127)]
+
+
+def _critical(formula, x_range, y_range):
+    return find_critical_points(*compile_function(formula), compile_hessian(formula), x_range, y_range)
+
+
+def test_himmelblau_critical_points():
+    points = _critical(HIMMELBLAU, (-5, 5), (-5, 5))
+    assert summary_text(points) == "최소점 4 · 안장점 4 · 최대점 1"
+    minima = np.column_stack([points["x"], points["y"]])[points["kind"] == "minimum"]
+    for expected in HIMMELBLAU_MINIMA:
+        assert np.min(np.linalg.norm(minima - expected, axis=1)) < 1e-5
+    assert np.allclose(points["z"][points["kind"] == "minimum"], 0.0, atol=1e-9)
+    maximum = points["kind"] == "maximum"
+    assert np.allclose([points["x"][maximum][0], points["y"][maximum][0]], [-0.270845, -0.923039], atol=1e-5)
+
+
+def test_saddle_merges_all_seeds():
+    points = _critical("x**2 - y**2", (-1, 1), (-1, 1))
+    assert list(points["kind"]) == ["saddle"]
+    assert points["seeds"][0] == 24 * 24
+    assert np.allclose(points["eigenvalues"][0], [-2.0, 2.0])
+
+
+def test_classify_by_eigenvalue_signs():
+    lam_min, lam_max = hessian_eigenvalues(np.array([2.0, -1.0, 1.0, 0.0]), np.zeros(4),
+                                           np.array([3.0, -2.0, -1.0, 1.0]))
+    assert list(classify(lam_min, lam_max)) == ["minimum", "maximum", "saddle", "degenerate"]
+
+
+def test_deduplicate_keeps_smallest_gradient_representative():
+    x = np.array([0.0, 1e-6, 1.0])
+    y = np.array([0.0, 0.0, 1.0])
+    idx, counts = deduplicate(x, y, np.array([1e-3, 1e-9, 1e-9]), cell=1e-4)
+    assert list(idx) == [1, 2] and list(counts) == [2, 1]
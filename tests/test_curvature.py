@@ -0,0 +1,36 @@
+import numpy as np
+
+from gdcore.curvature import CONDITION_CAP, color_range, curvature_fields, overlay_spec
+from gdcore.functions import compile_function, compile_hessian
+
+
+def _fields(formula, X, Y):
+    _, dx, dy = compile_function(formula)
+    return curvature_fields(dx, dy, compile_hessian(formula), X, Y)
+
+
+def test_quadratic_has_constant_eigenvalues_and_condition():
+    X, Y = np.linspace(-2, 2, 7), np.linspace(-1, 1, 5)
+    fields = _fields("x**2 + 50*y**2", X, Y)
+    assert fields["lam_min"].shape == (5, 7)
+    assert np.allclose(fields["lam_min"], 2.0) and np.allclose(fields["lam_max"], 100.0)
+    assert np.allclose(fields["condition"], np.log10(50.0))
+    Xs, Ys = np.meshgrid(X, Y)
+    expected = np.log10(np.maximum(np.hypot(2 * Xs, 100 * Ys), 1e-12))
+    assert np.allclose(fields["grad_norm"], expected)
+
+
+def test_flat_direction_caps_condition_number():
+    fields = _fields("x**2", np.linspace(-1, 1, 4), np.linspace(-1, 1, 4))
+    assert np.allclose(fields["condition"], np.log10(CONDITION_CAP))
+    assert np.allclose(_fields("x + y", np.linspace(-1, 1, 3), np.linspace(-1, 1, 3))["condition"], 0.0)
+
+
+def test_color_ranges():
+    saddle = _fields("x**2 - 3*y**2", np.linspace(-1, 1, 5), np.linspace(-1, 1, 5))
+    assert color_range("lam_min", saddle["lam_min"]) == (-6.0, 6.0)         # 발산형은 0이 가운데
+    low, high = color_range("condition", np.full((3, 3), 2.0))
+    assert (low, high) == (2.0, 3.0)                                        # 값이 하나뿐이어도 폭 유지
+    assert color_range("grad_norm", np.full(3, np.nan)) == (0.0, 1.0)
+    spec = overlay_spec("lam_max", saddle)
+    assert spec["colorscale"] == "RdBu_r" and (spec["cmin"], spec["cmax"]) == (-2.0, 2.0)
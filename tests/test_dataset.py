@@ -0,0 +1,26 @@
+import numpy as np
+
+from gdcore.dataset import _write_chunks, iter_minibatches
+
+
+def _row_ids(dataset, batch):
+    """표준화된 x → 원래 행 번호 (x = 행 번호로 만든 데이터셋)"""
+    x, _ = batch
+    return np.rint(x * dataset.meta["std"][0] + dataset.meta["mean"][0]).astype(int)
+
+
+def test_minibatches_shuffle_rows_each_epoch_with_remainder(tmp_path):
+    n_rows, batch_size = 1000, 64
+    ids = np.arange(n_rows, dtype=float)
+    dataset = _write_chunks(str(tmp_path / "rows"), [(ids, 2.0 * ids)], "test")
+    batches = iter_minibatches(dataset, "linear", batch_size, seed=1)
+    per_epoch = -(-n_rows // batch_size)
+    epochs = [[_row_ids(dataset, next(batches)) for _ in range(per_epoch)] for _ in range(2)]
+
+    for epoch in epochs:
+        assert [len(rows) for rows in epoch] == [batch_size] * (per_epoch - 1) + [n_rows % batch_size]
+        assert np.array_equal(np.sort(np.concatenate(epoch)), np.arange(n_rows))   # 모든 행을 한 번씩
+        assert all(np.all(np.diff(rows) > 0) for rows in epoch)                      # 배치 안은 파일 순서
+        # 연속 행 블록이 아니라 행 단위로 섞임
+        assert max(np.ptp(rows) for rows in epoch) > 10 * batch_size
+    assert not np.array_equal(np.concatenate(epochs[0]), np.concatenate(epochs[1]))
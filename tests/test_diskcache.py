@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from gdcore.diskcache import _cache_path, cache_key, load_compiled, load_or_compile, store_compiled
+from gdcore.functions import compile_function
+
+POINTS = (np.array([-1.5, 0.0, 2.25]), np.array([0.5, -2.0, 1.0]))
+LARGE = "exp(-(x**2 + y**2) / 4) * sin(x * y) + log(1 + x**2) * cos(y) ** 3 + tanh(x - y) * atan(x * y)"
+
+
+@pytest.mark.parametrize("formula, mode", [("(x**2 + y - 11)**2 + (x + y**2 - 7)**2", "symbolic"),
+                                           (LARGE, "autodiff")])
+def test_round_trip_restores_same_values(tmp_path, formula, mode):
+    compiled = compile_function(formula, mode)
+    assert store_compiled(formula, compiled, mode, str(tmp_path))
+    restored = load_compiled(formula, mode, str(tmp_path))
+    assert restored is not None
+    for original, loaded in zip(compiled, restored):
+        assert np.allclose(loaded(*POINTS), original(*POINTS))
+    # 공백만 다른 식은 같은 항목
+    assert load_compiled(formula.replace(" ", ""), mode, str(tmp_path)) is not None
+
+
+def test_corrupt_entry_is_recompiled_and_overwritten(tmp_path):
+    formula = "x**2 + 3*y**2"
+    path = _cache_path(cache_key(formula, "symbolic"), str(tmp_path))
+    store_compiled(formula, compile_function(formula, "symbolic"), "symbolic", str(tmp_path))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"expr": "x**2+3*y**2", "functions": [{"kind": "source", "name": "_lambdifygenerated", "sou')
+    assert load_compiled(formula, "symbolic", str(tmp_path)) is None
+
+    f_np, dx_np, dy_np = load_or_compile(formula, "symbolic", str(tmp_path))
+    assert (f_np(1.0, 2.0), dx_np(1.0, 2.0), dy_np(1.0, 2.0)) == (13.0, 2.0, 12.0)
+    assert load_compiled(formula, "symbolic", str(tmp_path)) is not None
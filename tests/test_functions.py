@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from gdcore.functions import compile_hessian
+from gdcore.presets import PRESET_SPECS
+
+
+@pytest.mark.parametrize("formula", [spec["formula"] for spec in PRESET_SPECS]
+                         + ["exp(-(x**2 + y**2) / 4) * sin(x * y) + log(1 + x**2) * cos(y) ** 3"])
+def test_difference_hessian_matches_symbolic(formula):
+    X, Y = np.meshgrid(np.linspace(-3, 3, 13), np.linspace(-2.5, 2.5, 11))
+    symbolic = compile_hessian(formula, gradient_mode="symbolic")(X, Y)
+    approx = compile_hessian(formula, gradient_mode="autodiff")(X, Y)
+    for exact, part in zip(symbolic, approx):
+        assert np.allclose(part, np.broadcast_to(exact, X.shape), rtol=1e-6, atol=1e-6)
@@ -0,0 +1,40 @@
+import numpy as np
+
+from gdcore.dataset import make_synthetic
+from gdcore.loss_surface import LossSurface, logistic_error_bound
+
+
+def test_logistic_summary_is_within_documented_bound(tmp_path):
+    dataset = make_synthetic("logistic", 5000, root=str(tmp_path))
+    W, B = np.meshgrid(np.linspace(-5, 5, 21), np.linspace(-3, 3, 13))
+    exact = LossSurface(dataset, "logistic", exact=True).evaluate(W, B, grad=True)
+    approx = LossSurface(dataset, "logistic").evaluate(W, B, grad=True)
+
+    error = exact[0] - approx[0]
+    assert np.all(error >= -1e-12)                                  # 요약은 정확한 값 이하 (볼록성)
+    assert np.all(error <= logistic_error_bound(W) + 1e-12)
+    assert np.max(np.abs(error) / exact[0]) < 1e-4
+    for e, a in zip(exact[1:], approx[1:]):
+        np.testing.assert_allclose(a, e, atol=1e-5)
+
+
+def test_linear_summary_is_exact(tmp_path):
+    dataset = make_synthetic("linear", 5000, root=str(tmp_path))
+    W, B = np.meshgrid(np.linspace(-2, 5, 8), np.linspace(-3, 3, 7))
+    exact = LossSurface(dataset, "linear", exact=True).evaluate(W, B)
+    np.testing.assert_allclose(LossSurface(dataset, "linear").evaluate(W, B), exact, rtol=1e-9)
+
+
+def test_functions_share_one_gradient_pass(tmp_path, monkeypatch):
+    surface = LossSurface(make_synthetic("logistic", 2000, root=str(tmp_path)), "logistic")
+    calls = []
+    evaluate = surface.evaluate
+    monkeypatch.setattr(surface, "evaluate", lambda *a, **k: calls.append(k) or evaluate(*a, **k))
+    _, dw, db = surface.functions()
+    w, b = np.array([0.5, 1.0]), np.array([-0.2, 0.3])
+    grads = (dw(w, b), db(w, b))
+    assert len(calls) == 1
+    _, gw, gb = evaluate(w, b, grad=True)
+    np.testing.assert_allclose(grads, (gw, gb))
+    dw(w + 1.0, b)
+    assert len(calls) == 2
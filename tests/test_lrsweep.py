@@ -0,0 +1,40 @@
+import numpy as np
+
+from gdcore.functions import compile_function, compile_hessian
+from gdcore.lrsweep import best_index, rate_grid, stability_limit, sweep_learning_rates
+from gdcore.optimize import gd_trajectory
+
+VALLEY = "x**2 + 10*y**2"
+
+
+def test_sweep_matches_single_runs_and_stability_limit():
+    functions = compile_function(VALLEY)
+    rates = rate_grid(1e-3, 0.3, 40)
+    sweep = sweep_learning_rates(*functions, (2.0, 1.0), rates, 200)
+
+    limit = stability_limit(compile_hessian(VALLEY), (2.0, 1.0))
+    assert np.isclose(limit, 0.1)
+    assert not sweep["diverged"][rates < limit].any()
+    assert sweep["diverged"][rates > 1.5 * limit].all()     # 한계 바로 위는 천천히 커져 DIVERGE_LIMIT 전에 끝날 수 있음
+
+    for i in (0, 20, 30):
+        path, _, _ = gd_trajectory(*functions, (2.0, 1.0), rates[i], 200)
+        assert np.allclose([sweep["final_x"][i], sweep["final_y"][i]], path[-1])
+    assert np.all(np.isnan(sweep["final_loss"][sweep["diverged"]]))
+
+
+def test_converge_step_and_best_rate():
+    functions = compile_function(VALLEY)
+    sweep = sweep_learning_rates(*functions, (2.0, 1.0), np.array([0.01, 0.05, 0.09, 0.5]), 300)
+    assert np.isnan(sweep["converge_step"][3]) and sweep["diverged"][3]
+    converged = sweep["converge_step"][:3]
+    assert np.all(np.isfinite(converged))
+    assert best_index(sweep) == int(np.argmin(converged))
+
+    stalled = sweep_learning_rates(*functions, (2.0, 1.0), np.array([1e-5]), 5)
+    assert best_index(stalled) is None
+
+
+def test_stability_limit_none_without_upward_curvature():
+    assert stability_limit(compile_hessian("-x**2 - y**2"), (0.0, 0.0)) is None
+    assert stability_limit(compile_hessian("x + y"), (1.0, 1.0)) is None
@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from gdcore.ndim import ExpressionProblem
+
+
+def test_expression_problem_gradient():
+    problem = ExpressionProblem("x1**2 + 3*x3")
+    assert problem.n == 3
+    value, grad = problem.value_and_grad(np.array([[1.0, 2.0, 3.0]]))
+    assert np.allclose(value, [10.0]) and np.allclose(grad, [[2.0, 0.0, 3.0]])
+
+
+@pytest.mark.parametrize("formula", ["x1**2 + y", "x1 * a + x2"])
+def test_expression_problem_rejects_other_symbols(formula):
+    with pytest.raises(ValueError, match="외의 변수"):
+        ExpressionProblem(formula)
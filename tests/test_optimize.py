@@ -0,0 +1,26 @@
+import numpy as np
+
+from gdcore.functions import compile_function
+from gdcore.optimize import STOP_NAN, STOP_OVERFLOW, gd_trajectory, stop_reason
+
+HIMMELBLAU = "(x**2 + y - 11)**2 + (x + y**2 - 7)**2"
+
+
+def test_stop_reason_overflow_for_divergent_run():
+    functions = compile_function(HIMMELBLAU)
+    path, values, grads = gd_trajectory(*functions, (1.0, 1.0), 0.5, 60)
+    assert len(grads) < 60
+    assert stop_reason(*functions, path[-1], 0.5) == STOP_OVERFLOW
+
+
+def test_stop_reason_nan_outside_domain():
+    functions = compile_function("sqrt(x) + y**2")
+    with np.errstate(invalid="ignore"):
+        path, _, grads = gd_trajectory(*functions, (0.5, 1.0), 1.0, 10)
+        assert len(grads) < 10
+        assert stop_reason(*functions, path[-1], 1.0) == STOP_NAN
+
+
+def test_stop_reason_none_for_regular_point():
+    functions = compile_function(HIMMELBLAU)
+    assert stop_reason(*functions, (3.0, 2.0), 0.01) is None
@@ -0,0 +1,53 @@
+import io
+import json
+
+import numpy as np
+
+from gdcore.functions import compile_function, evaluate_surface
+from gdcore.optimize import gd_trajectory
+from gdcore.replay import MAX_FRAMES, build_replay_figure, frame_indices, replay_html, replay_npz
+
+BOWL = "x**2 + 2*y**2"
+
+
+def _run(steps):
+    functions = compile_function(BOWL)
+    surface = evaluate_surface(functions[0], (-2, 2), (-2, 2), 20)
+    return surface, gd_trajectory(*functions, (1.5, -1.0), 0.1, steps)
+
+
+def test_frame_indices_keep_ends_and_limit_count():
+    assert list(frame_indices(5)) == [0, 1, 2, 3, 4]
+    indices = frame_indices(1001)
+    assert len(indices) <= MAX_FRAMES and indices[0] == 0 and indices[-1] == 1000
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_replay_figure_frames_and_slider():
+    surface, (path, values, _) = _run(500)
+    fig = build_replay_figure(surface, path, values, min_point=(0.0, 0.0, 0.0))
+    names = [frame.name for frame in fig.frames]
+    assert len(names) == MAX_FRAMES and names[0] == "0" and names[-1] == "500"
+    assert all(frame.traces == (1, 2) for frame in fig.frames)      # 표면은 프레임에 넣지 않음
+    assert [step.label for step in fig.layout.sliders[0].steps] == names
+    last = fig.frames[-1].data[0]
+    assert len(last.x) == 501 and np.isclose(last.z[-1], values[-1])
+
+
+def test_replay_html_escapes_meta_and_logs_every_step():
+    surface, (path, values, grads) = _run(12)
+    fig = build_replay_figure(surface, path, values)
+    document = replay_html(fig, path, values, grads, {"함수식": "x<y & 1"})
+    assert "x&lt;y &amp; 1" in document and "x<y & 1" not in document
+    assert document.count("<tr><td>") == 12
+    assert "<script src=" not in document                          # plotly.js를 파일에 포함
+
+
+def test_replay_npz_round_trip():
+    surface, (path, values, grads) = _run(8)
+    meta = {"함수식": BOWL, "학습률": 0.1}
+    with np.load(io.BytesIO(replay_npz(surface, path, values, grads, None, meta))) as data:
+        assert np.array_equal(data["path"], path) and np.array_equal(data["gradients"], grads)
+        assert np.array_equal(data["Z"], surface[2])
+        assert data["min_point"].size == 0
+        assert json.loads(str(data["meta"])) == meta
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from gdcore import results
+from gdcore.functions import compile_function
+from gdcore.optimize import gd_trajectory
+
+BOWL = "x**2 + 3*y**2 + x*y"
+HIMMELBLAU = "(x**2 + y - 11)**2 + (x + y**2 - 7)**2"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(results, "_results", OrderedDict())
+
+
+def _spy(monkeypatch):
+    """계산한 스텝 수 기록"""
+    calls = []
+
+    def counted(f, dx, dy, start, learning_rate, steps):
+        calls.append(steps)
+        return gd_trajectory(f, dx, dy, start, learning_rate, steps)
+
+    monkeypatch.setitem(results.OPTIMIZERS, "gd", counted)
+    return calls
+
+
+def test_extension_matches_full_run_and_computes_only_new_steps(monkeypatch):
+    calls = _spy(monkeypatch)
+    functions = compile_function(BOWL)
+    results.get_trajectory(BOWL, functions, (2.0, -1.5), 0.05, 40)
+    path, values, grads = results.get_trajectory("x**2+3*y**2+x*y", functions, (2, -1.5), 0.05, 100)
+    assert calls == [40, 60]
+
+    full = gd_trajectory(*functions, (2.0, -1.5), 0.05, 100)
+    assert np.array_equal(path, full[0]) and np.array_equal(values, full[1]) and np.array_equal(grads, full[2])
+
+    # 더 짧은 요청은 잘라서, 계산 없이
+    short = results.get_trajectory(BOWL, functions, (2.0, -1.5), 0.05, 10)
+    assert calls == [40, 60]
+    assert np.array_equal(short[0], full[0][:11]) and len(short[2]) == 10
+    assert not short[0].flags.writeable
+
+
+def test_stopped_path_is_not_extended(monkeypatch):
+    calls = _spy(monkeypatch)
+    functions = compile_function(HIMMELBLAU)
+    _, _, grads = results.get_trajectory(HIMMELBLAU, functions, (1.0, 1.0), 0.5, 60)
+    assert len(grads) < 60
+    again = results.get_trajectory(HIMMELBLAU, functions, (1.0, 1.0), 0.5, 200)
+    assert calls == [60] and len(again[2]) == len(grads)
+
+
+def test_join_trajectories_drops_repeated_point():
+    functions = compile_function(BOWL)
+    full = gd_trajectory(*functions, (1.0, 1.0), 0.1, 30)
+    head = gd_trajectory(*functions, (1.0, 1.0), 0.1, 12)
+    tail = gd_trajectory(*functions, tuple(head[0][-1]), 0.1, 18)
+    joined = results.join_trajectories(head + (False,), tail)
+    for part, expected in zip(joined, full):
+        assert np.array_equal(part, expected)
+
+
+def test_store_keeps_longest_path_and_evicts_least_recent(monkeypatch):
+    monkeypatch.setattr(results, "MAX_ENTRIES", 2)
+    functions = compile_function(BOWL)
+    long = gd_trajectory(*functions, (1.0, 1.0), 0.1, 20)
+    short = gd_trajectory(*functions, (1.0, 1.0), 0.1, 5)
+    results.store_trajectory(BOWL, (1.0, 1.0), 0.1, 20, *long)
+    results.store_trajectory(BOWL, (1.0, 1.0), 0.1, 5, *short)
+    assert len(results.cached_prefix(BOWL, (1.0, 1.0), 0.1)[2]) == 20
+
+    results.store_trajectory(BOWL, (2.0, 1.0), 0.1, 5, *gd_trajectory(*functions, (2.0, 1.0), 0.1, 5))
+    results.cached_prefix(BOWL, (1.0, 1.0), 0.1)            # 최근 사용으로 갱신
+    results.store_trajectory(BOWL, (3.0, 1.0), 0.1, 5, *gd_trajectory(*functions, (3.0, 1.0), 0.1, 5))
+    assert results.cached_prefix(BOWL, (2.0, 1.0), 0.1) is None
+    assert results.cached_trajectory(BOWL, (1.0, 1.0), 0.1, 20) is not None
+    assert results.cached_trajectory(BOWL, (1.0, 1.0), 0.1, 21) is None
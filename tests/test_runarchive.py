@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+import numpy as np
+
+from gdcore.runarchive import SUMMARY_COLUMNS, archive_files, archive_run, get_writer, load_runs, run_row
+
+
+def _row(expr, ts, grads=True):
+    path = np.array([[1.0, 2.0], [0.5, 1.0], [0.25, 0.5]])
+    row = run_row("04_C", "s1", expr, (1, 2), 0.25, 5, path, np.array([5.0, 1.25, 0.3125]),
+                  grads=-path[:-1] if grads else None, outcome="running")
+    row["ts"] = ts
+    return row
+
+
+def test_archive_run_round_trip(tmp_path):
+    root = str(tmp_path)
+    path = np.array([[1.0, 2.0], [0.5, 1.0]])
+    assert archive_run("04_C", "s1", "x**2 + y**2", (1, 2), 0.25, 5, path, [5.0, 1.25],
+                       grads=[[2.0, 4.0]], outcome="running", root=root)
+    assert get_writer(root).flush()
+    assert not archive_run("04_C", "s1", "x**2", (1, 2), 0.25, 5, path, [5.0, 1.25], root="")
+
+    table = load_runs(columns=None, root=root)
+    row = table.to_pylist()[0]
+    assert row["expr"] == "x**2+y**2" and row["n_steps"] == 1 and row["steps"] == 5
+    assert (row["final_x"], row["final_y"], row["final_loss"]) == (0.5, 1.0, 1.25)
+    assert row["path_x"] == [1.0, 0.5] and row["grad_y"] == [4.0]
+    assert load_runs(root=root).column_names == list(SUMMARY_COLUMNS)
+
+
+def test_load_runs_filters_by_date_and_expression(tmp_path):
+    root = str(tmp_path)
+    writer = get_writer(root)
+    writer.submit(_row("x**2", datetime(2024, 3, 1, 10)))
+    writer.submit(_row("x**2 + y**2", datetime(2024, 3, 2, 10), grads=False))
+    writer.submit(_row("x**2", datetime(2024, 3, 3, 10)))
+    assert writer.flush()
+
+    assert len(archive_files(root)) == 3
+    assert len(archive_files(root, since=date(2024, 3, 2), until="2024-03-02")) == 1
+    assert load_runs(root=root, since="2024-03-02").num_rows == 2
+    assert load_runs(root=root, expr=["x ** 2"]).num_rows == 2
+    traces = load_runs(columns=["expr", "grad_x"], root=root, expr=["x**2+y**2"]).to_pylist()
+    assert traces == [{"expr": "x**2+y**2", "grad_x": None}]
+
+
+def test_load_runs_skips_broken_files(tmp_path):
+    root = str(tmp_path)
+    writer = get_writer(root)
+    writer.submit(_row("x**2", datetime(2024, 3, 1, 10)))
+    assert writer.flush()
+    (tmp_path / "date=2024-03-01" / "part-broken.arrow").write_bytes(b"not arrow")
+    assert load_runs(root=root).num_rows == 1
+    assert load_runs(root=str(tmp_path / "missing")).num_rows == 0
@@ -0,0 +1,43 @@
+import numpy as np
+
+from gdcore.stages import StageGraph, fingerprint
+
+
+def test_fingerprint_normalizes_equal_content():
+    assert fingerprint(5, [1, 2], {"b": 1, "a": 2}) == fingerprint(5.0, (1.0, 2.0), {"a": 2, "b": 1})
+    assert fingerprint(np.arange(3.0)) == fingerprint(np.arange(3.0))
+    assert fingerprint(0.1) != fingerprint(0.1 + 1e-12)
+    assert fingerprint(np.arange(3.0)) != fingerprint(np.arange(3))              # 자료형도 구분
+    assert fingerprint(np.zeros((2, 3))) != fingerprint(np.zeros((3, 2)))       # 모양도 구분
+    assert fingerprint(True) != fingerprint(1)
+
+
+def test_stage_reruns_only_when_inputs_or_dependencies_change():
+    graph = StageGraph({})
+    calls = []
+
+    def compute(name, value):
+        def run():
+            calls.append(name)
+            return value
+        return run
+
+    graph.run("surface", ("x**2", (-2, 2)), compute("surface", 1))
+    graph.run("figure", ("t",), compute("figure", 2), after=("surface",))
+    graph.run("surface", ("x**2", (-2.0, 2.0)), compute("surface", 1))
+    assert graph.run("figure", ("t",), compute("figure", 2), after=("surface",)) == 2
+    assert calls == ["surface", "figure"]
+
+    # 앞 단계가 다시 계산되면 뒤 단계 지문도 바뀜
+    graph.run("surface", ("x**2", (-3, 3)), compute("surface", 3))
+    graph.run("figure", ("t",), compute("figure", 4), after=("surface",))
+    assert calls == ["surface", "figure", "surface", "figure"]
+
+
+def test_mark_and_invalidate():
+    graph = StageGraph({})
+    graph.mark("path", ("x**2", 0.1), value="outside")
+    assert graph.run("path", ("x**2", 0.1), lambda: "recomputed") == "outside"
+    graph.invalidate("path")
+    assert graph.fingerprint_of("path") is None
+    assert graph.run("path", ("x**2", 0.1), lambda: "recomputed") == "recomputed"
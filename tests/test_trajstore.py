@@ -0,0 +1,64 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from gdcore.functions import compile_function
+from gdcore.trajstore import MAX_BASINS, UNCONVERGED, TrajectoryStore, run_sweep, store_nbytes, summarize
+
+HIMMELBLAU = "(x**2 + y - 11)**2 + (x + y**2 - 7)**2"
+HIMMELBLAU_MINIMA = [(3.0, 2.0), (-2.805118, 3.131312), (-3.779310, -3.283186), (3.584428, -1.848126)]
+
+
+def _sweep(tmp_path, resolution, steps, learning_rate):
+    functions = compile_function(HIMMELBLAU)
+    store = TrajectoryStore.create(HIMMELBLAU, (-6, 6), (-6, 6), resolution, steps, learning_rate,
+                                   tile=128, root=str(tmp_path))
+    return run_sweep(store, *functions), functions[0]
+
+
+def test_summarize_finds_himmelblau_basins(tmp_path):
+    store, f_np = _sweep(tmp_path, 128, 200, 0.01)
+    summary = summarize(store, f_np)
+    top = summary["basins"][:4]
+    assert sum(b["count"] for b in top) > 0.9 * 128 ** 2
+    for x, y in HIMMELBLAU_MINIMA:
+        assert min(np.hypot(b["x"] - x, b["y"] - y) for b in top) < 0.1
+    labels = summary["labels"]
+    assert labels.max() < len(summary["basins"]) or labels.max() == MAX_BASINS
+    assert np.array_equal(np.bincount(labels[labels >= 0].ravel(), minlength=len(summary["basins"]))[:4],
+                          [b["count"] for b in top])
+    assert summary["unconverged_count"] == 0
+
+
+def test_summarize_large_unconverged_sweep_is_fast_and_bounded(tmp_path):
+    # 학습률이 작아 20 스텝 뒤에도 최종 위치가 넓게 퍼진 경우 (수렴점이 아니라 "번짐" → 미수렴)
+    store, f_np = _sweep(tmp_path, 512, 20, 0.001)
+    started = time.perf_counter()
+    summary = summarize(store, f_np)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 3.0, f"summarize took {elapsed:.2f}s"
+    assert len(summary["basins"]) <= MAX_BASINS
+    assert summary["labels"].max() <= MAX_BASINS
+    total = sum(b["count"] for b in summary["basins"]) + summary["other_count"]
+    assert total == int((summary["labels"] >= 0).sum())
+    # 아직 움직이는 시작점끼리 이어 붙여 거대한 영역 하나를 만들지 않음
+    assert summary["unconverged_count"] == int((summary["labels"] == UNCONVERGED).sum()) > 0.99 * 512 ** 2
+    assert all(b["count"] < 0.01 * 512 ** 2 for b in summary["basins"])
+
+
+def test_create_evicts_least_recently_used_stores(tmp_path):
+    size = store_nbytes(128, 10, 128)
+    stores = [TrajectoryStore.create(HIMMELBLAU, (-6, 6), (-6, 6), 128, 10, lr, tile=128, root=str(tmp_path),
+                                     budget=2 * size) for lr in (0.01, 0.02)]
+    for age, store in zip((200, 100), stores):
+        os.utime(os.path.join(store.directory, "meta.json"), (time.time() - age,) * 2)
+    TrajectoryStore.open(stores[0].directory)   # 처음 저장소를 다시 사용 → 두 번째가 가장 오래됨
+
+    third = TrajectoryStore.create(HIMMELBLAU, (-6, 6), (-6, 6), 128, 10, 0.03, tile=128, root=str(tmp_path),
+                                   budget=2 * size)
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(s.directory) for s in (stores[0], third))
+    with pytest.raises(ValueError):
+        TrajectoryStore.create(HIMMELBLAU, (-6, 6), (-6, 6), 256, 10, 0.01, tile=128, root=str(tmp_path),
+                               budget=2 * size)
@@ -0,0 +1,66 @@
+import math
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from gdcore.urlstate import _decode, _encode, preset_for_formula
+
+LINK_SCRIPT = """
+import streamlit as st
+from gdcore.urlstate import PageLink
+
+link = PageLink("test", {"lr": "float", "xr": "range", "n": "int", "f": "str"})
+st.session_state["seen"] = (dict(link.values), link.first_run,
+                            link.get("lr", 0.1, (1e-4, 1.0)), link.get("xr", (-1.0, 1.0), (-5.0, 5.0)),
+                            link.get("n", 50, (1, 500)))
+link.update(lr=0.25, xr=(-2, 3), n=None, f="x**2")
+"""
+
+
+def test_decode_accepts_valid_values():
+    assert _decode("str", "x**2") == "x**2"
+    assert _decode("int", "42") == 42
+    assert _decode("float", "1e-3") == 1e-3
+    assert _decode("range", "-2.5,3") == (-2.5, 3.0)
+
+
+@pytest.mark.parametrize("kind, text", [
+    ("int", "1.5"), ("int", "abc"), ("float", "nan"), ("float", "inf"), ("float", ""),
+    ("range", "3,1"), ("range", "1,1"), ("range", "0,inf"), ("range", "1"), ("range", "1,2,3"),
+    ("complex", "1"),
+])
+def test_decode_rejects_invalid_values(kind, text):
+    with pytest.raises(ValueError):
+        _decode(kind, text)
+
+
+def test_encode_round_trips():
+    assert _decode("float", _encode("float", 0.1 + 0.2)) == pytest.approx(0.3, rel=1e-9)
+    assert _decode("range", _encode("range", (-math.pi, 2.0))) == pytest.approx((-math.pi, 2.0), rel=1e-9)
+    assert _decode("int", _encode("int", 7)) == 7
+    assert _decode("str", _encode("str", "sin(x)*y")) == "sin(x)*y"
+    assert _encode("float", 1e-3) == "0.001"
+    assert _encode("range", (-2, 3)) == "-2,3"
+
+
+def test_preset_for_formula_ignores_whitespace():
+    presets = {"그릇": {"f": "x**2 + y**2"}, "사용자 정의": {"f": ""}}
+    assert preset_for_formula("x**2+y**2", presets, lambda p: p["f"]) == "그릇"
+    assert preset_for_formula("x**4", presets, lambda p: p["f"]) is None
+
+
+def test_page_link_reads_query_once_clamps_and_writes_back():
+    at = AppTest.from_string(LINK_SCRIPT)
+    at.query_params.update({"lr": "7", "xr": "-9,2", "n": "abc", "f": "x**2+y**2"})
+    at.run()
+    assert not at.exception
+    values, first_run, lr, xr, n = at.session_state["seen"]
+    assert values == {"lr": 7.0, "xr": (-9.0, 2.0), "f": "x**2+y**2"}   # 잘못된 n은 무시
+    assert first_run
+    assert (lr, xr, n) == (1.0, (-5.0, 2.0), 50)                       # 범위 안으로 자르고, 없으면 기본값
+    assert dict(at.query_params) == {"lr": "0.25", "xr": "-2,3", "f": "x**2"}
+
+    # 이후 재실행은 URL을 다시 읽지 않음
+    at.run()
+    values, first_run, *_ = at.session_state["seen"]
+    assert not first_run and values["lr"] == 7.0